@@ -0,0 +1,108 @@
+"""
+Yerel Referans Oranları
+=======================
+Her algoritmanın enerjisini, aynı kampanyada ölçülen yerel referansına
+(`builtin_sorted`, `numpy_matmul` vb.) oranlar. Referans, algoritmanın
+kayıt defterindeki 'baseline' anahtarıyla belirlenir.
+
+    oran = algoritma enerjisi / referans enerjisi
+
+Oran 1'e ne kadar yakınsa yorumlanan uygulama platformun en iyisine o
+kadar yakındır.
+
+Kullanım:
+    targets = with_baselines(['merge_sort', 'strassen'])
+    ...
+    attach_baseline_ratios(results['benchmarks'])
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from algorithms import ALGORITHMS
+
+
+def baseline_of(algorithm: str) -> Optional[str]:
+    """Algoritmanın yerel referans anahtarı (yoksa None)"""
+    for algos in ALGORITHMS.values():
+        if algorithm in algos:
+            baseline = algos[algorithm].get('baseline')
+            return baseline if baseline and baseline != algorithm else None
+    return None
+
+
+def with_baselines(algorithms: List[str]) -> List[str]:
+    """Hedef listesine eksik referansları sona ekle"""
+    targets = list(algorithms)
+    for algorithm in algorithms:
+        baseline = baseline_of(algorithm)
+        if baseline and baseline not in targets and _is_registered(baseline):
+            targets.append(baseline)
+    return targets
+
+
+def _is_registered(algorithm: str) -> bool:
+    return any(algorithm in algos for algos in ALGORITHMS.values())
+
+
+def _context_key(entry: Dict) -> str:
+    """Aynı girdiyle ölçülen kayıtları eşlemek için bağlam anahtarı"""
+    context = {k: entry.get(k) for k in ('size', 'distribution', 'corpus_file',
+                                         'corpus_format', 'graph')}
+    return json.dumps(context, sort_keys=True, default=str)
+
+
+def _ratio(value: float, reference: float) -> Optional[float]:
+    return value / reference if reference else None
+
+
+def attach_baseline_ratios(benchmarks: List[Dict], energy_key: str = 'energy_joules',
+                           time_key: str = 'execution_time_ms'):
+    """
+    Runner sonuçlarına 'baseline' alanını ekle
+
+    Her kayıt, aynı bağlamdaki (boyut, dağılım, korpus, graf) referans
+    kaydıyla eşlenir; referans ölçülmemişse alan eklenmez.
+    """
+    index = {(entry['algorithm'], _context_key(entry)): entry for entry in benchmarks}
+    for entry in benchmarks:
+        baseline = baseline_of(entry['algorithm'])
+        reference = index.get((baseline, _context_key(entry))) if baseline else None
+        if reference is None:
+            continue
+        avg, ref = entry['averages'], reference['averages']
+        entry['baseline'] = {
+            'algorithm': baseline,
+            'energy_ratio': _ratio(avg[energy_key], ref[energy_key]),
+            'time_ratio': _ratio(avg[time_key], ref[time_key])
+        }
+
+
+def attach_gui_baseline_ratios(results: Dict):
+    """
+    Arayüz sonuç sözlüğüne boyut başına ve ortalama enerji oranı ekle
+
+    results: {algo_key: {'sizes': {boyut: {'avg_energy': ...}}, ...}}
+    """
+    for algo_key, info in results.items():
+        baseline = baseline_of(algo_key)
+        reference = results.get(baseline) if baseline else None
+        if reference is None:
+            continue
+        ratios = []
+        for size, cell in info['sizes'].items():
+            ref_cell = reference['sizes'].get(size)
+            if ref_cell is None:
+                continue
+            ratio = _ratio(cell['avg_energy'], ref_cell['avg_energy'])
+            cell['energy_ratio'] = ratio
+            if ratio is not None:
+                ratios.append(ratio)
+        info['baseline'] = baseline
+        info['energy_ratio'] = sum(ratios) / len(ratios) if ratios else None
+
+
+def format_baseline_ratio(entry: Dict) -> str:
+    """Özet tablolar için enerji oranı metni ('12.3x' veya '-')"""
+    ratio = (entry.get('baseline') or {}).get('energy_ratio')
+    return f"{ratio:.1f}x" if ratio is not None else '-'
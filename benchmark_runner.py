@@ -0,0 +1,177 @@
+"""
+Ortak Benchmark Yürütücüsü
+==========================
+`run_benchmark.py` (tahmini/WMI ölçüm) ve `run_real_benchmark.py` (RAPL,
+Power Gadget, LHM) betiklerinin paylaştığı yardımcılar: algoritma arama,
+metrik toplama (önbellek / örnekleme), hedef listesi, veri üzerinde
+algoritmaları ölçme döngüsü ve doğrulamanın tamamlanması.
+
+Alt sınıflar `run_algorithm_benchmark` ve `format_averages` metotlarını,
+ayrıca şu öznitelikleri sağlar: `results`, `seed`, `metrics_cache`,
+`metrics_sample`, `exact_metrics_limit`, `validator`, `include_baselines`.
+
+Kullanım:
+    class EnergyBenchmark(BenchmarkRunner):
+        def run_algorithm_benchmark(self, algorithm_name, data, runs=3): ...
+        def format_averages(self, result): ...
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
+
+from algorithms import (ALGORITHMS, AlgorithmMetrics, SampledMetrics, exceeds_size_limit,
+                        metrics_sampling)
+from baselines import with_baselines
+from data_generator import DISTRIBUTIONS
+
+# Örnekleme modunda tam sayımın da yapıldığı en büyük girdi boyutu
+DEFAULT_EXACT_METRICS_LIMIT = 10000
+
+
+def describe_algorithm(algo_info: Dict) -> Dict:
+    """Her çalıştırma kaydına yazılan algoritma bilgisi"""
+    info = {
+        'name': algo_info['name'],
+        'complexity_time': algo_info['complexity_time'],
+        'complexity_space': algo_info['complexity_space'],
+        'category': algo_info['category']
+    }
+    if 'workers' in algo_info:
+        # Paralel algoritmalarda bu makinedeki etkin süreç sayısı
+        info['workers'] = algo_info['workers']
+    return info
+
+
+class BenchmarkRunner(ABC):
+    """İki benchmark betiğinin ortak temel sınıfı"""
+
+    def find_algorithm(self, name: str) -> Dict:
+        """İsme göre algoritma bilgisini bul"""
+        for cat, algos in ALGORITHMS.items():
+            if name in algos:
+                return algos[name]
+        return None
+
+    def compute_metrics(self, algorithm_name: str, prepare, run_func, data) -> AlgorithmMetrics:
+        """Metrik sayımlarını önbellekten al ya da hesapla"""
+        if self.metrics_cache is None:
+            _, metrics = run_func(prepare(data))
+            return metrics
+        return self.metrics_cache.get_or_compute(algorithm_name, run_func, prepare, data,
+                                                 self.find_algorithm(algorithm_name))
+
+    def collect_metrics(self, algorithm_name: str, prepare, run_func, data) -> Tuple[Dict, Dict]:
+        """
+        Sonuçlara yazılacak metrikleri topla
+
+        Örnekleme kapalıysa tam sayım döner. Açıksa örneklemeli tahmin de
+        hesaplanır; boyut exact_metrics_limit altındaysa tam sayım ve göreli
+        hata da eklenir (doğruluk kontrolü için), üstündeyse tahmin kullanılır.
+        """
+        sample = self.metrics_sample
+        exact = None
+        if sample is None or len(data) <= self.exact_metrics_limit:
+            exact = asdict(self.compute_metrics(algorithm_name, prepare, run_func, data))
+        if sample is None:
+            return exact, None
+
+        with metrics_sampling(sample, seed=self.seed):
+            _, sampled = run_func(prepare(data))
+        if not isinstance(sampled, SampledMetrics):
+            # Sayaçsız algoritmalar (yerel referanslar) örneklenmez
+            return (exact if exact is not None else asdict(sampled)), None
+        sampling = sampled.estimate()
+        if exact is not None:
+            sampling['exact'] = exact
+            sampling['relative_error'] = {
+                name: (sampling['estimates'][name] - value) / value if value else 0.0
+                for name, value in exact.items()
+            }
+        return (exact if exact is not None else sampling['estimates']), sampling
+
+    @abstractmethod
+    def run_algorithm_benchmark(self, algorithm_name: str, data: Any, runs: int = 3) -> Dict:
+        """Tek algoritmayı ölç"""
+
+    @abstractmethod
+    def format_averages(self, result: Dict) -> str:
+        """Ölçüm satırının sonuç kısmı"""
+
+    def _target_algorithms(self, algorithms: List[str] = None) -> List[str]:
+        """Çalıştırılacak algoritmaları belirle"""
+        if algorithms:
+            # Yorumlanan algoritmaların yerel referansları da ölçülür
+            return with_baselines(algorithms) if self.include_baselines else algorithms
+
+        # Hepsi
+        target_algos = []
+        for cat in ALGORITHMS.values():
+            target_algos.extend(cat.keys())
+        return target_algos
+
+    def _benchmark_targets(self, target_algos: List[str], test_data: Any, size: int,
+                           runs: int, extra: Dict = None):
+        """Verilen veri üzerinde hedef algoritmaları ölç ve sonuçlara ekle"""
+        for algo_name in target_algos:
+            algo_info = self.find_algorithm(algo_name)
+            if not algo_info:
+                print(f"    ⚠️ Algoritma bulunamadı: {algo_name}")
+                continue
+            if exceeds_size_limit(algo_info, size):
+                print(f"    ⏭️  {algo_info['name']}: boyut {size} > {algo_info['max_size']}, atlandı")
+                continue
+
+            print(f"    ⏳ {algo_info['name']}...", end=" ", flush=True)
+
+            try:
+                result = self.run_algorithm_benchmark(algo_name, test_data, runs)
+
+                if 'error' in result:
+                    print(f"❌ Hata: {result['error']}")
+                    self._record_failure(algo_name, size, extra, result['error'])
+                    continue
+
+                digests = result.pop('output_digests', None)
+                entry = {
+                    'type': algo_info['category'],
+                    'size': size,
+                    **(extra or {}),
+                    **result
+                }
+                self.results['benchmarks'].append(entry)
+                if digests is not None:
+                    # Referans karşılaştırması ölçüm dışında (satır içi veya arka planda)
+                    self.validator.submit(entry, algo_name, test_data, digests)
+
+                print(self.format_averages(result))
+
+            except Exception as e:
+                print(f"❌ Hata: {str(e)}")
+                self._record_failure(algo_name, size, extra, str(e))
+
+    def _record_failure(self, algo_name: str, size: int, extra: Dict, error: str):
+        """Başarısız ölçümü sonuçlara yaz (durum matrisi eksik hücreyi bildirir)"""
+        self.results.setdefault('failures', []).append({
+            'algorithm': algo_name,
+            'size': size,
+            **(extra or {}),
+            'error': error
+        })
+
+    def _distribution_tag(self) -> str:
+        """Dosya adı için dağılım etiketi (yalnızca 'random' ise boş)"""
+        distributions = self.results['meta'].get('distributions', ['random'])
+        if distributions == ['random']:
+            return ''
+        if len(distributions) == len(DISTRIBUTIONS):
+            return '_all'
+        return '_' + '-'.join(distributions)
+
+    def finish_validation(self):
+        """Bekleyen doğrulamaları tamamla ve geçersiz sonuçları bildir"""
+        self.validator.finish()
+        for entry in self.results['benchmarks']:
+            if entry.get('valid') is False:
+                print(f"❌ GEÇERSİZ ÇIKTI: {entry['algorithm']} (boyut {entry['size']}, "
+                      f"çalıştırma {entry['validation']['mismatched_runs']})")
@@ -0,0 +1,138 @@
+"""
+Gerçek Dosya Korpusu
+====================
+Yerel dosyaları mmap ile belleğe eşler ve algoritmalara kopyalamadan
+byte veya tam sayı görünümü (memoryview) olarak sunar.
+
+Dosya içeriği belleğe okunmaz; işletim sistemi sayfaları ihtiyaç
+oldukça getirir. Böylece gigabaytlık dosyalar sabit bellek kullanımıyla
+benchmark girdisi olarak kullanılabilir.
+
+Kullanım:
+    from corpus import iter_corpus
+
+    for corpus_file in iter_corpus('data/'):
+        with corpus_file:
+            view = corpus_file.view('int32', limit=100000)
+            result, metrics = merge_sort(view)
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+
+# Görünüm adı -> memoryview format kodu (native byte sırası)
+VIEW_FORMATS = {
+    'bytes': 'B',
+    'int16': 'h',
+    'int32': 'i',
+    'int64': 'q',
+}
+
+
+class CorpusFile:
+    """mmap ile açılan tek bir korpus dosyası"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.size_bytes = self.path.stat().st_size
+        self._file = None
+        self._mmap = None
+
+    def __enter__(self) -> 'CorpusFile':
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self) -> 'CorpusFile':
+        """Dosyayı salt okunur olarak belleğe eşle"""
+        if self._mmap is None:
+            self._file = open(self.path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def close(self):
+        """mmap'i kapat (dışarıda canlı görünüm varsa GC'ye bırakılır)"""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Hâlâ kullanılan memoryview var; referans bitince kapanır
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def element_count(self, view_format: str = 'bytes') -> int:
+        """Verilen görünüm formatında dosyadaki eleman sayısı"""
+        return self.size_bytes // struct.calcsize(VIEW_FORMATS[view_format])
+
+    def view(self, view_format: str = 'bytes', limit: Optional[int] = None) -> memoryview:
+        """
+        Dosyanın kopyasız görünümünü döndür
+
+        Args:
+            view_format: 'bytes', 'int16', 'int32' veya 'int64'
+            limit: En fazla bu kadar eleman (None = tüm dosya)
+        """
+        if view_format not in VIEW_FORMATS:
+            raise ValueError(f"Bilinmeyen görünüm formatı: {view_format}")
+
+        self.open()
+        code = VIEW_FORMATS[view_format]
+        mv = memoryview(self._mmap)
+
+        if code != 'B':
+            # Tam sayı görünümü için artık byte'ları kırp
+            itemsize = struct.calcsize(code)
+            mv = mv[:len(mv) - len(mv) % itemsize].cast(code)
+
+        if limit is not None and limit < len(mv):
+            mv = mv[:limit]
+        return mv
+
+
+def iter_corpus(path: str, pattern: str = '*') -> Iterator[CorpusFile]:
+    """
+    Korpus yolundaki dosyaları sırayla döndür
+
+    Tek dosya verilirse yalnızca o dosya, dizin verilirse altındaki tüm
+    (boş ve gizli olmayan) dosyalar isim sırasıyla döner.
+    """
+    root = Path(path)
+    if root.is_file():
+        candidates: List[Path] = [root]
+    elif root.is_dir():
+        candidates = sorted(
+            p for p in root.rglob(pattern)
+            if p.is_file() and not any(part.startswith('.') for part in p.relative_to(root).parts)
+        )
+    else:
+        raise FileNotFoundError(f"Korpus yolu bulunamadı: {path}")
+
+    for p in candidates:
+        if p.stat().st_size == 0:
+            # Boş dosyalar mmap ile eşlenemez
+            continue
+        yield CorpusFile(p)
+
+
+def corpus_prefix_sizes(corpus_file: CorpusFile, sizes: List[int],
+                        view_format: str = 'bytes') -> List[int]:
+    """
+    Benchmark boyutlarını dosya uzunluğuna göre kırp
+
+    0 veya dosyadan büyük boyutlar tüm dosyayı ifade eder;
+    tekrar eden boyutlar atılır.
+    """
+    total = corpus_file.element_count(view_format)
+    result = []
+    for size in sizes:
+        n = total if size <= 0 else min(size, total)
+        if n > 0 and n not in result:
+            result.append(n)
+    return result
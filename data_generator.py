@@ -0,0 +1,362 @@
+"""
+Test Verisi Üretici
+===================
+Tüm benchmark betiklerinin ve arayüzün ortak kullandığı, tohumlu (seed)
+ve önbellekli test verisi modülü.
+
+- Üretim NumPy ile vektörel yapılır (NumPy yoksa `random.Random` ile).
+- Girdi şekli `DISTRIBUTIONS` kataloğundan seçilir (rastgele, sıralı,
+  ters, neredeyse sıralı, az benzersiz, Zipf, org borusu).
+- Her (boyut, dağılım, tohum) veri seti `.npy` dosyası olarak saklanır
+  ve sonraki kampanyalarda mmap ile yeniden açılır.
+- Algoritmalara kopyasız, salt okunur bir `memoryview` ('q' formatı)
+  verilir; liste gibi indekslenir, dilimlenir ve gezilir.
+
+Kullanım:
+    from data_generator import get_test_data
+
+    data = get_test_data(100000, distribution='random', seed=42)
+    result, metrics = merge_sort(data)
+"""
+
+import ast
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+DEFAULT_SEED = 42
+DEFAULT_CACHE_DIR = Path(__file__).parent / 'data_cache'
+
+# .npy biçimi sabitleri (v1.0, little-endian int64)
+NPY_MAGIC = b'\x93NUMPY'
+NPY_DESCR = '<i8'
+
+
+# ========================================
+# DAĞILIM ÜRETİCİLERİ
+# ========================================
+# Her dağılımın bir NumPy (vektörel) ve bir saf Python üreticisi vardır.
+# İkisi de aynı tohumla kendi içinde deterministiktir.
+
+def _random_np(size: int, rng) -> 'np.ndarray':
+    return rng.integers(1, size * 10 + 1, size=size, dtype=np.int64)
+
+
+def _random_py(size: int, rnd: random.Random) -> array:
+    high = size * 10
+    return array('q', [rnd.randint(1, high) for _ in range(size)])
+
+
+def _sorted_np(size: int, rng) -> 'np.ndarray':
+    return np.arange(size, dtype=np.int64)
+
+
+def _sorted_py(size: int, rnd: random.Random) -> array:
+    return array('q', range(size))
+
+
+def _reversed_np(size: int, rng) -> 'np.ndarray':
+    return np.arange(size, 0, -1, dtype=np.int64)
+
+
+def _reversed_py(size: int, rnd: random.Random) -> array:
+    return array('q', range(size, 0, -1))
+
+
+def _swap_count(size: int) -> int:
+    # Neredeyse sıralı: elemanların ~%1'i yer değiştirir
+    return max(1, size // 100) if size > 1 else 0
+
+
+def _nearly_sorted_np(size: int, rng) -> 'np.ndarray':
+    values = np.arange(size, dtype=np.int64)
+    pairs = rng.integers(0, max(size, 1), size=(_swap_count(size), 2))
+    # Takaslar sırayla uygulanır: çakışan çiftlerde toplu (fancy-index)
+    # atama permütasyonu bozar; n/100 takas için döngü maliyeti önemsizdir
+    for i, j in pairs.tolist():
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+def _nearly_sorted_py(size: int, rnd: random.Random) -> array:
+    values = array('q', range(size))
+    for _ in range(_swap_count(size)):
+        i, j = rnd.randrange(size), rnd.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+FEW_UNIQUE_COUNT = 10
+
+
+def _few_unique_np(size: int, rng) -> 'np.ndarray':
+    return rng.integers(1, FEW_UNIQUE_COUNT + 1, size=size, dtype=np.int64)
+
+
+def _few_unique_py(size: int, rnd: random.Random) -> array:
+    return array('q', [rnd.randint(1, FEW_UNIQUE_COUNT) for _ in range(size)])
+
+
+ZIPF_EXPONENT = 1.5
+
+
+def _zipf_np(size: int, rng) -> 'np.ndarray':
+    values = rng.zipf(ZIPF_EXPONENT, size=size)
+    return np.minimum(values, size * 10).astype(np.int64)
+
+
+def _zipf_py(size: int, rnd: random.Random) -> array:
+    # Zipf kuyruğu Pareto(s-1) ile yaklaşık üretilir
+    high = max(size * 10, 1)
+    return array('q', [min(int(rnd.paretovariate(ZIPF_EXPONENT - 1)), high) for _ in range(size)])
+
+
+def _organ_pipe_np(size: int, rng) -> 'np.ndarray':
+    idx = np.arange(size, dtype=np.int64)
+    return np.minimum(idx, size - 1 - idx)
+
+
+def _organ_pipe_py(size: int, rnd: random.Random) -> array:
+    return array('q', (min(i, size - 1 - i) for i in range(size)))
+
+
+# Dağılım kataloğu: runner'lar, PHP köprüsü ve arayüz buradan seçer.
+# 'case' alanı sıralama algoritmaları için tipik durumu belirtir.
+DISTRIBUTIONS: Dict[str, Dict] = {
+    'random': {
+        'name': 'Rastgele',
+        'description': '1..10n aralığında düzgün rastgele',
+        'numpy': _random_np,
+        'python': _random_py,
+    },
+    'sorted': {
+        'name': 'Sirali',
+        'description': '0..n-1 artan',
+        'numpy': _sorted_np,
+        'python': _sorted_py,
+    },
+    'reversed': {
+        'name': 'Ters Sirali',
+        'description': 'n..1 azalan',
+        'numpy': _reversed_np,
+        'python': _reversed_py,
+    },
+    'nearly_sorted': {
+        'name': 'Neredeyse Sirali',
+        'description': 'Sıralı, elemanların ~%1\'i rastgele yer değiştirmiş',
+        'numpy': _nearly_sorted_np,
+        'python': _nearly_sorted_py,
+    },
+    'few_unique': {
+        'name': 'Az Benzersiz',
+        'description': f'Yalnızca {FEW_UNIQUE_COUNT} farklı değer',
+        'numpy': _few_unique_np,
+        'python': _few_unique_py,
+    },
+    'zipf': {
+        'name': 'Zipf',
+        'description': f'Zipf (s={ZIPF_EXPONENT}), 10n ile kırpılmış',
+        'numpy': _zipf_np,
+        'python': _zipf_py,
+    },
+    'organ_pipe': {
+        'name': 'Org Borusu',
+        'description': '0,1,..,n/2,..,1,0 (önce artan sonra azalan)',
+        'numpy': _organ_pipe_np,
+        'python': _organ_pipe_py,
+    },
+}
+
+# Eski isimler (run_real_benchmark 'reverse' kullanıyordu)
+DISTRIBUTION_ALIASES = {
+    'reverse': 'reversed',
+}
+
+
+def resolve_distribution(distribution: str) -> str:
+    """Dağılım adını doğrula ve kanonik adını döndür"""
+    name = DISTRIBUTION_ALIASES.get(distribution, distribution)
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f"Bilinmeyen dağılım: {distribution} "
+                         f"(seçenekler: {', '.join(DISTRIBUTIONS)})")
+    return name
+
+
+def parse_distributions(text: str) -> List[str]:
+    """Virgülle ayrılmış dağılım listesini çöz ('all' = tüm katalog)"""
+    if text.strip() == 'all':
+        return list(DISTRIBUTIONS.keys())
+    return [resolve_distribution(d.strip()) for d in text.split(',') if d.strip()]
+
+
+def build_case_matrix(benchmarks: List[Dict],
+                      energy_key: str = 'energy_joules',
+                      distributions: Optional[List[str]] = None) -> Dict:
+    """
+    Dağılım bazlı sonuçlardan en iyi/ortalama/en kötü durum matrisi üret
+
+    Girdi: 'algorithm', 'size', 'distribution' ve (başarılıysa) 'averages'
+    alanları olan benchmark kayıtları. Çıktı: {algoritma: {boyut: {...}}}
+
+    'averages' alanı olmayan (başarısız) kayıtlar ve `distributions`
+    listesinde olup sonucu bulunmayan dağılımlar hücrenin 'failed'
+    listesine yazılır; en iyi/en kötü yalnızca ölçülenler arasından seçilir,
+    bu yüzden 'failed' boş değilse en kötü durum eksik olabilir.
+    """
+    by_dist: Dict[str, Dict[int, Dict[str, float]]] = {}
+    for b in benchmarks:
+        if 'distribution' not in b:
+            continue
+        cell = by_dist.setdefault(b['algorithm'], {}).setdefault(b['size'], {})
+        if 'averages' in b:
+            cell[b['distribution']] = b['averages'][energy_key]
+        else:
+            cell.setdefault(b['distribution'], None)
+
+    matrix = {}
+    for algo, sizes in by_dist.items():
+        matrix[algo] = {}
+        for size, cell in sizes.items():
+            energies = {d: e for d, e in cell.items() if e is not None}
+            expected = list(distributions) if distributions else list(cell)
+            failed = [d for d in expected if d not in energies]
+            failed += [d for d in cell if d not in energies and d not in failed]
+            if not energies:
+                matrix[algo][size] = {'energy_by_distribution': {}, 'best': None,
+                                      'average': None, 'worst': None, 'failed': failed}
+                continue
+            best = min(energies, key=energies.get)
+            worst = max(energies, key=energies.get)
+            matrix[algo][size] = {
+                'energy_by_distribution': energies,
+                'best': {'distribution': best, energy_key: energies[best]},
+                'average': {energy_key: sum(energies.values()) / len(energies)},
+                'worst': {'distribution': worst, energy_key: energies[worst]},
+                'failed': failed,
+            }
+    return matrix
+
+
+# ========================================
+# .NPY OKUMA / YAZMA
+# ========================================
+
+def save_npy(path: Path, values):
+    """1 boyutlu int64 diziyi .npy (v1.0) olarak atomik yaz"""
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (NPY_DESCR, len(values))
+    # Başlık + sihirli baytlar 64'ün katına hizalanır ve '\n' ile biter
+    prefix_len = len(NPY_MAGIC) + 2 + 2
+    padding = 64 - (prefix_len + len(header) + 1) % 64
+    header = header + ' ' * (padding % 64) + '\n'
+
+    if sys.byteorder != 'little':
+        values = array('q', memoryview(values).cast('B').tobytes())
+        values.byteswap()
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(NPY_MAGIC + bytes([1, 0]))
+        f.write(struct.pack('<H', len(header)))
+        f.write(header.encode('latin1'))
+        f.write(memoryview(values).cast('B'))
+    os.replace(tmp_path, path)
+
+
+def load_npy(path: Path) -> memoryview:
+    """.npy dosyasını mmap ile aç ve kopyasız 'q' görünümü döndür"""
+    with open(path, 'rb') as f:
+        if f.read(len(NPY_MAGIC)) != NPY_MAGIC:
+            raise ValueError(f"Geçersiz .npy dosyası: {path}")
+        major = f.read(2)[0]
+        if major == 1:
+            header_len = struct.unpack('<H', f.read(2))[0]
+        else:
+            header_len = struct.unpack('<I', f.read(4))[0]
+        header = ast.literal_eval(f.read(header_len).decode('latin1'))
+        offset = f.tell()
+
+        if header['descr'] != NPY_DESCR or header['fortran_order'] or len(header['shape']) != 1:
+            raise ValueError(f"Desteklenmeyen .npy biçimi: {header}")
+        count = header['shape'][0]
+
+        if count == 0:
+            return memoryview(array('q'))
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mm)[offset:offset + count * 8]
+    if sys.byteorder != 'little':
+        # Big-endian makinede mmap görünümü kullanılamaz; tek kopya al
+        values = array('q', view.tobytes())
+        values.byteswap()
+        return memoryview(values)
+    return view.cast('q')
+
+
+# ========================================
+# ÜRETİCİ
+# ========================================
+
+class TestDataGenerator:
+    """Tohumlu, önbellekli test verisi üreticisi"""
+
+    def __init__(self, cache_dir: Optional[str] = None, use_cache: bool = True):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.use_cache = use_cache
+        self.backend = 'numpy' if HAS_NUMPY else 'python'
+
+    def cache_path(self, size: int, distribution: str, seed: int) -> Path:
+        """Veri setinin önbellek dosya yolu (üretici türü dosya adındadır)"""
+        tag = 'np' if self.backend == 'numpy' else 'py'
+        return self.cache_dir / f"{distribution}_n{size}_s{seed}_{tag}.npy"
+
+    def generate(self, size: int, distribution: str = 'random',
+                 seed: int = DEFAULT_SEED):
+        """Veriyi önbelleğe bakmadan üret (NumPy dizisi veya array('q'))"""
+        dist = DISTRIBUTIONS[resolve_distribution(distribution)]
+
+        if self.backend == 'numpy':
+            rng = np.random.default_rng(seed)
+            return np.ascontiguousarray(dist['numpy'](size, rng), dtype=np.int64)
+        return dist['python'](size, random.Random(seed))
+
+    def get(self, size: int, distribution: str = 'random',
+            seed: int = DEFAULT_SEED) -> memoryview:
+        """
+        Veri setini döndür (salt okunur, kopyasız memoryview)
+
+        Önbellekte varsa mmap ile açılır; yoksa üretilir, kaydedilir ve
+        kaydedilen dosya açılır.
+        """
+        if not self.use_cache:
+            return memoryview(self.generate(size, distribution, seed)).cast('B').cast('q')
+
+        distribution = resolve_distribution(distribution)
+        path = self.cache_path(size, distribution, seed)
+        if not path.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            save_npy(path, self.generate(size, distribution, seed))
+        return load_npy(path)
+
+
+_default_generator: Optional[TestDataGenerator] = None
+
+
+def get_test_data(size: int, distribution: str = 'random',
+                  seed: int = DEFAULT_SEED) -> memoryview:
+    """Varsayılan üretici ile veri seti al (modül düzeyi kısayol)"""
+    global _default_generator
+    if _default_generator is None:
+        _default_generator = TestDataGenerator()
+    return _default_generator.get(size, distribution, seed)
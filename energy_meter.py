@@ -8,6 +8,14 @@ Desteklenen Yöntemler:
 2. WMI ile CPU yükü tabanlı tahmin
 3. Geliştirilmiş matematiksel model
 
+Linux'ta isteğe bağlı olarak perf_event donanım sayaçları (cycles,
+instructions, LLC miss...) ölçülen çağrının çevresinde okunur ve hem
+sonuca hem de matematiksel modele aktarılır (bkz. perf_counters.py).
+Her ölçümde CPU süresi, bağlam değişimi ve sayfa hatası farkları da
+kaydedilir (bkz. resource_usage.py). Bellek ölçüm yöntemi seçilebilir;
+tracemalloc'un süreyi şişirmemesi için ölçülen çalıştırma dışında da
+yapılabilir (bkz. memory_probe.py).
+
 Kullanım:
     from energy_meter import EnergyMeter
     
@@ -24,9 +32,13 @@ import csv
 import ctypes
 from datetime import datetime
 from typing import Callable, Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 
+from perf_counters import PerfCounters
+from resource_usage import ResourceTracker
+from memory_probe import MemoryProbe
+
 
 @dataclass
 class EnergyResult:
@@ -42,6 +54,10 @@ class EnergyResult:
     timestamp: str
     success: bool
     error_message: str = ""
+    hardware_counters: Dict = field(default_factory=dict)
+    resource_usage: Dict = field(default_factory=dict)
+    measurement_overhead_ms: float = 0.0  # measure() süresi - algoritma penceresi
+    memory_method: str = 'inline'         # bkz. memory_probe.MEMORY_METHODS
     
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -180,10 +196,11 @@ class WMIEnergyEstimator:
     
     def get_cpu_usage(self) -> float:
         """Anlık CPU kullanımını al"""
-        # Önce psutil dene (daha güvenilir)
+        # Önce psutil dene (daha güvenilir); interval=None beklemeden
+        # önceki çağrıdan bu yana geçen süredeki kullanımı döndürür
         try:
             import psutil
-            return psutil.cpu_percent(interval=0.1)
+            return psutil.cpu_percent(interval=None)
         except ImportError:
             pass
         
@@ -225,6 +242,11 @@ class EnhancedEnergyModel:
     ENERGY_PER_MEMORY_ACCESS = 5e-10  # ~0.5 nanojoule
     ENERGY_PER_ITERATION = 1e-9       # ~1 nanojoule
     
+    # Donanım sayaçları varsa işlem sayıları yerine kullanılır
+    ENERGY_PER_INSTRUCTION = 2e-10    # ~0.2 nanojoule
+    ENERGY_PER_CACHE_MISS = 1.5e-8    # ~15 nanojoule (DRAM erişimi)
+    ENERGY_PER_BRANCH_MISS = 3e-9     # ~3 nanojoule (boru hattı boşaltma)
+    
     # CPU güç sabitleri
     CPU_IDLE_POWER = 5.0    # Watt (boşta)
     CPU_ACTIVE_POWER = 35.0  # Watt (aktif)
@@ -240,7 +262,10 @@ class EnhancedEnergyModel:
                 'swaps': int,
                 'iterations': int,
                 'memory_mb': float,
-                'time_ms': float
+                'time_ms': float,
+                'instructions': int,   # (opsiyonel) perf sayaçları
+                'cache_misses': int,
+                'branch_misses': int
             }
         """
         # İşlem bazlı enerji
@@ -249,7 +274,23 @@ class EnhancedEnergyModel:
         E_iterations = metrics.get('iterations', 0) * self.ENERGY_PER_ITERATION
         E_memory = metrics.get('memory_accesses', 0) * self.ENERGY_PER_MEMORY_ACCESS
         
-        E_operations = E_comparisons + E_swaps + E_iterations + E_memory
+        breakdown = {
+            'comparisons': E_comparisons,
+            'swaps': E_swaps,
+            'iterations': E_iterations,
+            'memory_accesses': E_memory
+        }
+        
+        if metrics.get('instructions') is not None:
+            # Ölçülen makine komutları sayım tahminlerinin yerini alır
+            # (aynı işi iki kez saymamak için)
+            breakdown = {
+                'instructions': metrics['instructions'] * self.ENERGY_PER_INSTRUCTION,
+                'cache_misses': (metrics.get('cache_misses') or 0) * self.ENERGY_PER_CACHE_MISS,
+                'branch_misses': (metrics.get('branch_misses') or 0) * self.ENERGY_PER_BRANCH_MISS
+            }
+        
+        E_operations = sum(breakdown.values())
         
         # Zaman bazlı enerji (CPU aktif güç tüketimi)
         time_seconds = metrics.get('time_ms', 0) / 1000
@@ -271,12 +312,7 @@ class EnhancedEnergyModel:
             'energy_time_based': E_time,
             'energy_memory': E_ram,
             'avg_power_watts': avg_power,
-            'breakdown': {
-                'comparisons': E_comparisons,
-                'swaps': E_swaps,
-                'iterations': E_iterations,
-                'memory_accesses': E_memory
-            }
+            'breakdown': breakdown
         }
 
 
@@ -286,15 +322,23 @@ class EnergyMeter:
     Otomatik olarak en iyi yöntemi seçer
     """
     
-    def __init__(self, prefer_method: str = 'auto'):
+    def __init__(self, prefer_method: str = 'auto', hardware_counters: bool = False,
+                 memory_method: str = 'inline'):
         """
         Args:
             prefer_method: 'auto', 'power_gadget', 'wmi', 'estimation'
+            hardware_counters: Ölçülen çağrı çevresinde perf sayaçlarını oku
+            memory_method: 'inline', 'rss', 'tracemalloc' veya 'none'
+                           ('tracemalloc' ayrı geçiştir; measure() belleği
+                           ölçmez, çağıran measure_memory ile ekler)
         """
         self.intel_gadget = IntelPowerGadget()
         self.wmi_estimator = WMIEnergyEstimator()
         self.model = EnhancedEnergyModel()
         self.prefer_method = prefer_method
+        self.perf = PerfCounters() if hardware_counters else None
+        self.resources = ResourceTracker()
+        self.memory = MemoryProbe(memory_method)
         
         # Hangi yöntemlerin kullanılabilir olduğunu belirle
         self.available_methods = self._check_available_methods()
@@ -335,34 +379,56 @@ class EnergyMeter:
             data: Algoritmaya verilecek veri
             metrics: Ek metrikler (karşılaştırma, takas sayısı vb.)
         """
-        import tracemalloc
-        
+        measure_start = time.perf_counter()
         method = self.get_best_method()
         timestamp = datetime.now().isoformat()
         data_size = len(data) if hasattr(data, '__len__') else 0
         
-        # Bellek izlemeyi başlat
-        tracemalloc.start()
-        
-        # CPU kullanımını ölçmeye başla
-        cpu_start = self._get_cpu_percent()
+        counters = {}
+        usage = {}
+        perf = self.perf if self.perf is not None and self.perf.is_available() else None
+        
+        # Sayaç ve kaynak penceresi yalnızca algoritma çağrısını kapsar;
+        # CPU kullanımı da bu penceredeki CPU süresi farklarından hesaplanır
+        memory_window = self.memory.window()
+        
+        # Süre (ve ondan hesaplanan enerji) yalnızca çağrının kendisidir;
+        # anlık görüntü okumaları ve perf ioctl'leri bu pencerenin dışında kalır
+        window = {}
+        
+        def call(*args):
+            start = time.perf_counter()
+            value = func(*args)
+            window['seconds'] = time.perf_counter() - start
+            return value
+        
+        def run(*args):
+            with memory_window, self.resources:
+                if perf is not None:
+                    with perf:
+                        value = call(*args)
+                else:
+                    value = call(*args)
+            usage.update(self.resources.result.to_dict())
+            if perf is not None:
+                counters.update(perf.result.to_dict())
+            return value
         
         try:
             if method == 'power_gadget':
-                result = self._measure_with_power_gadget(func, data)
+                result = self._measure_with_power_gadget(run, data)
+                if 'seconds' in window:
+                    result['execution_time_ms'] = window['seconds'] * 1000
             elif method == 'wmi':
-                result = self._measure_with_wmi(func, data)
+                result = self._measure_with_wmi(run, data, usage, window)
             else:
-                result = self._measure_with_estimation(func, data, metrics)
+                result = self._measure_with_estimation(run, data, metrics, counters, window)
             
-            # Bellek kullanımını al
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            memory_mb = peak / (1024 * 1024)
+            memory_mb = memory_window.peak_mb or 0.0
             
-            # CPU kullanımını hesapla
-            cpu_end = self._get_cpu_percent()
-            cpu_percent = (cpu_start + cpu_end) / 2
+            # Algoritma penceresi dışında kalan süre (izleme, yöntem hazırlığı)
+            window_ms = result.get('execution_time_ms', 0)
+            overhead_ms = (time.perf_counter() - measure_start) * 1000 - window_ms
             
             return EnergyResult(
                 algorithm=algorithm_name,
@@ -370,16 +436,19 @@ class EnergyMeter:
                 execution_time_ms=result.get('execution_time_ms', 0),
                 energy_joules=result.get('energy_joules', 0),
                 power_watts=result.get('power_watts', 0),
-                cpu_percent=cpu_percent,
+                cpu_percent=usage.get('cpu_percent') or 0.0,
                 memory_mb=memory_mb,
                 source=method,
                 timestamp=timestamp,
                 success=result.get('success', True),
-                error_message=result.get('error', '')
+                error_message=result.get('error', ''),
+                hardware_counters=counters,
+                resource_usage=usage,
+                measurement_overhead_ms=overhead_ms,
+                memory_method=self.memory.method
             )
             
         except Exception as e:
-            tracemalloc.stop()
             return EnergyResult(
                 algorithm=algorithm_name,
                 data_size=data_size,
@@ -391,36 +460,31 @@ class EnergyMeter:
                 source=method,
                 timestamp=timestamp,
                 success=False,
-                error_message=str(e)
+                error_message=str(e),
+                memory_method=self.memory.method
             )
     
-    def _get_cpu_percent(self) -> float:
-        """CPU kullanım yüzdesini al"""
-        try:
-            import psutil
-            return psutil.cpu_percent(interval=0.1)
-        except ImportError:
-            return self.wmi_estimator.get_cpu_usage()
+    def measure_memory(self, func: Callable, data: Any) -> Optional[float]:
+        """
+        Ayrı bellek geçişi (memory_method='tracemalloc')
+        
+        Ölçülen çalıştırmalardan sonra, taze bir girdi kopyasıyla çağrılır;
+        diğer yöntemlerde None döner.
+        """
+        return self.memory.measure_pass(func, data)
     
     def _measure_with_power_gadget(self, func: Callable, data: Any) -> Dict:
         """Intel Power Gadget ile ölç"""
         return self.intel_gadget.measure(func, data)
     
-    def _measure_with_wmi(self, func: Callable, data: Any) -> Dict:
-        """WMI ile CPU yükü tabanlı tahmin"""
-        # Başlangıç CPU yükü
-        cpu_before = self.wmi_estimator.get_cpu_usage()
-        
-        # Fonksiyonu çalıştır
-        start_time = time.perf_counter()
+    def _measure_with_wmi(self, func: Callable, data: Any, usage: Dict,
+                          window: Dict) -> Dict:
+        """CPU yükü tabanlı tahmin (yük, ölçüm penceresinin CPU süresi farkından)"""
+        # Fonksiyonu çalıştır; süre çağrının kendi penceresinden alınır
         result = func(data)
-        end_time = time.perf_counter()
-        
-        # Bitiş CPU yükü
-        cpu_after = self.wmi_estimator.get_cpu_usage()
         
-        execution_time = end_time - start_time
-        avg_cpu = (cpu_before + cpu_after) / 2
+        execution_time = window['seconds']
+        avg_cpu = usage.get('cpu_percent') or 0.0
         
         # Güç ve enerji tahmini
         power = self.wmi_estimator.estimate_power(avg_cpu)
@@ -435,19 +499,25 @@ class EnergyMeter:
         }
     
     def _measure_with_estimation(self, func: Callable, data: Any, 
-                                  metrics: Optional[Dict] = None) -> Dict:
+                                  metrics: Optional[Dict] = None,
+                                  counters: Optional[Dict] = None,
+                                  window: Optional[Dict] = None) -> Dict:
         """Geliştirilmiş model ile tahmin"""
-        # Fonksiyonu çalıştır
+        # Fonksiyonu çalıştır; pencere verilmişse süre çağrının kendisinden
         start_time = time.perf_counter()
         result = func(data)
         end_time = time.perf_counter()
         
-        execution_time_ms = (end_time - start_time) * 1000
+        if window and 'seconds' in window:
+            execution_time_ms = window['seconds'] * 1000
+        else:
+            execution_time_ms = (end_time - start_time) * 1000
         
-        # Metrikler verilmişse model ile hesapla
-        if metrics:
-            metrics['time_ms'] = execution_time_ms
-            estimation = self.model.estimate(metrics)
+        # Metrikler veya donanım sayaçları verilmişse model ile hesapla
+        if metrics or (counters and counters.get('instructions') is not None):
+            model_input = {**(metrics or {}), **(counters or {}),
+                           'time_ms': execution_time_ms}
+            estimation = self.model.estimate(model_input)
             
             return {
                 'success': True,
@@ -0,0 +1,328 @@
+"""
+Graf İş Yükü Üreticileri
+========================
+Graf algoritmaları (Dijkstra, Bellman-Ford, Prim, Floyd-Warshall) için
+yoğunluğu kontrol edilebilen, tohumlu graf üreticileri.
+
+Aileler:
+    gnp         Erdős–Rényi G(n,p) / G(n,m): yoğunluk (p) veya kenar sayısı (E)
+    grid        2B ızgara (yaklaşık sqrt(V) x sqrt(V))
+    scale_free  Barabási–Albert (her yeni düğüm m kenarla bağlanır)
+    complete    Tam graf K_V
+
+Graflar yönsüz ve 1..100 tam sayı ağırlıklıdır; CSR (indptr, indices,
+weights) dizileri olarak `.npy` dosyalarına kaydedilir ve tekrar
+çalıştırmalarda mmap ile açılır.
+
+Kullanım:
+    from graph_workloads import get_graph
+
+    graph = get_graph('gnp', 1000, density=0.01, seed=42)
+    dist, metrics = dijkstra(graph)
+"""
+
+import math
+import random
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from data_generator import DEFAULT_CACHE_DIR, DEFAULT_SEED, HAS_NUMPY, save_npy, load_npy
+
+if HAS_NUMPY:
+    import numpy as np
+
+
+MIN_WEIGHT = 1
+MAX_WEIGHT = 100
+
+
+@dataclass
+class CSRGraph:
+    """
+    Sıkıştırılmış satır (CSR) biçiminde yönsüz ağırlıklı graf
+
+    u düğümünün komşuları indices[indptr[u]:indptr[u+1]], ağırlıkları
+    weights[indptr[u]:indptr[u+1]] aralığındadır. Her yönsüz kenar iki
+    yönde de saklanır.
+    """
+    num_vertices: int
+    indptr: Sequence[int]
+    indices: Sequence[int]
+    weights: Sequence[int]
+    family: str = ''
+    params: Dict = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        # Runner'lar veri boyutu olarak len() kullanır; graf için V
+        return self.num_vertices
+
+    @property
+    def num_edges(self) -> int:
+        """Yönsüz kenar sayısı"""
+        return len(self.indices) // 2
+
+    @property
+    def density(self) -> float:
+        """E / (V(V-1)/2)"""
+        V = self.num_vertices
+        return self.num_edges / (V * (V - 1) / 2) if V > 1 else 0.0
+
+    def iter_edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Tüm yönlü kenarları (u, v, w) olarak gez"""
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        for u in range(self.num_vertices):
+            for idx in range(indptr[u], indptr[u + 1]):
+                yield u, indices[idx], weights[idx]
+
+    def describe(self) -> Dict:
+        """Sonuç JSON'u için özet"""
+        return {
+            'family': self.family,
+            'vertices': self.num_vertices,
+            'edges': self.num_edges,
+            'density': self.density,
+            **self.params
+        }
+
+
+# ========================================
+# KENAR ÜRETİCİLERİ
+# ========================================
+# Her üretici yönsüz, tekrarsız (u < v) kenar listesi döndürür:
+# NumPy varsa vektörel diziler, yoksa array('q') üçlüsü.
+
+def _pairs_from_linear_np(k: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """Alt üçgen doğrusal indeksini (v, u) çiftine çevir (u < v)"""
+    v = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # Kayan nokta hatalarını düzelt
+    v -= (v * (v - 1) // 2 > k)
+    v += ((v + 1) * v // 2 <= k)
+    u = k - v * (v - 1) // 2
+    return u, v
+
+
+def _pairs_from_linear_py(k: int) -> Tuple[int, int]:
+    v = (1 + math.isqrt(1 + 8 * k)) // 2
+    return k - v * (v - 1) // 2, v
+
+
+def _gnp_edges(V: int, rng, rnd: random.Random, density: Optional[float],
+               edges: Optional[int]):
+    total = V * (V - 1) // 2
+    if edges is None:
+        p = min(max(density if density is not None else 0.1, 0.0), 1.0)
+        edges = int(rng.binomial(total, p)) if HAS_NUMPY else None
+        if edges is None:
+            # Binom yerine beklenen değer etrafında tohumlu sapma
+            edges = max(0, min(total, round(rnd.gauss(total * p, math.sqrt(total * p * (1 - p))))))
+    edges = min(edges, total)
+
+    if HAS_NUMPY:
+        k = rng.choice(total, size=edges, replace=False) if edges else np.empty(0, dtype=np.int64)
+        u, v = _pairs_from_linear_np(np.sort(k).astype(np.int64))
+        return u, v
+    us, vs = array('q'), array('q')
+    for k in sorted(rnd.sample(range(total), edges)):
+        u, v = _pairs_from_linear_py(k)
+        us.append(u)
+        vs.append(v)
+    return us, vs
+
+
+def _grid_edges(V: int, rng, rnd: random.Random, **_):
+    cols = max(1, math.isqrt(V))
+    if HAS_NUMPY:
+        node = np.arange(V, dtype=np.int64)
+        right = node[(node % cols != cols - 1) & (node + 1 < V)]
+        down = node[node + cols < V]
+        return (np.concatenate([right, down]),
+                np.concatenate([right + 1, down + cols]))
+    us, vs = array('q'), array('q')
+    for n in range(V):
+        if n % cols != cols - 1 and n + 1 < V:
+            us.append(n)
+            vs.append(n + 1)
+    for n in range(V - cols):
+        us.append(n)
+        vs.append(n + cols)
+    return us, vs
+
+
+def _scale_free_edges(V: int, rng, rnd: random.Random, degree: Optional[int] = None, **_):
+    # Barabási–Albert tercihli bağlanma doğası gereği sıralıdır;
+    # "tekrarlanan düğümler" listesiyle O(E) üretilir.
+    m = max(1, degree or 2)
+    us, vs = array('q'), array('q')
+    if V <= m:
+        return _complete_edges(V, rng, rnd)
+    repeated = array('q')
+    targets = list(range(m))
+    for source in range(m, V):
+        for t in set(targets):
+            us.append(t)
+            vs.append(source)
+            repeated.append(t)
+            repeated.append(source)
+        targets = [repeated[rnd.randrange(len(repeated))] for _ in range(m)]
+    if HAS_NUMPY:
+        return np.frombuffer(us, dtype=np.int64), np.frombuffer(vs, dtype=np.int64)
+    return us, vs
+
+
+def _complete_edges(V: int, rng, rnd: random.Random, **_):
+    if HAS_NUMPY:
+        u, v = np.triu_indices(V, 1)
+        return u.astype(np.int64), v.astype(np.int64)
+    us, vs = array('q'), array('q')
+    for u in range(V):
+        for v in range(u + 1, V):
+            us.append(u)
+            vs.append(v)
+    return us, vs
+
+
+GRAPH_FAMILIES: Dict[str, Dict] = {
+    'gnp': {
+        'name': 'Rastgele G(n,p)',
+        'generator': lambda V, rng, rnd, density=None, edges=None, **_: _gnp_edges(V, rng, rnd, density, edges),
+    },
+    'grid': {
+        'name': 'Izgara',
+        'generator': _grid_edges,
+    },
+    'scale_free': {
+        'name': 'Olceksiz (Barabasi-Albert)',
+        'generator': _scale_free_edges,
+    },
+    'complete': {
+        'name': 'Tam Graf',
+        'generator': _complete_edges,
+    },
+}
+
+
+# ========================================
+# CSR OLUŞTURMA
+# ========================================
+
+def _build_csr(V: int, u, v, w) -> Tuple[Sequence[int], Sequence[int], Sequence[int]]:
+    """Yönsüz kenar listesinden CSR dizileri oluştur (her iki yön)"""
+    if HAS_NUMPY:
+        src = np.concatenate([u, v])
+        dst = np.concatenate([v, u])
+        wt = np.concatenate([w, w])
+        order = np.argsort(src, kind='stable')
+        indptr = np.zeros(V + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=V), out=indptr[1:])
+        return indptr, dst[order].astype(np.int64), wt[order].astype(np.int64)
+
+    # Sayma sıralaması (counting sort)
+    counts = [0] * (V + 1)
+    for a, b in zip(u, v):
+        counts[a + 1] += 1
+        counts[b + 1] += 1
+    for i in range(V):
+        counts[i + 1] += counts[i]
+    indptr = array('q', counts)
+    fill = list(counts[:V])
+    indices = array('q', bytes(8 * 2 * len(u)))
+    weights = array('q', bytes(8 * 2 * len(u)))
+    for a, b, wt in zip(u, v, w):
+        indices[fill[a]], weights[fill[a]] = b, wt
+        fill[a] += 1
+        indices[fill[b]], weights[fill[b]] = a, wt
+        fill[b] += 1
+    return indptr, indices, weights
+
+
+def generate_graph(family: str, vertices: int, density: Optional[float] = None,
+                   edges: Optional[int] = None, degree: Optional[int] = None,
+                   seed: int = DEFAULT_SEED) -> CSRGraph:
+    """Grafı önbelleğe bakmadan üret"""
+    if family not in GRAPH_FAMILIES:
+        raise ValueError(f"Bilinmeyen graf ailesi: {family} "
+                         f"(seçenekler: {', '.join(GRAPH_FAMILIES)})")
+
+    rng = np.random.default_rng(seed) if HAS_NUMPY else None
+    rnd = random.Random(seed)
+    u, v = GRAPH_FAMILIES[family]['generator'](vertices, rng, rnd, density=density,
+                                               edges=edges, degree=degree)
+    if HAS_NUMPY:
+        w = rng.integers(MIN_WEIGHT, MAX_WEIGHT + 1, size=len(u), dtype=np.int64)
+    else:
+        w = array('q', [rnd.randint(MIN_WEIGHT, MAX_WEIGHT) for _ in range(len(u))])
+
+    indptr, indices, weights = _build_csr(vertices, u, v, w)
+    return CSRGraph(vertices, indptr, indices, weights, family=family,
+                    params=_graph_params(density, edges, degree))
+
+
+def _graph_params(density, edges, degree) -> Dict:
+    params = {}
+    if density is not None:
+        params['requested_density'] = density
+    if edges is not None:
+        params['requested_edges'] = edges
+    if degree is not None:
+        params['degree'] = degree
+    return params
+
+
+# ========================================
+# ÖNBELLEK
+# ========================================
+
+class GraphWorkloadCache:
+    """CSR graflarını diske yazan ve mmap ile geri açan önbellek"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR / 'graphs'
+
+    def cache_path(self, family: str, vertices: int, density: Optional[float],
+                   edges: Optional[int], degree: Optional[int], seed: int) -> Path:
+        key = f"{family}_V{vertices}"
+        if edges is not None:
+            key += f"_E{edges}"
+        elif density is not None:
+            key += f"_p{density:g}"
+        if degree is not None:
+            key += f"_m{degree}"
+        tag = 'np' if HAS_NUMPY else 'py'
+        return self.cache_dir / f"{key}_s{seed}_{tag}"
+
+    def get(self, family: str, vertices: int, density: Optional[float] = None,
+            edges: Optional[int] = None, degree: Optional[int] = None,
+            seed: int = DEFAULT_SEED) -> CSRGraph:
+        """Grafı önbellekten aç; yoksa üret, kaydet ve mmap ile aç"""
+        path = self.cache_path(family, vertices, density, edges, degree, seed)
+        if not (path / 'weights.npy').exists():
+            graph = generate_graph(family, vertices, density, edges, degree, seed)
+            path.mkdir(parents=True, exist_ok=True)
+            # weights en son yazılır; varlığı önbelleğin tamamlandığını gösterir
+            save_npy(path / 'indptr.npy', graph.indptr)
+            save_npy(path / 'indices.npy', graph.indices)
+            save_npy(path / 'weights.npy', graph.weights)
+
+        return CSRGraph(
+            vertices,
+            load_npy(path / 'indptr.npy'),
+            load_npy(path / 'indices.npy'),
+            load_npy(path / 'weights.npy'),
+            family=family,
+            params=_graph_params(density, edges, degree)
+        )
+
+
+_default_cache: Optional[GraphWorkloadCache] = None
+
+
+def get_graph(family: str, vertices: int, density: Optional[float] = None,
+              edges: Optional[int] = None, degree: Optional[int] = None,
+              seed: int = DEFAULT_SEED) -> CSRGraph:
+    """Varsayılan önbellek ile graf al (modül düzeyi kısayol)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = GraphWorkloadCache()
+    return _default_cache.get(family, vertices, density, edges, degree, seed)
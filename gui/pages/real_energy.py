@@ -3,8 +3,8 @@ Enerji Analizi Sayfası - Çoklu Test ve Grafikler
 """
 
 import json
-import random
 import time
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
@@ -22,7 +22,11 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from gui.styles import Colors
-from algorithms import ALGORITHMS
+from algorithms import ALGORITHMS, split_algorithm, exceeds_size_limit
+from metrics_cache import get_metrics_cache
+from baselines import with_baselines, attach_gui_baseline_ratios
+from data_generator import get_test_data, DEFAULT_SEED, DISTRIBUTIONS
+from memory_probe import MemoryProbe, DEFAULT_MEMORY_METHOD, available_memory_methods
 
 # Matplotlib
 import warnings
@@ -43,7 +47,17 @@ except ImportError:
 ALGORITHM_TYPES = {
     'divide_conquer': {'name': 'Bol ve Yonet', 'icon': 'D&C', 'color': '#4CC9F0'},
     'dynamic_programming': {'name': 'Dinamik Programlama', 'icon': 'DP', 'color': '#F72585'},
-    'greedy': {'name': 'Acgozlu', 'icon': 'GRD', 'color': '#4361EE'}
+    'greedy': {'name': 'Acgozlu', 'icon': 'GRD', 'color': '#4361EE'},
+    'baselines': {'name': 'Yerel Referans', 'icon': 'REF', 'color': '#2EC4B6'}
+}
+
+# Bellek ölçüm yöntemleri (bkz. memory_probe.MEMORY_METHODS)
+MEMORY_METHOD_LABELS = {
+    'tracemalloc': ('Ayri gecis (tracemalloc)', 'Sure olcumu izlemesiz; bellek ayri bir calistirmadan'),
+    'vmhwm': ('Tepe RSS (VmHWM)', 'Her calistirmada clear_refs + VmHWM; NumPy/C tamponlari dahil'),
+    'rss': ('RSS ornekleme', 'Olcum sirasinda arka planda RSS ornekleme'),
+    'inline': ('Olcum icinde (tracemalloc)', 'Eski davranis; ayirma yogun algoritmalari yavaslatir'),
+    'none': ('Kapali', 'Bellek olculmez'),
 }
 
 # LibreHardwareMonitor desteği
@@ -62,11 +76,15 @@ class EnergyTestWorker(QThread):
     progress_signal = pyqtSignal(int, int, str)
     result_signal = pyqtSignal(dict)
     
-    def __init__(self, algorithms, sizes, runs):
+    def __init__(self, algorithms, sizes, runs, seed=DEFAULT_SEED, distribution='random',
+                 memory_method=DEFAULT_MEMORY_METHOD):
         super().__init__()
         self.algorithms = algorithms
         self.sizes = sizes
         self.runs = runs
+        self.seed = seed
+        self.distribution = distribution
+        self.memory_method = memory_method
         self._running = True
         
     def stop(self):
@@ -76,11 +94,15 @@ class EnergyTestWorker(QThread):
         results = {}
         total = len(self.algorithms) * len(self.sizes) * self.runs
         current = 0
+        probe = MemoryProbe(self.memory_method)
         
         self.log_signal.emit("[*] Enerji analizi baslatiliyor...")
         self.log_signal.emit(f"    Algoritmalar: {len(self.algorithms)}")
         self.log_signal.emit(f"    Boyutlar: {self.sizes}")
         self.log_signal.emit(f"    Tekrar: {self.runs}")
+        self.log_signal.emit(f"    Tohum: {self.seed}")
+        self.log_signal.emit(f"    Dagilim: {DISTRIBUTIONS[self.distribution]['name']}")
+        self.log_signal.emit(f"    Bellek: {self.memory_method}")
         if HAS_LIBRE:
             self.log_signal.emit("    [OK] LibreHardwareMonitor: GERCEK OLCUM AKTIF")
         else:
@@ -108,24 +130,34 @@ class EnergyTestWorker(QThread):
                 'name': algo_name,
                 'complexity_time': algo_info.get('complexity_time', 'N/A'),
                 'complexity_space': algo_info.get('complexity_space', 'N/A'),
+                'distribution': self.distribution,
                 'sizes': {},
                 'avg_time': 0,
                 'avg_energy': 0,
-                'avg_memory': 0
+                'avg_memory': 0,
+                'memory_method': self.memory_method
             }
             
             all_times = []
             all_energies = []
             all_memories = []
+            prepare, run_func = split_algorithm(algo_info)
             
             for size in self.sizes:
                 if not self._running:
                     break
+                if exceeds_size_limit(algo_info, size):
+                    current += self.runs
+                    self.log_signal.emit(f"    n={size}: atlandi (sinir {algo_info['max_size']})")
+                    continue
                     
                 size_times = []
                 size_energies = []
                 size_memories = []
                 
+                # Test verisi (tohumlu, önbellekten kopyasız görünüm)
+                data = get_test_data(size, self.distribution, self.seed)
+                
                 for r in range(self.runs):
                     if not self._running:
                         break
@@ -133,9 +165,6 @@ class EnergyTestWorker(QThread):
                     current += 1
                     self.progress_signal.emit(current, total, algo_name)
                     
-                    # Generate test data
-                    data = [random.randint(1, size * 10) for _ in range(size)]
-                    
                     # Başlangıç güç ölçümü (LibreHardwareMonitor varsa)
                     start_power = 25.0  # Varsayılan
                     if HAS_LIBRE and LIBRE_METER:
@@ -143,22 +172,20 @@ class EnergyTestWorker(QThread):
                         if power_val > 0:
                             start_power = power_val
                     
-                    # Measure
-                    import tracemalloc
-                    tracemalloc.start()
+                    # Girdi kopyası ölçüm dışında (bellek ölçümüne dahil değil)
+                    prepared = prepare(data)
                     
-                    start = time.perf_counter()
-                    try:
-                        algo_info['func'](data.copy())
-                    except:
-                        pass
-                    end = time.perf_counter()
-                    
-                    current_mem, peak_mem = tracemalloc.get_traced_memory()
-                    tracemalloc.stop()
+                    # Measure (ayrı geçişli bellek yönteminde izleme kapalı)
+                    with probe.window() as window:
+                        start = time.perf_counter()
+                        try:
+                            run_func(prepared)
+                        except:
+                            pass
+                        end = time.perf_counter()
                     
                     exec_time = (end - start) * 1000  # ms
-                    memory = peak_mem / 1024  # KB
+                    memory = (window.peak_mb or 0) * 1024  # KB
                     
                     # Bitiş güç ölçümü ve enerji hesabı
                     end_power = start_power
@@ -175,6 +202,14 @@ class EnergyTestWorker(QThread):
                     size_energies.append(energy)
                     size_memories.append(memory)
                 
+                if size_times and probe.separate:
+                    # Bellek, süre ölçümünden sonra ayrı izlenen bir çalıştırmada
+                    try:
+                        memory = probe.measure_pass(run_func, prepare(data)) * 1024
+                    except Exception:
+                        memory = 0
+                    size_memories = [memory] * len(size_times)
+                
                 if size_times:
                     avg_t = sum(size_times) / len(size_times)
                     avg_e = sum(size_energies) / len(size_energies) 
@@ -189,6 +224,14 @@ class EnergyTestWorker(QThread):
                         'memories': size_memories
                     }
                     
+                    # Deterministik sayımlar (daha önce görülen girdiler için anında)
+                    try:
+                        metrics = get_metrics_cache().get_or_compute(
+                            algo_key, run_func, prepare, data, algo_info)
+                        results[algo_key]['sizes'][size]['metrics'] = asdict(metrics)
+                    except Exception:
+                        pass
+                    
                     all_times.extend(size_times)
                     all_energies.extend(size_energies)
                     all_memories.extend(size_memories)
@@ -200,13 +243,18 @@ class EnergyTestWorker(QThread):
                 results[algo_key]['avg_energy'] = sum(all_energies) / len(all_energies)
                 results[algo_key]['avg_memory'] = sum(all_memories) / len(all_memories)
         
+        # Yerel oranlar kaydetmeden önce eklenir (tablo ve JSON aynı veriyi gösterir)
+        attach_gui_baseline_ratios(results)
+        
         # Save results
         if results:
             results_dir = Path(__file__).parent.parent.parent / 'results'
             results_dir.mkdir(exist_ok=True)
             
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filepath = results_dir / f'energy_analysis_{timestamp}.json'
+            # Dosya adı dağılıma göre anahtarlanır (varsayılan 'random' eski adı korur)
+            suffix = '' if self.distribution == 'random' else f'_{self.distribution}'
+            filepath = results_dir / f'energy_analysis_{timestamp}{suffix}.json'
             
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(results, f, indent=2, ensure_ascii=False)
@@ -521,6 +569,46 @@ class RealEnergyPage(QWidget):
         runs_group.addWidget(self.runs_spin)
         params_row.addLayout(runs_group, 1)
         
+        # Seed
+        seed_group = QVBoxLayout()
+        seed_label = QLabel("Tohum (Seed):")
+        seed_label.setStyleSheet(f"color: {Colors.TEXT_MAIN}; font-size: 12px;")
+        self.seed_spin = QSpinBox()
+        self.seed_spin.setRange(0, 2**31 - 1)
+        self.seed_spin.setValue(DEFAULT_SEED)
+        self.seed_spin.setStyleSheet(self._input_style())
+        seed_group.addWidget(seed_label)
+        seed_group.addWidget(self.seed_spin)
+        params_row.addLayout(seed_group, 1)
+        
+        # Input distribution
+        dist_group = QVBoxLayout()
+        dist_label = QLabel("Girdi Dagilimi:")
+        dist_label.setStyleSheet(f"color: {Colors.TEXT_MAIN}; font-size: 12px;")
+        self.dist_combo = QComboBox()
+        for dist_key, dist_info in DISTRIBUTIONS.items():
+            self.dist_combo.addItem(dist_info['name'], dist_key)
+            self.dist_combo.setItemData(self.dist_combo.count() - 1, dist_info['description'], Qt.ToolTipRole)
+        self.dist_combo.setStyleSheet(self._combo_style())
+        dist_group.addWidget(dist_label)
+        dist_group.addWidget(self.dist_combo)
+        params_row.addLayout(dist_group, 1)
+        
+        # Memory method
+        memory_group = QVBoxLayout()
+        memory_label = QLabel("Bellek Olcumu:")
+        memory_label.setStyleSheet(f"color: {Colors.TEXT_MAIN}; font-size: 12px;")
+        self.memory_combo = QComboBox()
+        for method in available_memory_methods():
+            name, tooltip = MEMORY_METHOD_LABELS[method]
+            self.memory_combo.addItem(name, method)
+            self.memory_combo.setItemData(self.memory_combo.count() - 1, tooltip, Qt.ToolTipRole)
+        self.memory_combo.setCurrentIndex(self.memory_combo.findData(DEFAULT_MEMORY_METHOD))
+        self.memory_combo.setStyleSheet(self._combo_style())
+        memory_group.addWidget(memory_label)
+        memory_group.addWidget(self.memory_combo)
+        params_row.addLayout(memory_group, 1)
+        
         params_row.addStretch()
         config_layout.addLayout(params_row)
         
@@ -1140,6 +1228,9 @@ class RealEnergyPage(QWidget):
             self.log_text.append("[!] En az bir algoritma secin!")
             return
         
+        # Enerji oranı için yerel referanslar da ölçülür
+        selected = with_baselines(selected)
+        
         try:
             sizes = [int(s.strip()) for s in self.size_input.text().split(',')]
         except:
@@ -1155,7 +1246,9 @@ class RealEnergyPage(QWidget):
         self.status_label.setText("Analiz baslatiliyor...")
         self.log_text.clear()
         
-        self.worker = EnergyTestWorker(selected, sizes, runs)
+        self.worker = EnergyTestWorker(selected, sizes, runs, self.seed_spin.value(),
+                                       self.dist_combo.currentData(),
+                                       self.memory_combo.currentData())
         self.worker.log_signal.connect(self.log_text.append)
         self.worker.progress_signal.connect(self.update_progress)
         self.worker.result_signal.connect(self.on_complete)
@@ -1216,7 +1309,7 @@ class RealEnergyPage(QWidget):
         if not self.results_data:
             return
         
-        cols = ['Algoritma', 'Karmasiklik', 'Ort. Sure', 'Ort. Enerji', 'Ort. Bellek']
+        cols = ['Algoritma', 'Karmasiklik', 'Ort. Sure', 'Ort. Enerji', 'Ort. Bellek', 'Yerel Oran']
         self.results_table.setColumnCount(len(cols))
         self.results_table.setHorizontalHeaderLabels(cols)
         self.results_table.setRowCount(len(self.results_data))
@@ -1254,9 +1347,18 @@ class RealEnergyPage(QWidget):
             else:
                 memory_str = f"{memory_val / 1024:.2f} MB"
             self.results_table.setItem(i, 4, QTableWidgetItem(memory_str))
+            self.results_table.setItem(i, 5, QTableWidgetItem(self._format_energy_ratio(info)))
         
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
     
+    @staticmethod
+    def _format_energy_ratio(info):
+        """Yerel referansa göre enerji oranı metni"""
+        ratio = info.get('energy_ratio')
+        if ratio is None:
+            return "-"
+        return f"{ratio:.1f}x ({info['baseline']})"
+    
     def populate_runs_combos(self):
         """Çalıştırmalar tabındaki combo'ları doldur"""
         if not self.results_data:
@@ -1636,10 +1738,12 @@ class RealEnergyPage(QWidget):
                             info.get('complexity_time', 'N/A'),
                             time_str,
                             energy_str,
-                            memory_str
+                            memory_str,
+                            self._format_energy_ratio(info)
                         ])
                     
-                    columns = ['Algoritma', 'Karmasiklik', 'Ort. Sure', 'Ort. Enerji', 'Ort. Bellek']
+                    columns = ['Algoritma', 'Karmasiklik', 'Ort. Sure', 'Ort. Enerji', 'Ort. Bellek',
+                               'Yerel Oran']
                     
                     table = ax.table(
                         cellText=table_data,
@@ -5,12 +5,15 @@ Bu script PHP'den çağrılarak algoritmaları çalıştırır ve
 GERÇEK enerji ölçümü yapar.
 
 KULLANIM:
-    php'den: shell_exec('python measure_for_php.py algorithm_name data_size')
+    php'den: shell_exec('python measure_for_php.py algorithm_name data_size [runs] [seed] [distribution]')
+
+Her çağrı ayrı bir süreç olduğundan, ölçülen süreçte örnekleme iş parçacığı
+açmamak için çalışan bir power_daemon halkasına bağlanılabilir:
+    ECA_POWER_RING=eca_power_ring python measure_for_php.py merge_sort 1000
 """
 
 import sys
 import json
-import random
 import os
 import warnings
 import threading
@@ -26,10 +29,15 @@ threading.excepthook = lambda args: None
 sys.path.insert(0, str(Path(__file__).parent))
 
 from real_power_meter import RealPowerMeter
-from algorithms import ALGORITHMS
+from algorithms import ALGORITHMS, split_algorithm
+from data_generator import get_test_data, resolve_distribution, DEFAULT_SEED
+
+# Ayarlanmışsa ölçüm bu adlı power_daemon halkasından yapılır
+POWER_RING_ENV = 'ECA_POWER_RING'
 
 
-def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
+def run_measurement(algorithm_name: str, data_size: int, runs: int = 3,
+                    seed: int = DEFAULT_SEED, distribution: str = 'random'):
     """
     Algoritma enerji ölçümü yap ve JSON olarak döndür
     """
@@ -38,12 +46,17 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
         'is_real_measurement': False,
         'algorithm': algorithm_name,
         'data_size': data_size,
+        'distribution': distribution,
         'error': None
     }
     
     try:
-        # Ölçüm sistemini başlat
-        meter = RealPowerMeter(sampling_interval_ms=50)
+        # Ölçüm sistemini başlat (halka verilmişse süreç içi örnekleyici açılmaz)
+        ring_name = os.environ.get(POWER_RING_ENV)
+        if ring_name:
+            meter = RealPowerMeter(shared_ring=ring_name)
+        else:
+            meter = RealPowerMeter(sampling_interval_ms=50)
         
         if not meter.is_available():
             # Gerçek ölçüm mümkün değil, tahmin kullan
@@ -52,10 +65,13 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
             result['measurement_source'] = 'estimation_fallback'
             
             # Basit tahmin ile devam et
-            return run_estimation_fallback(algorithm_name, data_size, runs)
+            return run_estimation_fallback(algorithm_name, data_size, runs, seed, distribution)
         
         result['is_real_measurement'] = True
-        result['measurement_source'] = 'LibreHardwareMonitor_WMI'
+        if meter.shared_ring is not None:
+            result['measurement_source'] = f'power_daemon_{meter.shared_ring.source}'
+        else:
+            result['measurement_source'] = 'LibreHardwareMonitor_WMI'
         
         # Algoritmayı bul
         algo_info = None
@@ -68,8 +84,8 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
             result['error'] = f'Algoritma bulunamadı: {algorithm_name}'
             return result
         
-        # Test verisi oluştur
-        test_data = [random.randint(1, data_size * 10) for _ in range(data_size)]
+        # Test verisi oluştur (tohumlu, önbellekli)
+        test_data = get_test_data(data_size, distribution, seed)
         
         # Çoklu çalıştırma
         all_energy = []
@@ -77,11 +93,14 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
         all_power = []
         metrics_data = None
         
+        prepare, run_func = split_algorithm(algo_info)
+        
         for run in range(runs):
-            data_copy = test_data.copy()
+            # Girdi kopyası (yerinde algoritmalar için) ölçüm dışında hazırlanır
+            prepared = prepare(test_data)
             
             def run_algo():
-                return algo_info['func'](data_copy)
+                return run_func(prepared)
             
             measurement = meter.measure_function(
                 run_algo,
@@ -94,7 +113,7 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
             all_power.append(measurement.avg_power_watts)
             
             # Son çalıştırmadan metrikleri al
-            _, metrics_data = algo_info['func'](test_data.copy())
+            _, metrics_data = run_func(prepare(test_data))
         
         # Ortalama hesapla
         result['success'] = True
@@ -126,7 +145,8 @@ def run_measurement(algorithm_name: str, data_size: int, runs: int = 3):
     return result
 
 
-def run_estimation_fallback(algorithm_name: str, data_size: int, runs: int = 3):
+def run_estimation_fallback(algorithm_name: str, data_size: int, runs: int = 3,
+                            seed: int = DEFAULT_SEED, distribution: str = 'random'):
     """
     Gerçek ölçüm mümkün değilse tahmin modeli kullan
     """
@@ -137,6 +157,7 @@ def run_estimation_fallback(algorithm_name: str, data_size: int, runs: int = 3):
         'is_real_measurement': False,
         'algorithm': algorithm_name,
         'data_size': data_size,
+        'distribution': distribution,
         'measurement_source': 'estimation'
     }
     
@@ -153,7 +174,7 @@ def run_estimation_fallback(algorithm_name: str, data_size: int, runs: int = 3):
             return result
         
         # Test verisi
-        test_data = [random.randint(1, data_size * 10) for _ in range(data_size)]
+        test_data = get_test_data(data_size, distribution, seed)
         
         all_time = []
         all_energy = []
@@ -161,11 +182,12 @@ def run_estimation_fallback(algorithm_name: str, data_size: int, runs: int = 3):
         
         ESTIMATED_POWER = 25.0  # Watt (tahmin)
         
+        prepare, run_func = split_algorithm(algo_info)
+        
         for run in range(runs):
-            data_copy = test_data.copy()
-            
+            prepared = prepare(test_data)
             start = time.perf_counter()
-            _, metrics_data = algo_info['func'](data_copy)
+            _, metrics_data = run_func(prepared)
             end = time.perf_counter()
             
             exec_time_ms = (end - start) * 1000
@@ -207,15 +229,22 @@ def main():
     if len(sys.argv) < 3:
         print(json.dumps({
             'success': False,
-            'error': 'Kullanım: python measure_for_php.py <algorithm_name> <data_size> [runs]'
+            'error': 'Kullanım: python measure_for_php.py <algorithm_name> <data_size> [runs] [seed] [distribution]'
         }))
         return
     
     algorithm_name = sys.argv[1]
     data_size = int(sys.argv[2])
     runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_SEED
+    
+    try:
+        distribution = resolve_distribution(sys.argv[5]) if len(sys.argv) > 5 else 'random'
+    except ValueError as e:
+        print(json.dumps({'success': False, 'error': str(e)}, ensure_ascii=False))
+        return
     
-    result = run_measurement(algorithm_name, data_size, runs)
+    result = run_measurement(algorithm_name, data_size, runs, seed, distribution)
     
     # JSON olarak yazdır (PHP bunu okuyacak)
     print(json.dumps(result, ensure_ascii=False))
@@ -0,0 +1,256 @@
+"""
+Bellek Ölçüm Yöntemleri
+=======================
+tracemalloc her Python ayırmasını izler; süreye dahil edildiğinde
+ayırma yoğun algoritmaları (merge_sort, strassen) 2-5 kat yavaşlatır ve
+şişen süre doğrudan raporlanan joule değerine yansır. Bu modül bellek
+ölçümünü süre/enerji ölçümünden ayırır:
+
+    tracemalloc  Ölçülen çalıştırmalar izlemesiz yapılır; tepe bellek ayrı
+                 bir izlenen çalıştırmadan alınır (varsayılan)
+    vmhwm        Linux: her çalıştırmadan önce /proc/self/clear_refs'e 5
+                 yazılarak tepe RSS sıfırlanır, sonra /proc/self/status
+                 VmHWM okunur (tüm bellek, iki küçük dosya işlemi)
+    rss          Ölçülen çalıştırma sırasında arka plan iş parçacığı RSS
+                 örnekler; tepe RSS artışı raporlanır (C/NumPy tamponları
+                 dahil, düşük ek yük, örnekleme aralığı kadar çözünürlük)
+    inline       Eski davranış: tracemalloc ölçülen çalıştırmayı sarar
+    none         Bellek ölçülmez
+
+Sonuçlarda `memory_method` alanı belleğin nasıl ölçüldüğünü belirtir.
+vmhwm ve rss süreç düzeyindedir: ölçülen sürecin belleğini raporlar, alt
+süreçlerinkini (ör. johnson_parallel işçileri) içermez.
+
+Kullanım:
+    from memory_probe import MemoryProbe
+
+    probe = MemoryProbe('rss')
+    with probe.window() as window:
+        func(data)
+    print(window.peak_mb)
+
+    peak_mb = MemoryProbe('tracemalloc').measure_pass(func, fresh_copy)
+"""
+
+import os
+import threading
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+
+MEMORY_METHODS = {
+    'tracemalloc': 'Ayrı izlenen çalıştırma (tracemalloc, yalnızca Python ayırmaları)',
+    'vmhwm': 'Çalıştırma başına tepe RSS (clear_refs + VmHWM, Linux, tüm bellek)',
+    'rss': 'Ölçüm sırasında RSS örnekleme (tüm bellek, düşük ek yük)',
+    'inline': 'Ölçülen çalıştırma içinde tracemalloc (süreyi şişirir)',
+    'none': 'Bellek ölçülmez',
+}
+DEFAULT_MEMORY_METHOD = 'tracemalloc'
+
+# Belleği ölçülen çalıştırmalardan ayrı bir geçişte ölçen yöntemler
+SEPARATE_PASS_METHODS = {'tracemalloc'}
+
+DEFAULT_RSS_INTERVAL_MS = 5.0
+
+_STATM = '/proc/self/statm'
+HAS_STATM = os.path.exists(_STATM)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_CLEAR_REFS = '/proc/self/clear_refs'
+_STATUS = '/proc/self/status'
+
+# clear_refs değeri 5: sürecin tepe RSS değerini (VmHWM) mevcut RSS'e sıfırla
+_RESET_PEAK_RSS = b'5'
+
+
+def current_rss_mb() -> Optional[float]:
+    """Sürecin anlık yerleşik belleği (MB)"""
+    if HAS_STATM:
+        with open(_STATM, 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    if HAS_PSUTIL:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    return None
+
+
+def reset_peak_rss() -> bool:
+    """VmHWM'yi mevcut RSS'e sıfırla (Linux 4.0+); başarılıysa True"""
+    try:
+        fd = os.open(_CLEAR_REFS, os.O_WRONLY)
+    except OSError:
+        return False
+    try:
+        os.write(fd, _RESET_PEAK_RSS)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def read_status_mb(*keys: str) -> Tuple[Optional[float], ...]:
+    """/proc/self/status alanlarını MB olarak oku (ör. 'VmHWM', 'VmRSS')"""
+    values = dict.fromkeys(keys)
+    with open(_STATUS, 'rb') as f:
+        for line in f:
+            name, _, rest = line.partition(b':')
+            key = name.decode()
+            if key in values:
+                values[key] = int(rest.split()[0]) / 1024  # kB
+    return tuple(values[k] for k in keys)
+
+
+def _vmhwm_supported() -> bool:
+    return reset_peak_rss() and read_status_mb('VmHWM')[0] is not None
+
+
+HAS_VMHWM = os.path.exists(_CLEAR_REFS) and _vmhwm_supported()
+
+
+def available_memory_methods() -> List[str]:
+    """Bu sistemde kullanılabilen bellek yöntemleri"""
+    methods = []
+    for method in MEMORY_METHODS:
+        if method == 'vmhwm' and not HAS_VMHWM:
+            continue
+        if method == 'rss' and not (HAS_STATM or HAS_PSUTIL):
+            continue
+        methods.append(method)
+    return methods
+
+
+# ========================================
+# ÖLÇÜM PENCERELERİ
+# ========================================
+
+class _NullWindow:
+    """Ölçülen çalıştırma sırasında bellek ölçmeyen pencere"""
+    peak_mb: Optional[float] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _TracemallocWindow:
+    """tracemalloc tepe değeri (Python ayırmaları)"""
+
+    def __init__(self):
+        self.peak_mb: Optional[float] = None
+        self._started = False
+
+    def __enter__(self):
+        # Zaten izleniyorsa (iç içe ölçüm) yalnızca tepe sıfırlanır
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc):
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+        self.peak_mb = peak / (1024 * 1024)
+
+
+class _VmHWMWindow:
+    """clear_refs ile sıfırlanan VmHWM; tepe RSS artışı"""
+
+    def __init__(self):
+        self.peak_mb: Optional[float] = None
+        self._start_rss = None
+
+    def __enter__(self):
+        reset_peak_rss()
+        # Sıfırlama sonrası VmHWM = VmRSS; başlangıç olarak alınır
+        self._start_rss = read_status_mb('VmRSS')[0]
+        return self
+
+    def __exit__(self, *exc):
+        peak = read_status_mb('VmHWM')[0]
+        self.peak_mb = max(peak - self._start_rss, 0.0)
+
+
+class _RSSWindow:
+    """Arka plan iş parçacığıyla RSS örnekleme; tepe RSS artışı"""
+
+    def __init__(self, interval_ms: float):
+        self.interval = interval_ms / 1000
+        self.peak_mb: Optional[float] = None
+        self._start_rss = None
+        self._peak_rss = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss_mb()
+            if rss > self._peak_rss:
+                self._peak_rss = rss
+
+    def __enter__(self):
+        self._start_rss = self._peak_rss = current_rss_mb()
+        if self._start_rss is not None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is None:
+            return
+        end_rss = current_rss_mb()
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.peak_mb = max(self._peak_rss, end_rss) - self._start_rss
+
+
+class MemoryProbe:
+    """Seçilen yönteme göre bellek ölçümü"""
+
+    def __init__(self, method: str = DEFAULT_MEMORY_METHOD,
+                 rss_interval_ms: float = DEFAULT_RSS_INTERVAL_MS):
+        if method not in MEMORY_METHODS:
+            raise ValueError(f"Bilinmeyen bellek yöntemi: {method} "
+                             f"(seçenekler: {', '.join(MEMORY_METHODS)})")
+        if method == 'rss' and current_rss_mb() is None:
+            raise ValueError("RSS okunamıyor (/proc/self/statm veya psutil gerekli)")
+        if method == 'vmhwm' and not HAS_VMHWM:
+            raise ValueError("VmHWM sıfırlanamıyor (/proc/self/clear_refs yazılabilir "
+                             "olmalı, Linux 4.0+)")
+        self.method = method
+        self.rss_interval_ms = rss_interval_ms
+
+    @property
+    def separate(self) -> bool:
+        """Bellek ölçülen çalıştırmalardan ayrı bir geçişte mi ölçülüyor"""
+        return self.method in SEPARATE_PASS_METHODS
+
+    def window(self):
+        """Ölçülen çalıştırmayı saran pencere (ayrı geçişli yöntemlerde boş)"""
+        if self.method == 'inline':
+            return _TracemallocWindow()
+        if self.method == 'vmhwm':
+            return _VmHWMWindow()
+        if self.method == 'rss':
+            return _RSSWindow(self.rss_interval_ms)
+        return _NullWindow()
+
+    def measure_pass(self, func: Callable, *args: Any) -> Optional[float]:
+        """Ayrı bellek geçişi: fonksiyonu izleyerek çalıştır, tepe MB döndür"""
+        if not self.separate:
+            return None
+        window = _TracemallocWindow()
+        with window:
+            func(*args)
+        return window.peak_mb
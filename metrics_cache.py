@@ -0,0 +1,249 @@
+"""
+Metrik Önbelleği
+================
+`AlgorithmMetrics` sayımları, aynı fonksiyon gövdesi ve aynı girdi için
+her zaman aynıdır. Bu modül sayımları (algoritma kaynak özeti, girdi
+özeti) anahtarıyla küçük bir SQLite indeksinde saklar; daha önce görülen
+girdiler için algoritma yeniden çalıştırılmaz.
+
+- Kaynak özeti, çalıştırma ve hazırlık (prepare) fonksiyonlarının, aynı
+  modülde çağırdıkları yardımcıların kaynak kodundan ve başvurdukları
+  modül sabitlerinin (KARATSUBA_CUTOFF, STRING_ALPHABET vb.) değerlerinden
+  hesaplanır; kayıt defterindeki sayıma etki eden alanlar (max_size) da
+  anahtara girer. Kod veya sabit değişince eski kayıtlar kendiliğinden
+  geçersiz olur.
+- Girdi özeti, tamponun ham baytları (BLAKE2b) üzerinden alınır.
+- Kayıt sayısı `max_entries` değerini aşınca en az kullanılanlar (LRU)
+  silinir.
+
+Kullanım:
+    from metrics_cache import get_metrics_cache
+
+    cache = get_metrics_cache()
+    metrics = cache.get_or_compute('merge_sort', run_func, prepare, data)
+"""
+
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from algorithms import AlgorithmMetrics
+from data_generator import DEFAULT_CACHE_DIR
+from graph_workloads import CSRGraph
+
+
+DEFAULT_DB_PATH = DEFAULT_CACHE_DIR / 'metrics.sqlite'
+DEFAULT_MAX_ENTRIES = 10000
+
+
+# ========================================
+# ÖZET FONKSİYONLARI
+# ========================================
+
+_source_hashes: Dict[Callable, str] = {}
+
+# Değeri anahtara giren modül sabiti türleri (repr'i kararlı olanlar)
+_CONSTANT_TYPES = (bool, int, float, str, bytes)
+
+# Kayıt defterinde sayımı etkileyen, çağrılabilir olmayan alanlar
+KEY_REGISTRY_FIELDS = ('max_size',)
+
+
+def _is_constant(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_constant(v) for v in value)
+    return isinstance(value, _CONSTANT_TYPES)
+
+
+def _collect_sources(func: Callable, seen: set) -> list:
+    """Fonksiyonun, aynı modülde çağırdığı fonksiyonların kaynakları ve
+    başvurdukları modül sabitlerinin değerleri"""
+    if func in seen or not inspect.isfunction(func):
+        return []
+    seen.add(func)
+    try:
+        sources = [inspect.getsource(func)]
+    except (OSError, TypeError):
+        sources = [func.__code__.co_code.hex()]
+
+    module_globals = func.__globals__
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        for name in code.co_names:
+            target = module_globals.get(name)
+            if inspect.isfunction(target) and target.__module__ == func.__module__:
+                sources.extend(_collect_sources(target, seen))
+            elif _is_constant(target):
+                sources.append(f"{name}={target!r}")
+        # İç içe fonksiyonların çağrıları
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+    return sources
+
+
+def algorithm_source_hash(func: Callable) -> str:
+    """Algoritma kaynak kodunun özeti (metrik alanları dahil)"""
+    if func not in _source_hashes:
+        h = hashlib.blake2b(digest_size=16)
+        for source in _collect_sources(func, set()):
+            h.update(source.encode('utf-8'))
+        h.update(','.join(f.name for f in fields(AlgorithmMetrics)).encode())
+        _source_hashes[func] = h.hexdigest()
+    return _source_hashes[func]
+
+
+def _update_with_buffer(h, data: Any):
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # list/tuple: tam sayılar int64 olarak, sığmazsa repr ile
+        try:
+            view = memoryview(array('q', data))
+        except (TypeError, OverflowError):
+            h.update(repr(list(data)).encode())
+            return
+    h.update(view.format.encode())
+    h.update(view.cast('B') if view.c_contiguous else view.tobytes())
+
+
+def input_digest(data: Any) -> str:
+    """Girdinin içerik özeti (list, array, memoryview, NumPy, CSRGraph)"""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(data, CSRGraph):
+        h.update(f"graph:{data.num_vertices}".encode())
+        for part in (data.indptr, data.indices, data.weights):
+            _update_with_buffer(h, part)
+    else:
+        h.update(f"seq:{len(data)}".encode())
+        _update_with_buffer(h, data)
+    return h.hexdigest()
+
+
+# ========================================
+# ÖNBELLEK
+# ========================================
+
+class MetricsCache:
+    """(kaynak özeti, girdi özeti) -> AlgorithmMetrics kalıcı LRU önbelleği"""
+
+    def __init__(self, db_path: Optional[str] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # GUI iş parçacıkları da kullanır; erişim kilit ile sıralanır
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS metrics (
+                    key TEXT PRIMARY KEY,
+                    algorithm TEXT NOT NULL,
+                    metrics TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metrics_last_used ON metrics(last_used)")
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(func: Callable, data: Any, prepare: Optional[Callable] = None,
+                 algo_info: Optional[Dict] = None) -> str:
+        """(çalıştırma, hazırlık, kayıt alanları) özeti : girdi özeti"""
+        code = algorithm_source_hash(func)
+        if prepare is not None or algo_info:
+            h = hashlib.blake2b(code.encode(), digest_size=16)
+            if prepare is not None:
+                h.update(b'prepare:' + algorithm_source_hash(prepare).encode())
+            wiring = {k: (algo_info or {}).get(k) for k in KEY_REGISTRY_FIELDS}
+            h.update(json.dumps(wiring, sort_keys=True).encode())
+            code = h.hexdigest()
+        return f"{code}:{input_digest(data)}"
+
+    def get(self, key: str) -> Optional[AlgorithmMetrics]:
+        """Kaydı getir ve son kullanım zamanını güncelle"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT metrics FROM metrics WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE metrics SET last_used = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return AlgorithmMetrics(**json.loads(row[0]))
+
+    def put(self, key: str, algorithm: str, metrics: AlgorithmMetrics):
+        """Kaydı ekle; kapasite aşılırsa en eski kullanılanları sil"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO metrics (key, algorithm, metrics, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, algorithm, json.dumps(asdict(metrics)), time.time()))
+            count = conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM metrics WHERE key IN "
+                    "(SELECT key FROM metrics ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,))
+            conn.commit()
+
+    def get_or_compute(self, algorithm: str, run_func: Callable, prepare: Callable,
+                       data: Any, algo_info: Optional[Dict] = None) -> AlgorithmMetrics:
+        """
+        Metrikleri önbellekten al; yoksa algoritmayı çalıştırıp kaydet
+
+        Args:
+            algorithm: Algoritma anahtarı (yalnızca bilgi amaçlı saklanır)
+            run_func: Metrikleri döndüren çalıştırma fonksiyonu
+            prepare: Girdi hazırlama fonksiyonu (bkz. split_algorithm)
+            data: Ham girdi (özet bunun üzerinden alınır)
+            algo_info: Kayıt defteri girdisi (KEY_REGISTRY_FIELDS anahtara girer)
+        """
+        key = self.make_key(run_func, data, prepare, algo_info)
+        metrics = self.get(key)
+        if metrics is not None:
+            self.hits += 1
+            return metrics
+
+        self.misses += 1
+        _, metrics = run_func(prepare(data))
+        self.put(key, algorithm, metrics)
+        return metrics
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM metrics")
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[MetricsCache] = None
+
+
+def get_metrics_cache() -> MetricsCache:
+    """Varsayılan metrik önbelleği (modül düzeyi kısayol)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MetricsCache()
+    return _default_cache
@@ -0,0 +1,266 @@
+"""
+Otomatik İşlem Sayacı
+=====================
+Elle yazılmış `metrics.comparisons += 1` satırlarına bağlı kalmadan,
+herhangi bir algoritma fonksiyonunun bayt kodunu izleyerek işlemleri
+sayar:
+
+    comparisons   COMPARE_OP, IS_OP, CONTAINS_OP
+    subscripts    a[i] okuma/yazma/silme ve dilimleme
+    calls         fonksiyon çağrıları
+    iterations    döngü gövdesine girişler (for ve while aynı sayılır)
+    instructions  izlenen toplam bayt kodu komutu
+
+Döngü yinelemesi, gövdenin ilk komutunun çalışması olarak sayılır: for
+döngülerinde FOR_ITER'den sonraki komut, while döngülerinde geri yönlü
+atlamanın hedefi (derleyici koşulu döngü sonuna kopyaladığı için hedef
+gövdenin başıdır). Böylece 10 kez dönen for ve while döngüsü ikisi de 10
+verir; yalnızca geri atlamaları saymak while döngüsünde 9 verirdi.
+
+Python 3.12+ üzerinde `sys.monitoring` INSTRUCTION olayı, daha eski
+sürümlerde `sys.settrace` ile komut düzeyinde izleme (f_trace_opcodes)
+kullanılır. `instructions` toplamı için izlenen koddaki her komut olay
+üretir (ilgisiz komutlar devre dışı bırakılmaz); ek yük yalnızca izlenen
+kod nesnelerindedir. Sayaç bağlı değilken hiçbir ek yük yoktur.
+
+Yalnızca hedef fonksiyonun, iç içe tanımlı fonksiyonlarının ve aynı
+modülde çağırdığı yardımcı fonksiyonların kodu sayılır (C ile yazılmış
+heapq, sorted vb. tek çağrı olarak görünür).
+
+Kullanım:
+    from op_counter import count_operations
+
+    result, counts = count_operations(merge_sort, data)
+    print(counts.comparisons, counts.iterations)
+"""
+
+import dis
+import inspect
+import sys
+from dataclasses import dataclass, asdict
+from types import CodeType
+from typing import Any, Callable, Dict, Set, Tuple
+
+HAS_MONITORING = hasattr(sys, 'monitoring')
+BACKEND = 'sys.monitoring' if HAS_MONITORING else 'settrace'
+
+
+@dataclass
+class OperationCounts:
+    """Bayt kodu düzeyinde sayılan işlemler"""
+    comparisons: int = 0
+    subscripts: int = 0
+    calls: int = 0
+    iterations: int = 0
+    instructions: int = 0
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), 'backend': BACKEND}
+
+
+# ========================================
+# KOMUT SINIFLANDIRMA
+# ========================================
+
+# Sayaç dizisindeki indeksler
+_CMP, _SUB, _CALL, _LOOP = 0, 1, 2, 3
+
+_COMPARE_OPS = {'COMPARE_OP', 'IS_OP', 'CONTAINS_OP'}
+_SUBSCRIPT_OPS = {'BINARY_SUBSCR', 'STORE_SUBSCR', 'DELETE_SUBSCR',
+                  'BINARY_SLICE', 'STORE_SLICE'}
+_CALL_OPS = {'CALL', 'CALL_KW', 'CALL_FUNCTION', 'CALL_FUNCTION_KW',
+             'CALL_FUNCTION_EX', 'CALL_METHOD'}
+
+_JUMP_OPCODES = set(dis.hasjrel) | set(dis.hasjabs)
+
+_categories: Dict[CodeType, Dict[int, int]] = {}
+
+
+def _loop_entries(instructions: list) -> Set[int]:
+    """Döngü gövdelerinin ilk komutlarının ofsetleri"""
+    by_offset = {instr.offset: instr for instr in instructions}
+    entries = set()
+    for i, instr in enumerate(instructions):
+        if instr.opname == 'FOR_ITER' and i + 1 < len(instructions):
+            entries.add(instructions[i + 1].offset)
+        elif (instr.opcode in _JUMP_OPCODES and isinstance(instr.argval, int)
+              and instr.argval <= instr.offset
+              and instr.opname != 'JUMP_BACKWARD_NO_INTERRUPT'):  # await/yield from
+            target = by_offset.get(instr.argval)
+            # for döngüsü FOR_ITER'e geri atlar; gövde girişi yukarıda eklendi
+            if target is not None and target.opname != 'FOR_ITER':
+                entries.add(target.offset)
+    return entries
+
+
+def _classify(code: CodeType) -> Dict[int, int]:
+    """Kod nesnesindeki komut ofsetlerini sayaç kategorisine eşle"""
+    table = _categories.get(code)
+    if table is None:
+        table = {}
+        instructions = list(dis.get_instructions(code))
+        for instr in instructions:
+            if instr.opname in _COMPARE_OPS:
+                table[instr.offset] = _CMP
+            elif instr.opname in _SUBSCRIPT_OPS or (
+                    instr.opname == 'BINARY_OP' and instr.argrepr == '[]'):
+                # 3.14+: abonelik BINARY_OP içine taşındı
+                table[instr.offset] = _SUB
+            elif instr.opname in _CALL_OPS:
+                table[instr.offset] = _CALL
+        # Gövde girişi bir işlem komutu da olabilir; o durumda her ikisi sayılır
+        for offset in _loop_entries(instructions):
+            table[offset] = (table[offset], _LOOP) if offset in table else _LOOP
+        _categories[code] = table
+    return table
+
+
+def _count(totals: list, category):
+    if isinstance(category, tuple):
+        for c in category:
+            totals[c] += 1
+    else:
+        totals[category] += 1
+
+
+def collect_code_objects(func: Callable) -> Set[CodeType]:
+    """Fonksiyonun, iç fonksiyonlarının ve aynı modüldeki yardımcılarının kodu"""
+    codes: Set[CodeType] = set()
+    pending = [func]
+    seen_funcs = set()
+    while pending:
+        f = pending.pop()
+        if f in seen_funcs or not inspect.isfunction(f):
+            continue
+        seen_funcs.add(f)
+        stack = [f.__code__]
+        while stack:
+            code = stack.pop()
+            if code in codes:
+                continue
+            codes.add(code)
+            stack.extend(c for c in code.co_consts if isinstance(c, CodeType))
+            for name in code.co_names:
+                target = f.__globals__.get(name)
+                if inspect.isfunction(target) and target.__module__ == f.__module__:
+                    pending.append(target)
+    return codes
+
+
+# ========================================
+# SAYAÇ
+# ========================================
+
+class OperationCounter:
+    """
+    Bağlam yöneticisi olarak kullanılan işlem sayacı
+
+        with OperationCounter(func) as counter:
+            func(data)
+        counter.counts
+    """
+
+    def __init__(self, func: Callable):
+        self.codes = collect_code_objects(func)
+        self.counts = OperationCounts()
+        self._totals = [0, 0, 0, 0]
+        self._instructions = 0
+        self._tool_id = None
+        self._previous_trace = None
+
+    def __enter__(self) -> 'OperationCounter':
+        self._totals = [0, 0, 0, 0]
+        self._instructions = 0
+        if HAS_MONITORING:
+            self._attach_monitoring()
+        else:
+            self._attach_settrace()
+        return self
+
+    def __exit__(self, *exc):
+        if HAS_MONITORING:
+            self._detach_monitoring()
+        else:
+            self._detach_settrace()
+        self.counts = OperationCounts(
+            comparisons=self._totals[_CMP],
+            subscripts=self._totals[_SUB],
+            calls=self._totals[_CALL],
+            iterations=self._totals[_LOOP],
+            instructions=self._instructions
+        )
+
+    # ---------- sys.monitoring (3.12+) ----------
+
+    def _attach_monitoring(self):
+        mon = sys.monitoring
+        for tool_id in (mon.PROFILER_ID, mon.OPTIMIZER_ID, 3, 4):
+            if mon.get_tool(tool_id) is None:
+                self._tool_id = tool_id
+                break
+        else:
+            raise RuntimeError("Boş sys.monitoring araç kimliği yok")
+
+        mon.use_tool_id(self._tool_id, 'op_counter')
+        totals = self._totals
+
+        def on_instruction(code, offset):
+            self._instructions += 1
+            category = _classify(code).get(offset)
+            if category is not None:
+                _count(totals, category)
+
+        events = mon.events
+        mon.register_callback(self._tool_id, events.INSTRUCTION, on_instruction)
+
+        for code in self.codes:
+            _classify(code)
+            mon.set_local_events(self._tool_id, code, events.INSTRUCTION)
+        mon.restart_events()
+
+    def _detach_monitoring(self):
+        mon = sys.monitoring
+        for code in self.codes:
+            mon.set_local_events(self._tool_id, code, 0)
+        mon.free_tool_id(self._tool_id)
+        self._tool_id = None
+
+    # ---------- settrace (yedek) ----------
+
+    def _attach_settrace(self):
+        codes = self.codes
+        totals = self._totals
+
+        def local_tracer_factory(frame):
+            table = _classify(frame.f_code)
+
+            def local_tracer(frame, event, arg):
+                if event == 'opcode':
+                    self._instructions += 1
+                    category = table.get(frame.f_lasti)
+                    if category is not None:
+                        _count(totals, category)
+                return local_tracer
+            return local_tracer
+
+        def global_tracer(frame, event, arg):
+            if event == 'call' and frame.f_code in codes:
+                frame.f_trace_lines = False
+                frame.f_trace_opcodes = True
+                return local_tracer_factory(frame)
+            return None
+
+        self._previous_trace = sys.gettrace()
+        sys.settrace(global_tracer)
+
+    def _detach_settrace(self):
+        sys.settrace(self._previous_trace)
+        self._previous_trace = None
+
+
+def count_operations(func: Callable, *args, **kwargs) -> Tuple[Any, OperationCounts]:
+    """Fonksiyonu sayaç bağlıyken çalıştır; (sonuç, sayımlar) döndür"""
+    counter = OperationCounter(func)
+    with counter:
+        result = func(*args, **kwargs)
+    return result, counter.counts
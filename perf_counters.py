@@ -0,0 +1,347 @@
+"""
+Donanım Performans Sayaçları (Linux perf_event)
+===============================================
+Süre ve joule, iki algoritmanın *neden* farklı tükettiğini söylemez. Bu
+modül ölçülen çağrının çevresinde ctypes ile `perf_event_open` grupları
+açar ve şu sayaçları okur:
+
+    cycles            CPU çevrimleri
+    instructions      emekliye ayrılan makine komutları
+    cache_misses      son seviye önbellek (LLC) ıskaları
+    branch_misses     yanlış tahmin edilen dallanmalar
+    page_faults       sayfa hataları
+    context_switches  bağlam değişimleri
+    task_clock_ms     iş parçacığının CPU'da geçirdiği süre
+
+Donanım olayları (sanal makineler, bazı kapsayıcılar) açılamazsa yalnızca
+yazılım olayları (task-clock, page-faults, context-switches) okunur;
+sonuçta `mode` alanı 'hardware' veya 'software' olur. perf_event_paranoid
+çekirdek olaylarını yasaklıyorsa sayaçlar yalnızca kullanıcı alanında
+açılır (`scope` = 'user').
+
+Sayaçlar yalnızca çağıran iş parçacığını izler; alt süreçlerde (ör.
+johnson_parallel işçileri) yapılan iş sayılmaz. Çoğullama olursa değerler
+time_enabled / time_running oranıyla ölçeklenir (`scaled` = True).
+
+Kullanım:
+    from perf_counters import measure_counters
+
+    result, counters = measure_counters(merge_sort, data)
+    print(counters.instructions, counters.ipc)
+"""
+
+import ctypes
+import errno
+import os
+import platform
+import struct
+import sys
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# ========================================
+# ÇEKİRDEK ARAYÜZÜ
+# ========================================
+
+# perf_event_open sistem çağrısı numarası (mimariye göre)
+_SYSCALL_NUMBERS = {
+    'x86_64': 298, 'amd64': 298,
+    'i386': 336, 'i686': 336,
+    'aarch64': 241, 'arm64': 241, 'riscv64': 241,
+    'armv7l': 364, 'armv6l': 364,
+    'ppc64le': 319, 'ppc64': 319,
+    's390x': 331,
+}
+
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+
+PERF_COUNT_HW_CPU_CYCLES = 0
+PERF_COUNT_HW_INSTRUCTIONS = 1
+PERF_COUNT_HW_CACHE_MISSES = 3
+PERF_COUNT_HW_BRANCH_MISSES = 5
+
+PERF_COUNT_SW_TASK_CLOCK = 1
+PERF_COUNT_SW_PAGE_FAULTS = 2
+PERF_COUNT_SW_CONTEXT_SWITCHES = 3
+
+PERF_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+PERF_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+PERF_FORMAT_GROUP = 1 << 3
+
+PERF_EVENT_IOC_ENABLE = 0x2400
+PERF_EVENT_IOC_DISABLE = 0x2401
+PERF_EVENT_IOC_RESET = 0x2403
+PERF_IOC_FLAG_GROUP = 1
+
+# perf_event_attr bayrak bitleri
+_FLAG_DISABLED = 1 << 0
+_FLAG_EXCLUDE_KERNEL = 1 << 5
+_FLAG_EXCLUDE_HV = 1 << 6
+
+# Grup üyeleri: (alan, tür, yapılandırma); ilk açılan üye lider olur
+HARDWARE_EVENTS = [
+    ('cycles', PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES),
+    ('instructions', PERF_TYPE_HARDWARE, PERF_COUNT_HW_INSTRUCTIONS),
+    ('cache_misses', PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_MISSES),
+    ('branch_misses', PERF_TYPE_HARDWARE, PERF_COUNT_HW_BRANCH_MISSES),
+]
+SOFTWARE_EVENTS = [
+    ('task_clock_ns', PERF_TYPE_SOFTWARE, PERF_COUNT_SW_TASK_CLOCK),
+    ('page_faults', PERF_TYPE_SOFTWARE, PERF_COUNT_SW_PAGE_FAULTS),
+    ('context_switches', PERF_TYPE_SOFTWARE, PERF_COUNT_SW_CONTEXT_SWITCHES),
+]
+
+_READ_FORMAT = (PERF_FORMAT_GROUP | PERF_FORMAT_TOTAL_TIME_ENABLED
+                | PERF_FORMAT_TOTAL_TIME_RUNNING)
+
+
+class _PerfEventAttr(ctypes.Structure):
+    """struct perf_event_attr (PERF_ATTR_SIZE_VER1, 72 bayt)"""
+    _fields_ = [
+        ('type', ctypes.c_uint32),
+        ('size', ctypes.c_uint32),
+        ('config', ctypes.c_uint64),
+        ('sample_period', ctypes.c_uint64),
+        ('sample_type', ctypes.c_uint64),
+        ('read_format', ctypes.c_uint64),
+        ('flags', ctypes.c_uint64),
+        ('wakeup_events', ctypes.c_uint32),
+        ('bp_type', ctypes.c_uint32),
+        ('config1', ctypes.c_uint64),
+        ('config2', ctypes.c_uint64),
+    ]
+
+
+_libc = None
+_syscall_number = _SYSCALL_NUMBERS.get(platform.machine().lower())
+HAS_PERF_EVENTS = sys.platform.startswith('linux') and _syscall_number is not None
+
+if HAS_PERF_EVENTS:
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.syscall.restype = ctypes.c_long
+        _libc.ioctl.argtypes = [ctypes.c_int, ctypes.c_ulong, ctypes.c_ulong]
+    except (OSError, AttributeError):
+        HAS_PERF_EVENTS = False
+
+
+def _perf_event_open(event_type: int, config: int, group_fd: int, flags: int) -> int:
+    """Tek olay aç (pid=0: çağıran iş parçacığı, cpu=-1: tüm CPU'lar)"""
+    attr = _PerfEventAttr()
+    attr.type = event_type
+    attr.size = ctypes.sizeof(_PerfEventAttr)
+    attr.config = config
+    attr.read_format = _READ_FORMAT
+    attr.flags = flags
+    fd = _libc.syscall(_syscall_number, ctypes.byref(attr), 0, -1, group_fd, 0)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return fd
+
+
+# ========================================
+# SONUÇ
+# ========================================
+
+@dataclass
+class HardwareCounters:
+    """Bir çağrı boyunca okunan perf sayaçları (desteklenmeyenler None)"""
+    cycles: Optional[int] = None
+    instructions: Optional[int] = None
+    cache_misses: Optional[int] = None
+    branch_misses: Optional[int] = None
+    page_faults: Optional[int] = None
+    context_switches: Optional[int] = None
+    task_clock_ms: Optional[float] = None
+    mode: str = 'unavailable'  # 'hardware', 'software', 'unavailable'
+    scope: str = ''            # 'user+kernel' veya 'user'
+    scaled: bool = False
+
+    @property
+    def ipc(self) -> Optional[float]:
+        """Çevrim başına komut"""
+        if self.cycles and self.instructions is not None:
+            return self.instructions / self.cycles
+        return None
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), 'ipc': self.ipc}
+
+
+# ========================================
+# OLAY GRUBU
+# ========================================
+
+class _EventGroup:
+    """Aynı anda zamanlanan olaylar (tek lider fd, PERF_FORMAT_GROUP okuma)"""
+
+    def __init__(self, events: List[Tuple[str, int, int]], flags: int):
+        self.names: List[str] = []
+        self.fds: List[int] = []
+        for name, event_type, config in events:
+            leader = self.fds[0] if self.fds else -1
+            try:
+                fd = _perf_event_open(event_type, config, leader,
+                                      flags | (_FLAG_DISABLED if leader == -1 else 0))
+            except OSError as e:
+                if e.errno in (errno.EACCES, errno.EPERM) and not self.fds:
+                    raise
+                # Bu olay desteklenmiyor (ENOENT/EOPNOTSUPP/ENODEV...): atla
+                continue
+            self.fds.append(fd)
+            self.names.append(name)
+        if not self.fds:
+            raise OSError(errno.ENOENT, "Hiçbir olay açılamadı")
+        self._size = 8 * (3 + len(self.fds))
+
+    def start(self):
+        leader = self.fds[0]
+        _libc.ioctl(leader, PERF_EVENT_IOC_RESET, PERF_IOC_FLAG_GROUP)
+        _libc.ioctl(leader, PERF_EVENT_IOC_ENABLE, PERF_IOC_FLAG_GROUP)
+
+    def stop(self) -> Tuple[Dict[str, int], bool]:
+        """Grubu durdur; (değerler, çoğullama ile ölçeklendi mi) döndür"""
+        leader = self.fds[0]
+        _libc.ioctl(leader, PERF_EVENT_IOC_DISABLE, PERF_IOC_FLAG_GROUP)
+        raw = os.read(leader, self._size)
+        nr, enabled, running, *values = struct.unpack(f'{len(raw) // 8}Q', raw)
+        scaled = 0 < running < enabled
+        if scaled:
+            values = [int(v * enabled / running) for v in values]
+        return dict(zip(self.names, values[:nr])), scaled
+
+    def close(self):
+        for fd in self.fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fds = []
+
+
+class PerfCounters:
+    """
+    Yeniden kullanılabilir sayaç grubu
+
+    Olaylar ilk kullanımda bir kez açılır; her ölçümde yalnızca
+    sıfırlama/etkinleştirme ioctl'leri yapılır. Olaylar açan iş parçacığına
+    bağlı olduğundan farklı bir iş parçacığından çağrılırsa yeniden açılır.
+
+        counters = PerfCounters()
+        with counters:
+            func(data)
+        counters.result
+    """
+
+    def __init__(self, hardware: bool = True):
+        self.hardware = hardware
+        self.result = HardwareCounters()
+        self.error: Optional[str] = None
+        self._groups: List[_EventGroup] = []
+        self._scope = ''
+        self._mode = 'unavailable'
+        self._thread = None
+
+    def _open(self):
+        self.close()
+        self._thread = threading.get_ident()
+        self.error = None
+        if not HAS_PERF_EVENTS:
+            self.error = "perf_event_open bu platformda yok"
+            return
+
+        # Önce çekirdek dahil; paranoid ayarı izin vermezse yalnızca kullanıcı
+        for scope, flags in (('user+kernel', 0),
+                             ('user', _FLAG_EXCLUDE_KERNEL | _FLAG_EXCLUDE_HV)):
+            groups = []
+            try:
+                if self.hardware:
+                    try:
+                        groups.append(_EventGroup(HARDWARE_EVENTS, flags))
+                    except OSError as e:
+                        if e.errno in (errno.EACCES, errno.EPERM):
+                            raise
+                        # Donanım olayları yok (sanal makine): yazılım olaylarına düş
+                groups.append(_EventGroup(SOFTWARE_EVENTS, flags))
+            except OSError as e:
+                for group in groups:
+                    group.close()
+                self.error = f"perf_event_open: {e.strerror}"
+                continue
+            self._groups = groups
+            self._scope = scope
+            self._mode = 'hardware' if len(groups) > 1 else 'software'
+            self.error = None
+            return
+
+    def is_available(self) -> bool:
+        if self._thread != threading.get_ident():
+            self._open()
+        return bool(self._groups)
+
+    def __enter__(self) -> 'PerfCounters':
+        if self._thread != threading.get_ident():
+            self._open()
+        # Yazılım grubu önce başlar, sonra durur: donanım penceresini kapsar
+        for group in reversed(self._groups):
+            group.start()
+        return self
+
+    def __exit__(self, *exc):
+        values: Dict[str, int] = {}
+        scaled = False
+        for group in self._groups:
+            group_values, group_scaled = group.stop()
+            values.update(group_values)
+            scaled = scaled or group_scaled
+
+        task_clock_ns = values.pop('task_clock_ns', None)
+        self.result = HardwareCounters(
+            **values,
+            task_clock_ms=task_clock_ns / 1e6 if task_clock_ns is not None else None,
+            mode=self._mode,
+            scope=self._scope,
+            scaled=scaled
+        )
+
+    def get_info(self) -> Dict:
+        return {
+            'available': self.is_available(),
+            'mode': self._mode,
+            'scope': self._scope,
+            'events': [name for group in self._groups for name in group.names],
+            'error': self.error
+        }
+
+    def close(self):
+        for group in self._groups:
+            group.close()
+        self._groups = []
+        self._mode = 'unavailable'
+        self._thread = None
+
+    def __del__(self):
+        self.close()
+
+
+def measure_counters(func: Callable, *args, **kwargs) -> Tuple[Any, HardwareCounters]:
+    """Fonksiyonu sayaçlar açıkken çalıştır; (sonuç, sayaçlar) döndür"""
+    counters = PerfCounters()
+    try:
+        with counters:
+            result = func(*args, **kwargs)
+        return result, counters.result
+    finally:
+        counters.close()
+
+
+if __name__ == '__main__':
+    counters = PerfCounters()
+    print(counters.get_info())
+    with counters:
+        sorted(range(200000, 0, -1))
+    print(counters.result.to_dict())
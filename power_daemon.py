@@ -0,0 +1,532 @@
+"""
+Süreç Dışı Güç Örnekleyici (Paylaşımlı Bellek Halkası)
+======================================================
+RealPowerMeter her ölçümde ölçülen süreçte bir örnekleme iş parçacığı
+başlatır; bu iş parçacığı GIL için algoritmayla yarışır ve tam da ölçülen
+şeyi bozar. Bu modül bunun yerine tek, uzun ömürlü bir örnekleyici süreç
+çalıştırır. Süreç zaman damgalı güç ve frekans okumalarını sürekli olarak
+bir `multiprocessing.shared_memory` halka tamponuna yazar. İstenen sayıda
+ölçüm süreci halkaya bağlanır ve bir zaman penceresinin enerjisini
+halkayı dilimleyerek hesaplar. Ölçüm başına iş parçacığı açılmaz.
+
+Zaman damgaları perf_counter_ns'tir (Linux'ta CLOCK_MONOTONIC, Windows'ta
+QPC): sistem genelidir, süreçler arasında karşılaştırılabilir.
+
+Bellek düzeni (tamamı 8 baytlık hücreler):
+    başlık   [magic, sürüm, kapasite, sütun, aralık_ns, yazılan, pid, dur,
+              son_örnek_ns, ...]  + 48 bayt kaynak adı
+    kayıtlar kapasite x [t_ns, toplam_W, paket_W, çekirdek_W, gpu_W, frekans_MHz]
+
+Tek yazar vardır; yazar kaydı yazdıktan sonra `yazılan` sayacını artırır.
+Okuyucu dilimi kopyaladıktan sonra sayacı yeniden okur ve dilimin üzerine
+yazılmadığını doğrular.
+
+Kaynaklar:
+    rapl   Linux powercap energy_uj sayaçları (güç = enerji farkı / süre)
+    libre  LibreHardwareMonitor WMI sensörleri (Windows)
+
+Kullanım:
+    # Örnekleyiciyi başlat (ayrı terminal veya servis olarak)
+    python power_daemon.py --source rapl --interval 10
+
+    # Ölçüm sürecinde
+    from power_daemon import PowerRingReader
+    reader = PowerRingReader()
+    result = reader.measure_function(merge_sort, data, algorithm_name='merge_sort')
+
+    # veya: RealPowerMeter(shared_ring='eca_power_ring')
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from multiprocessing import Process, shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from real_power_meter import EnergyMeasurement, PowerReading, integrate_trapezoid
+
+
+DEFAULT_RING_NAME = 'eca_power_ring'
+DEFAULT_INTERVAL_MS = 10.0
+DEFAULT_CAPACITY = 65536
+
+_MAGIC = 0x45434150574E5247  # 'ECAPWNRG'
+_VERSION = 1
+
+# Başlık hücreleri
+(_H_MAGIC, _H_VERSION, _H_CAPACITY, _H_COLUMNS, _H_INTERVAL,
+ _H_WRITTEN, _H_PID, _H_STOP, _H_LAST) = range(9)
+_HEADER_CELLS = 10
+_NAME_OFFSET = _HEADER_CELLS * 8
+_NAME_BYTES = 48
+_RECORDS_OFFSET = _NAME_OFFSET + _NAME_BYTES
+
+# Kayıt sütunları
+_T, _TOTAL, _PACKAGE, _CORES, _GPU, _FREQ = range(6)
+_COLUMNS = 6
+
+
+def _ring_size(capacity: int) -> int:
+    return _RECORDS_OFFSET + capacity * _COLUMNS * 8
+
+
+# ========================================
+# GÜÇ KAYNAKLARI
+# ========================================
+
+def _read_frequency_mhz() -> float:
+    """cpu0 anlık frekansı (sysfs), yoksa psutil; okunamazsa 0"""
+    try:
+        with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq', 'rb') as f:
+            return int(f.read()) / 1000
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+        freq = psutil.cpu_freq()
+        return float(freq.current) if freq else 0.0
+    except Exception:
+        return 0.0
+
+
+class _RAPLSource:
+    """powercap sayaç farklarından güç (W)"""
+    name = 'rapl'
+
+    def __init__(self, sysfs_root: Optional[str] = None):
+        from real_energy_meter import RAPLPowercapMeter
+        self.meter = RAPLPowercapMeter(sysfs_root)
+        if not self.meter.is_available():
+            raise RuntimeError(self.meter.get_info()['error'] or "RAPL kullanılamıyor")
+        self._previous = (time.perf_counter_ns(), self.meter._read())
+
+    def read(self) -> Tuple[float, float, float, float]:
+        now = time.perf_counter_ns()
+        values = self.meter._read()
+        then, previous = self._previous
+        self._previous = (now, values)
+        seconds = (now - then) / 1e9
+        if seconds <= 0:
+            return 0.0, 0.0, 0.0, 0.0
+        total = package = cores = gpu = 0.0
+        for zone, b, a in zip(self.meter.zones, previous, values):
+            watts = self.meter._delta_uj(b, a, zone['max_energy_range_uj']) / 1e6 / seconds
+            if zone['in_total']:
+                total += watts
+            if ':' not in zone['id'] and zone['name'].startswith('package'):
+                package += watts
+            elif zone['name'] == 'core':
+                cores += watts
+            elif zone['name'] == 'uncore':
+                gpu += watts  # Tümleşik GPU uncore bölgesindedir
+        return total, package, cores, gpu
+
+
+class _LibreSource:
+    """LibreHardwareMonitor WMI sensörleri"""
+    name = 'libre'
+
+    def __init__(self, sysfs_root: Optional[str] = None):
+        from real_power_meter import RealPowerMeter
+        self.meter = RealPowerMeter()
+        if not self.meter.is_available():
+            raise RuntimeError(self.meter.get_error())
+
+    def read(self) -> Tuple[float, float, float, float]:
+        r = self.meter.read_power()
+        return r.total_power, r.cpu_package, r.cpu_cores, r.gpu_power
+
+
+POWER_SOURCES = {
+    'rapl': _RAPLSource,
+    'libre': _LibreSource,
+}
+
+
+def _default_source() -> str:
+    return 'libre' if sys.platform == 'win32' else 'rapl'
+
+
+# ========================================
+# ÖRNEKLEYİCİ SÜREÇ
+# ========================================
+
+def run_sampler(name: str = DEFAULT_RING_NAME, source: str = None,
+                interval_ms: float = DEFAULT_INTERVAL_MS, capacity: int = DEFAULT_CAPACITY,
+                sysfs_root: Optional[str] = None, ready=None):
+    """
+    Örnekleyici ana döngüsü (ayrı süreçte veya ön planda çalıştırılır)
+
+    Halkayı oluşturur, mutlak son tarihlere göre örnekler ve `dur` bayrağı
+    kurulana ya da SIGTERM/SIGINT gelene kadar yazar; çıkarken halkayı siler.
+    """
+    source = source or _default_source()
+    reader = POWER_SOURCES[source](sysfs_root)
+
+    try:
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_ring_size(capacity))
+    except FileExistsError:
+        # Önceki örnekleyiciden kalan halka: yalnızca sahibi ölmüşse devral
+        stale = shared_memory.SharedMemory(name=name)
+        header = stale.buf[:_NAME_OFFSET].cast('Q')
+        pid = header[_H_PID]
+        header.release()
+        stale.close()
+        if _pid_alive(pid):
+            raise RuntimeError(f"'{name}' halkası zaten çalışan bir örnekleyiciye ait (pid {pid})")
+        stale.unlink()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_ring_size(capacity))
+
+    header = shm.buf[:_NAME_OFFSET].cast('Q')
+    records = shm.buf[_RECORDS_OFFSET:].cast('d')
+    shm.buf[_NAME_OFFSET:_NAME_OFFSET + _NAME_BYTES] = \
+        source.encode()[:_NAME_BYTES].ljust(_NAME_BYTES, b'\0')
+    interval_ns = int(interval_ms * 1e6)
+    header[_H_CAPACITY] = capacity
+    header[_H_COLUMNS] = _COLUMNS
+    header[_H_INTERVAL] = interval_ns
+    header[_H_WRITTEN] = 0
+    header[_H_PID] = os.getpid()
+    header[_H_STOP] = 0
+    header[_H_VERSION] = _VERSION
+    header[_H_MAGIC] = _MAGIC  # En son: okuyucular bundan sonra bağlanabilir
+
+    stopping = []
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            signal.signal(sig, lambda *a: stopping.append(True))
+        except ValueError:
+            pass  # Ana iş parçacığı değil
+
+    if ready is not None:
+        ready.set()
+
+    written = 0
+    deadline = time.perf_counter_ns()
+    try:
+        while not stopping and not header[_H_STOP]:
+            before = time.perf_counter_ns()
+            total, package, cores, gpu = reader.read()
+            freq = _read_frequency_mhz()
+            after = time.perf_counter_ns()
+            t = (before + after) // 2
+
+            i = (written % capacity) * _COLUMNS
+            records[i + _T] = t
+            records[i + _TOTAL] = total
+            records[i + _PACKAGE] = package
+            records[i + _CORES] = cores
+            records[i + _GPU] = gpu
+            records[i + _FREQ] = freq
+            written += 1
+            header[_H_LAST] = t
+            header[_H_WRITTEN] = written  # Kayıt tamamlandıktan sonra yayımla
+
+            deadline += interval_ns
+            now = time.perf_counter_ns()
+            if now > deadline:
+                # Kaçırılan son tarihler atlanır (kayma birikmez)
+                deadline += (now - deadline) // interval_ns * interval_ns + interval_ns
+            time.sleep((deadline - now) / 1e9)
+    finally:
+        header.release()
+        records.release()
+        shm.close()
+        shm.unlink()
+
+
+def _pid_alive(pid: int) -> bool:
+    if not pid:
+        return False
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class PowerSamplerDaemon:
+    """Örnekleyiciyi bu Python sürecinden alt süreç olarak başlat/durdur"""
+
+    def __init__(self, name: str = DEFAULT_RING_NAME, source: str = None,
+                 interval_ms: float = DEFAULT_INTERVAL_MS, capacity: int = DEFAULT_CAPACITY,
+                 sysfs_root: Optional[str] = None):
+        self.name = name
+        self.kwargs = dict(name=name, source=source, interval_ms=interval_ms,
+                           capacity=capacity, sysfs_root=sysfs_root)
+        self.process: Optional[Process] = None
+
+    def start(self, timeout: float = 10.0) -> 'PowerSamplerDaemon':
+        import multiprocessing
+        ready = multiprocessing.Event()
+        self.process = Process(target=run_sampler, kwargs={**self.kwargs, 'ready': ready},
+                               daemon=True, name='power-sampler')
+        self.process.start()
+        # Alt süreç başlangıçta ölürse (ör. kaynak okunamıyor) süre dolmadan çıkılır
+        deadline = time.monotonic() + timeout
+        while not ready.wait(0.05):
+            if not self.process.is_alive():
+                exitcode = self.process.exitcode
+                self.stop()
+                raise RuntimeError(f"Güç örnekleyici başlangıçta sonlandı (çıkış kodu {exitcode}); "
+                                   f"kaynak kullanılamıyor olabilir")
+            if time.monotonic() >= deadline:
+                self.stop()
+                raise RuntimeError("Güç örnekleyici başlatılamadı (zaman aşımı)")
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.process = None
+
+    def __enter__(self) -> 'PowerSamplerDaemon':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ========================================
+# OKUYUCU
+# ========================================
+
+class PowerRingReader:
+    """
+    Çalışan örnekleyicinin halkasına bağlan ve pencere enerjisi hesapla
+
+    Bağlanmak yalnızca paylaşımlı belleği eşler; ölçüm başına iş parçacığı
+    ya da süreç başlatılmaz.
+    """
+
+    def __init__(self, name: str = DEFAULT_RING_NAME):
+        self.name = name
+        self._shm = _attach(name)
+        self._header = self._shm.buf[:_NAME_OFFSET].cast('Q')
+        if self._header[_H_MAGIC] != _MAGIC or self._header[_H_VERSION] != _VERSION:
+            self.close()
+            raise RuntimeError(f"'{name}' geçerli bir güç halkası değil")
+        self.capacity = self._header[_H_CAPACITY]
+        self.interval_ns = self._header[_H_INTERVAL]
+        self.source = bytes(self._shm.buf[_NAME_OFFSET:_NAME_OFFSET + _NAME_BYTES]) \
+            .rstrip(b'\0').decode()
+        self._records = self._shm.buf[_RECORDS_OFFSET:].cast('d')
+
+    def close(self):
+        for view in ('_records', '_header'):
+            mv = getattr(self, view, None)
+            if mv is not None:
+                mv.release()
+                setattr(self, view, None)
+        if getattr(self, '_shm', None) is not None:
+            self._shm.close()
+            self._shm = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def is_alive(self, max_age_intervals: int = 50) -> bool:
+        """Örnekleyici son zamanlarda yazdı mı"""
+        last = self._header[_H_LAST]
+        age = time.perf_counter_ns() - last
+        return last > 0 and age < max(max_age_intervals * self.interval_ns, 1_000_000_000)
+
+    def latest(self) -> PowerReading:
+        """Halkadaki son örnek"""
+        written = self._header[_H_WRITTEN]
+        row = [0.0] * _COLUMNS
+        if written:
+            i = ((written - 1) % self.capacity) * _COLUMNS
+            row = [self._records[i + c] for c in range(_COLUMNS)]
+        return PowerReading(
+            timestamp=time.time(),
+            cpu_package=row[_PACKAGE], cpu_cores=row[_CORES], cpu_platform=0,
+            cpu_memory=0, gpu_power=row[_GPU], total_power=row[_TOTAL]
+        )
+
+    def _time_at(self, k: int) -> float:
+        return self._records[(k % self.capacity) * _COLUMNS + _T]
+
+    def _search(self, oldest: int, count: int, t_ns: int) -> int:
+        """Zamanı t_ns'ten küçük olmayan ilk örneğin göreli indeksi (ikili arama)"""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._time_at(oldest + mid) < t_ns:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def wait_past(self, t_ns: int, timeout: float = 2.0) -> bool:
+        """t_ns'ten sonra alınmış bir örnek yazılana kadar bekle"""
+        deadline = time.perf_counter() + timeout
+        poll = max(self.interval_ns / 4e9, 0.0002)
+        while True:
+            written = self._header[_H_WRITTEN]
+            if written and self._time_at(written - 1) >= t_ns:
+                return True
+            if time.perf_counter() > deadline:
+                return False
+            time.sleep(poll)
+
+    def window(self, start_ns: int, end_ns: int) -> Optional[Dict[str, List[float]]]:
+        """
+        [start_ns, end_ns] penceresini çevreleyen örneklerin kopyası
+
+        Pencere halkadan taşmışsa (üzerine yazılmış) None döner.
+        """
+        records = self._records
+        capacity = self.capacity
+        for _ in range(3):
+            written = self._header[_H_WRITTEN]
+            oldest = max(written - capacity, 0)
+
+            count = written - oldest
+            first = max(self._search(oldest, count, start_ns) - 1, 0)
+            last = min(self._search(oldest, count, end_ns), count - 1)
+            columns = {name: [] for name in ('t', 'total', 'package', 'cores', 'gpu', 'freq')}
+            for k in range(oldest + first, oldest + last + 1):
+                i = (k % capacity) * _COLUMNS
+                for col, name in enumerate(columns):
+                    columns[name].append(records[i + col])
+
+            # Kopyalama sırasında üzerine yazıldı mı
+            if self._header[_H_WRITTEN] - capacity <= oldest + first:
+                if first == 0 and oldest > 0 and columns['t'][0] > start_ns:
+                    return None  # Pencere başı halkadan düşmüş
+                return columns
+        return None
+
+    def energy(self, start_ns: int, end_ns: int) -> Optional[Dict[str, float]]:
+        """Pencerenin kanal enerjileri (J), ortalama güç ve frekans"""
+        columns = self.window(start_ns, end_ns)
+        if not columns or not columns['t']:
+            return None
+        times = columns['t']
+        seconds = (end_ns - start_ns) / 1e9
+
+        def integral(name: str) -> float:
+            return integrate_trapezoid(times, columns[name], start_ns, end_ns) / 1e9
+
+        result = {
+            'energy_joules': integral('total'),
+            'cpu_package_energy': integral('package'),
+            'cpu_cores_energy': integral('cores'),
+            'gpu_energy': integral('gpu'),
+            'max_power_watts': max(columns['total']),
+            'min_power_watts': min(columns['total']),
+            'sample_count': len(times),
+        }
+        result['avg_power_watts'] = result['energy_joules'] / seconds if seconds > 0 \
+            else columns['total'][-1]
+        result['avg_frequency_mhz'] = integral('freq') / seconds if seconds > 0 \
+            else columns['freq'][-1]
+        return result
+
+    def measure_function(self, func: Callable, *args: Any,
+                         algorithm_name: str = "unknown", data_size: int = 0,
+                         **kwargs) -> EnergyMeasurement:
+        """Fonksiyonu çalıştır; enerjiyi halkanın pencere diliminden hesapla"""
+        start_ns = time.perf_counter_ns()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            return _error_measurement(algorithm_name, data_size, f"Fonksiyon hatası: {e}")
+        end_ns = time.perf_counter_ns()
+
+        # Pencereyi kapatan örneği bekle (en fazla bir örnekleme aralığı)
+        if not self.wait_past(end_ns):
+            return _error_measurement(algorithm_name, data_size,
+                                      "Güç örnekleyici yanıt vermiyor")
+        energy = self.energy(start_ns, end_ns)
+        if energy is None:
+            return _error_measurement(algorithm_name, data_size,
+                                      "Ölçüm penceresi halka kapasitesini aştı")
+
+        return EnergyMeasurement(
+            algorithm=algorithm_name,
+            data_size=data_size,
+            execution_time_ms=(end_ns - start_ns) / 1e6,
+            sample_count=energy['sample_count'],
+            sampling_interval_ms=self.interval_ns / 1e6,
+            energy_joules=energy['energy_joules'],
+            cpu_package_energy=energy['cpu_package_energy'],
+            cpu_cores_energy=energy['cpu_cores_energy'],
+            gpu_energy=energy['gpu_energy'],
+            avg_power_watts=energy['avg_power_watts'],
+            max_power_watts=energy['max_power_watts'],
+            min_power_watts=energy['min_power_watts'],
+            measurement_source=f"daemon_{self.source}",
+            is_real_measurement=True,
+            timestamp=datetime.now().isoformat(),
+            success=True,
+            avg_frequency_mhz=energy['avg_frequency_mhz']
+        )
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Halkaya bağlan; okuyucu çıkarken halkayı silmesin"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+        return shm
+
+
+def _error_measurement(algorithm: str, data_size: int, error: str) -> EnergyMeasurement:
+    return EnergyMeasurement(
+        algorithm=algorithm, data_size=data_size, execution_time_ms=0,
+        sample_count=0, sampling_interval_ms=0, energy_joules=0,
+        cpu_package_energy=0, cpu_cores_energy=0, gpu_energy=0,
+        avg_power_watts=0, max_power_watts=0, min_power_watts=0,
+        measurement_source="error", is_real_measurement=False,
+        timestamp=datetime.now().isoformat(), success=False, error_message=error
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Paylaşımlı bellek güç örnekleyicisi')
+    parser.add_argument('--name', type=str, default=DEFAULT_RING_NAME,
+                        help='Paylaşımlı bellek halkasının adı')
+    parser.add_argument('--source', type=str, default=None, choices=list(POWER_SOURCES),
+                        help='Güç kaynağı (varsayılan: Linux rapl, Windows libre)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL_MS,
+                        help='Örnekleme aralığı (ms)')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY,
+                        help='Halka kapasitesi (örnek)')
+    parser.add_argument('--powercap-root', type=str, default=None,
+                        help='RAPL powercap sysfs kökü')
+    args = parser.parse_args()
+
+    print(f"🔋 Güç örnekleyici: {args.name} ({args.source or _default_source()}, "
+          f"{args.interval} ms, {args.capacity} örnek) — durdurmak için Ctrl+C")
+    run_sampler(args.name, args.source, args.interval, args.capacity, args.powercap_root)
+
+
+if __name__ == '__main__':
+    main()
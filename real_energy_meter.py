@@ -1,7 +1,8 @@
 """
 GERÇEK ENERJİ ÖLÇÜM MODÜLÜ
 ===========================
-Bu modül Windows'ta Intel Power Gadget kullanarak GERÇEK enerji ölçümü yapar.
+Bu modül Windows'ta Intel Power Gadget, Linux'ta RAPL powercap sayaçları
+(/sys/class/powercap) kullanarak GERÇEK enerji ölçümü yapar.
 
 KURULUM GEREKSİNİMLERİ:
 1. Intel Power Gadget: 
@@ -19,6 +20,7 @@ KULLANIM:
         print(f"Gerçek Enerji: {result['energy_joules']} J")
 """
 
+import bisect
 import os
 import sys
 import time
@@ -30,8 +32,14 @@ import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, asdict, field
 import ctypes
+import http.client
+from urllib.parse import urlsplit
+
+from resource_usage import ResourceTracker
+from memory_probe import MemoryProbe
 
 
 @dataclass
@@ -62,10 +70,278 @@ class RealEnergyResult:
     success: bool
     error_message: str = ""
     
+    # Alt bölge enerjileri (J); yalnızca RAPL powercap ölçümünde dolu
+    energy_domains: Dict[str, float] = field(default_factory=dict)
+    
+    # CPU süresi, bağlam değişimi, sayfa hatası farkları (bkz. resource_usage.py)
+    resource_usage: Dict = field(default_factory=dict)
+    
+    # measure() süresinden algoritma penceresi çıkarıldığında kalan (ms)
+    measurement_overhead_ms: float = 0.0
+    
+    # Tepe bellek (MB) ve nasıl ölçüldüğü (bkz. memory_probe.MEMORY_METHODS)
+    memory_mb: float = 0.0
+    memory_method: str = 'none'
+    
     def to_dict(self) -> Dict:
         return asdict(self)
 
 
+def _empty_energy_data() -> Dict:
+    return {
+        'energy_joules': 0,
+        'avg_power': 0,
+        'max_power': 0,
+        'min_power': 0,
+        'avg_frequency': 0,
+        'avg_temperature': 0,
+        'avg_utilization': 0,
+        'sample_count': 0
+    }
+
+
+class PowerLogStream:
+    """
+    Intel Power Gadget PowerLog CSV'si için artımlı (akış) ayrıştırıcı
+
+    Dosya baştan okunmaz; her `poll()` yalnızca son okumadan sonra eklenen
+    baytları işler, yarım kalan satır bir sonraki çağrıya bırakılır. Örnek
+    zamanları sabit çözünürlük varsayımıyla değil, "Elapsed Time (sec)"
+    sütunundan alınır. Dosya sonundaki özet satırları ("... = ...")
+    atlanır. Kaydedilmiş CSV dosyaları `parse_power_log` ile aynı yoldan
+    ayrıştırılır.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._offset = 0
+        self._partial = b''
+        self.columns: Optional[Dict[str, Optional[int]]] = None
+        self.elapsed: List[float] = []
+        self.power: List[float] = []
+        self.energy: List[float] = []
+        self.frequency: List[float] = []
+        self.temperature: List[float] = []
+        self.utilization: List[float] = []
+
+    @staticmethod
+    def _find_columns(headers: List[str]) -> Dict[str, Optional[int]]:
+        columns = dict.fromkeys(('elapsed', 'power', 'energy', 'frequency',
+                                 'temperature', 'utilization'))
+        for i, h in enumerate(headers):
+            h = h.lower()
+            if 'elapsed time' in h:
+                columns['elapsed'] = i
+            elif ('processor power' in h or 'package power' in h) and columns['power'] is None:
+                columns['power'] = i
+            elif 'cumulative processor energy' in h and 'joule' in h and columns['energy'] is None:
+                # Aynı enerji mWh olarak da yazılır; yalnızca Joule sütunu alınır
+                columns['energy'] = i
+            elif 'cpu frequency' in h and columns['frequency'] is None:
+                columns['frequency'] = i
+            elif 'package temperature' in h and columns['temperature'] is None:
+                columns['temperature'] = i
+            elif 'cpu utilization' in h:
+                columns['utilization'] = i
+        return columns
+
+    def _feed_line(self, line: str):
+        if not line.strip() or '=' in line:
+            return  # Boş satır veya dosya sonu özeti
+        values = line.split(',')
+        if self.columns is None:
+            if 'Elapsed Time' in line:
+                self.columns = self._find_columns([v.strip() for v in values])
+            return
+        columns = self.columns
+        if columns['elapsed'] is None:
+            return
+        try:
+            row = {name: float(values[i]) if i is not None and i < len(values)
+                   and values[i].strip() else None
+                   for name, i in columns.items()}
+        except ValueError:
+            return
+        if row['elapsed'] is None:
+            return
+        self.elapsed.append(row['elapsed'])
+        for name in ('power', 'energy', 'frequency', 'temperature', 'utilization'):
+            if columns[name] is not None:
+                getattr(self, name).append(row[name] if row[name] is not None else 0.0)
+
+    def feed(self, data: bytes) -> int:
+        """Ham baytları ayrıştır; eklenen örnek sayısını döndür"""
+        before = len(self.elapsed)
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._feed_line(line.decode('utf-8', errors='replace').rstrip('\r'))
+        return len(self.elapsed) - before
+
+    def finish(self) -> int:
+        """Dosya bittiğinde sonda kalan satırı da işle"""
+        before = len(self.elapsed)
+        if self._partial:
+            self._feed_line(self._partial.decode('utf-8', errors='replace').rstrip('\r'))
+            self._partial = b''
+        return len(self.elapsed) - before
+
+    def poll(self) -> int:
+        """Dosyaya son okumadan sonra eklenen kısmı oku"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError:
+            return 0
+        self._offset += len(data)
+        return self.feed(data)
+
+    @property
+    def last_elapsed(self) -> Optional[float]:
+        return self.elapsed[-1] if self.elapsed else None
+
+    def _cumulative(self, t: float) -> float:
+        """t anındaki kümülatif enerji (örnekler arası doğrusal)"""
+        times, energy = self.elapsed, self.energy
+        i = bisect.bisect_left(times, t)
+        if i == 0:
+            return energy[0]
+        if i >= len(times):
+            return energy[-1]
+        t0, t1 = times[i - 1], times[i]
+        if t1 <= t0:
+            return energy[i]
+        return energy[i - 1] + (energy[i] - energy[i - 1]) * (t - t0) / (t1 - t0)
+
+    def window(self, start: float, end: float) -> Dict:
+        """
+        [start, end] (Elapsed Time saniyesi) penceresinin enerjisi ve ortalamaları
+
+        Kümülatif enerji sütunu varsa pencere uçlarında enterpole edilir;
+        yoksa her örneğin gücü önceki örnekten bu yana geçen süreye uygulanır.
+        """
+        times = self.elapsed
+        seconds = end - start
+        if len(times) < 2 or seconds <= 0:
+            return _empty_energy_data()
+
+        # Aralığı (önceki örnek, bu örnek] pencereyle kesişen örnekler
+        first = min(bisect.bisect_right(times, start), len(times) - 1)
+        last = min(bisect.bisect_left(times, end), len(times) - 1)
+        span = slice(first, last + 1)
+
+        if self.energy:
+            energy_joules = self._cumulative(end) - self._cumulative(start)
+        else:
+            # PowerLog gücü her satırda önceki satırdan bu yana ortalama olarak yazar
+            energy_joules = 0.0
+            for i in range(max(first, 1), last + 1):
+                a, b = max(times[i - 1], start), min(times[i], end)
+                if b > a:
+                    energy_joules += self.power[i] * (b - a)
+
+        def mean(values: List[float]) -> float:
+            values = values[span]
+            return sum(values) / len(values) if values else 0
+
+        power = self.power[span]
+        return {
+            'energy_joules': energy_joules,
+            'avg_power': energy_joules / seconds,
+            'max_power': max(power) if power else 0,
+            'min_power': min(power) if power else 0,
+            'avg_frequency': mean(self.frequency),
+            'avg_temperature': mean(self.temperature),
+            'avg_utilization': mean(self.utilization),
+            'sample_count': last - first + 1
+        }
+
+
+def parse_power_log(log_file: str) -> PowerLogStream:
+    """Kaydedilmiş bir PowerLog CSV dosyasını ayrıştır"""
+    stream = PowerLogStream(log_file)
+    stream.poll()
+    stream.finish()
+    return stream
+
+
+class _PowerLogProcess:
+    """
+    Çalışan bir PowerLog süreci ve CSV akışı
+
+    PowerLog zamanları kendi başlangıcına göre "Elapsed Time" olarak yazar.
+    perf_counter ile eşleme, her yeni örnek görüldüğünde
+    `perf_counter() - elapsed` değerinin en küçüğü alınarak kurulur: satır
+    dosyaya yazıldıktan sonra görüldüğü için bu değer gerçek başlangıcın
+    üst sınırıdır ve sık yoklandıkça ona yaklaşır.
+    """
+
+    def __init__(self, exe_path: str, log_file: str, resolution_ms: int, duration_sec: float):
+        self.log_file = log_file
+        self.resolution_ms = resolution_ms
+        self.stream = PowerLogStream(log_file)
+        self.offset = float('inf')
+        # Kabuk olmadan: terminate() doğrudan PowerLog'u durdurur
+        cmd = [exe_path, '-duration', str(duration_sec),
+               '-resolution', str(resolution_ms), '-file', log_file]
+        self.process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+
+    def poll(self) -> int:
+        count = len(self.stream.elapsed)
+        added = self.stream.poll()
+        if added:
+            now = time.perf_counter()
+            for elapsed in self.stream.elapsed[count:]:
+                self.offset = min(self.offset, now - elapsed)
+        return added
+
+    def _poll_until(self, done: Callable[[], bool], timeout: float) -> bool:
+        deadline = time.perf_counter() + timeout
+        interval = max(self.resolution_ms / 4000, 0.002)
+        while True:
+            self.poll()
+            if done():
+                return True
+            if time.perf_counter() > deadline or self.process.poll() is not None:
+                return False
+            time.sleep(interval)
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """İlk örnekler yazılana kadar bekle (zaman eşlemesi için)"""
+        return self._poll_until(lambda: len(self.stream.elapsed) >= 2, timeout)
+
+    def to_elapsed(self, t: float) -> float:
+        """perf_counter zamanını PowerLog Elapsed Time saniyesine çevir"""
+        return t - self.offset
+
+    def wait_past(self, t: float, timeout: float = None) -> bool:
+        """perf_counter zamanı t'yi kapsayan örnek yazılana kadar bekle"""
+        if timeout is None:
+            timeout = 2 * self.resolution_ms / 1000 + 1.0
+        return self._poll_until(
+            lambda: (self.stream.last_elapsed or 0) >= self.to_elapsed(t), timeout)
+
+    def window(self, start: float, end: float) -> Dict:
+        return self.stream.window(self.to_elapsed(start), self.to_elapsed(end))
+
+    def close(self, remove: bool = True):
+        try:
+            self.process.terminate()
+        except Exception:
+            pass
+        if remove:
+            try:
+                os.remove(self.log_file)
+            except OSError:
+                pass
+
+
 class IntelPowerGadgetMeter:
     """
     Intel Power Gadget ile GERÇEK enerji ölçümü
@@ -81,9 +357,13 @@ class IntelPowerGadgetMeter:
         r"C:\Program Files (x86)\Intel\Power Gadget 3.5\PowerLog3.0.exe",
     ]
     
+    # Oturum modunda PowerLog'a verilen süre; stop_session ile erken kapatılır
+    SESSION_DURATION_SEC = 24 * 3600
+    
     def __init__(self):
         self.exe_path = self._find_power_gadget()
         self._temp_dir = tempfile.gettempdir()
+        self._session: Optional[_PowerLogProcess] = None
         
     def _find_power_gadget(self) -> Optional[str]:
         """Intel Power Gadget kurulum yolunu bul"""
@@ -126,75 +406,92 @@ class IntelPowerGadgetMeter:
                 return "3.5"
         return "unknown"
     
+    def start_session(self, resolution_ms: int = 50) -> bool:
+        """
+        Oturum modu: tüm kampanya boyunca tek bir PowerLog çalıştır
+
+        Oturum açıkken measure() yeni süreç başlatmaz ve sabit beklemeler
+        yapmaz; çağrının penceresi akıştan zaman damgasıyla ayrılır.
+        """
+        if not self.is_available():
+            return False
+        if self._session is not None:
+            return True
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        log_file = os.path.join(self._temp_dir, f"power_log_session_{timestamp}.csv")
+        session = _PowerLogProcess(self.exe_path, log_file, resolution_ms,
+                                   self.SESSION_DURATION_SEC)
+        if not session.wait_ready():
+            session.close()
+            return False
+        self._session = session
+        return True
+
+    def stop_session(self):
+        """Oturumu kapat ve log dosyasını sil"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    @property
+    def in_session(self) -> bool:
+        return self._session is not None
+
     def measure(self, func: Callable, *args, 
                 duration_hint_ms: int = 5000,
                 resolution_ms: int = 50,
+                around=None,
                 **kwargs) -> RealEnergyResult:
         """
         Fonksiyonu çalıştırıp GERÇEK enerji tüketimini ölç
         
+        Oturum açıksa (start_session) çalışan PowerLog akışı kullanılır;
+        değilse bu çağrı için bir PowerLog süreci başlatılır.
+        
         Args:
             func: Ölçülecek fonksiyon
-            duration_hint_ms: Tahmini çalışma süresi (ms)
-            resolution_ms: Örnekleme çözünürlüğü (ms)
+            duration_hint_ms: Tahmini çalışma süresi (ms, yalnızca oturumsuz)
+            resolution_ms: Örnekleme çözünürlüğü (ms, yalnızca oturumsuz)
+            around: Zamanlanan pencerenin dışına sarılacak bağlam yöneticisi
+                    (kaynak/bellek izleme; süre ve enerjiye dahil edilmez)
         """
         if not self.is_available():
             return self._create_error_result("Intel Power Gadget kurulu değil")
         
+        if self._session is not None:
+            return self._measure_window(self._session, func, args, kwargs, around)
+        
         # Benzersiz log dosyası oluştur
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         log_file = os.path.join(self._temp_dir, f"power_log_{timestamp}.csv")
         
+        # Tahmini süreyi hesapla (en az 1 saniye)
+        duration_sec = max(duration_hint_ms / 1000, 1)
+        logger = _PowerLogProcess(self.exe_path, log_file, resolution_ms, duration_sec + 2)
+        try:
+            # Power Gadget'ın ilk örnekleri yazmasını bekle
+            if not logger.wait_ready():
+                return self._create_error_result("PowerLog örnek yazmadı")
+            return self._measure_window(logger, func, args, kwargs, around)
+        finally:
+            logger.close()
+    
+    def _measure_window(self, logger: '_PowerLogProcess', func: Callable,
+                        args: tuple, kwargs: Dict, around=None) -> RealEnergyResult:
+        """Çağrıyı çalıştır; penceresini PowerLog akışından zaman damgasıyla ayır"""
         try:
-            # Tahmini süreyi hesapla (en az 1 saniye)
-            duration_sec = max(duration_hint_ms / 1000, 1)
-            
-            # Power Gadget'ı başlat
-            cmd = f'"{self.exe_path}" -duration {duration_sec + 2} -resolution {resolution_ms} -file "{log_file}"'
-            
-            process = subprocess.Popen(
-                cmd, 
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            # Power Gadget'ın başlaması için bekle
-            time.sleep(0.3)
-            
             # ===== FONKSİYONU ÇALIŞTIR =====
-            start_time = time.perf_counter()
-            start_timestamp = datetime.now()
-            
-            result = func(*args, **kwargs)
-            
-            end_time = time.perf_counter()
-            end_timestamp = datetime.now()
+            with around or nullcontext():
+                start_time = time.perf_counter()
+                func(*args, **kwargs)
+                end_time = time.perf_counter()
             execution_time_ms = (end_time - start_time) * 1000
             # ================================
             
-            # Power Gadget'ın durmasını bekle
-            time.sleep(0.5)
-            
-            try:
-                process.terminate()
-            except:
-                pass
-            
-            # Log dosyasını parse et
-            energy_data = self._parse_power_log(
-                log_file, 
-                start_timestamp, 
-                end_timestamp,
-                execution_time_ms
-            )
-            
-            # Temizlik
-            try:
-                os.remove(log_file)
-            except:
-                pass
+            # Pencereyi kapatan örnek yazılana kadar bekle (sabit bekleme yok)
+            if not logger.wait_past(end_time):
+                return self._create_error_result("PowerLog ölçüm penceresini kapatmadı")
+            energy_data = logger.window(start_time, end_time)
             
             return RealEnergyResult(
                 algorithm="measured_function",
@@ -210,165 +507,14 @@ class IntelPowerGadgetMeter:
                 measurement_source='intel_power_gadget',
                 is_real_measurement=True,
                 sample_count=energy_data.get('sample_count', 0),
-                sampling_interval_ms=resolution_ms,
+                sampling_interval_ms=logger.resolution_ms,
                 timestamp=datetime.now().isoformat(),
                 success=True
             )
             
         except Exception as e:
-            # Temizlik
-            try:
-                os.remove(log_file)
-            except:
-                pass
             return self._create_error_result(str(e))
     
-    def _parse_power_log(self, log_file: str, 
-                         start_time: datetime, 
-                         end_time: datetime,
-                         execution_time_ms: float) -> Dict:
-        """
-        Power Gadget CSV log dosyasını parse et ve enerji hesapla
-        """
-        if not os.path.exists(log_file):
-            return self._empty_energy_data()
-        
-        try:
-            # Dosyanın yazılmasını bekle
-            time.sleep(0.2)
-            
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # CSV formatını belirle
-            lines = content.strip().split('\n')
-            if len(lines) < 2:
-                return self._empty_energy_data()
-            
-            # Header'ı bul
-            header_line = None
-            data_start = 0
-            for i, line in enumerate(lines):
-                if 'Elapsed Time' in line or 'System Time' in line:
-                    header_line = line
-                    data_start = i + 1
-                    break
-            
-            if header_line is None:
-                # Alternatif format dene
-                header_line = lines[0]
-                data_start = 1
-            
-            # Sütun indekslerini bul
-            headers = [h.strip() for h in header_line.split(',')]
-            
-            col_indices = {
-                'power': None,
-                'energy': None,
-                'frequency': None,
-                'temperature': None,
-                'utilization': None,
-                'elapsed': None
-            }
-            
-            for i, h in enumerate(headers):
-                h_lower = h.lower()
-                if 'package power' in h_lower or 'processor power' in h_lower:
-                    col_indices['power'] = i
-                elif 'cumulative' in h_lower and 'energy' in h_lower:
-                    col_indices['energy'] = i
-                elif 'frequency' in h_lower and 'average' in h_lower:
-                    col_indices['frequency'] = i
-                elif 'temperature' in h_lower:
-                    col_indices['temperature'] = i
-                elif 'utilization' in h_lower or 'gt utilization' in h_lower:
-                    col_indices['utilization'] = i
-                elif 'elapsed' in h_lower:
-                    col_indices['elapsed'] = i
-            
-            # Verileri oku
-            power_values = []
-            energy_values = []
-            frequency_values = []
-            temperature_values = []
-            utilization_values = []
-            
-            for line in lines[data_start:]:
-                if not line.strip():
-                    continue
-                    
-                values = line.split(',')
-                
-                try:
-                    if col_indices['power'] is not None and col_indices['power'] < len(values):
-                        val = values[col_indices['power']].strip()
-                        if val and val != '':
-                            power_values.append(float(val))
-                    
-                    if col_indices['energy'] is not None and col_indices['energy'] < len(values):
-                        val = values[col_indices['energy']].strip()
-                        if val and val != '':
-                            energy_values.append(float(val))
-                    
-                    if col_indices['frequency'] is not None and col_indices['frequency'] < len(values):
-                        val = values[col_indices['frequency']].strip()
-                        if val and val != '':
-                            frequency_values.append(float(val))
-                    
-                    if col_indices['temperature'] is not None and col_indices['temperature'] < len(values):
-                        val = values[col_indices['temperature']].strip()
-                        if val and val != '':
-                            temperature_values.append(float(val))
-                            
-                except (ValueError, IndexError):
-                    continue
-            
-            # Enerji hesapla
-            if energy_values and len(energy_values) >= 2:
-                # Kümülatif enerjiden hesapla (daha doğru)
-                # Çalışma süresi oranında enerji al
-                total_energy = energy_values[-1] - energy_values[0]
-                total_time = len(energy_values) * 0.05  # 50ms resolution varsayımı
-                
-                # Orantılı hesapla
-                if total_time > 0:
-                    energy_joules = total_energy * (execution_time_ms / 1000) / total_time
-                else:
-                    energy_joules = total_energy
-            elif power_values:
-                # Güç değerlerinden hesapla
-                avg_power = sum(power_values) / len(power_values)
-                energy_joules = avg_power * (execution_time_ms / 1000)
-            else:
-                energy_joules = 0
-            
-            return {
-                'energy_joules': energy_joules,
-                'avg_power': sum(power_values) / len(power_values) if power_values else 0,
-                'max_power': max(power_values) if power_values else 0,
-                'min_power': min(power_values) if power_values else 0,
-                'avg_frequency': sum(frequency_values) / len(frequency_values) if frequency_values else 0,
-                'avg_temperature': sum(temperature_values) / len(temperature_values) if temperature_values else 0,
-                'avg_utilization': sum(utilization_values) / len(utilization_values) if utilization_values else 0,
-                'sample_count': len(power_values)
-            }
-            
-        except Exception as e:
-            print(f"Log parse hatası: {e}")
-            return self._empty_energy_data()
-    
-    def _empty_energy_data(self) -> Dict:
-        return {
-            'energy_joules': 0,
-            'avg_power': 0,
-            'max_power': 0,
-            'min_power': 0,
-            'avg_frequency': 0,
-            'avg_temperature': 0,
-            'avg_utilization': 0,
-            'sample_count': 0
-        }
-    
     def _create_error_result(self, error: str) -> RealEnergyResult:
         return RealEnergyResult(
             algorithm="error",
@@ -434,17 +580,23 @@ class LibreHardwareMonitorMeter:
     LibreHardwareMonitor kurulu ve çalışıyor olmalı
     """
     
+    SOURCE = 'libre_hardware_monitor'
+    
     def __init__(self):
-        self.available = self._check_availability()
         self._wmi = None
+        self.available = self._check_availability()
+    
+    def _connection(self):
+        """WMI bağlantısı bir kez kurulur ve tekrar kullanılır"""
+        if self._wmi is None:
+            import wmi
+            self._wmi = wmi.WMI(namespace="root\\LibreHardwareMonitor")
+        return self._wmi
     
     def _check_availability(self) -> bool:
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
             # Sensör var mı kontrol et
-            sensors = w.Sensor()
-            power_sensors = [s for s in sensors if s.SensorType == 'Power']
+            power_sensors = self._connection().Sensor(SensorType='Power')
             return len(power_sensors) > 0
         except:
             return False
@@ -458,14 +610,9 @@ class LibreHardwareMonitorMeter:
             return {}
             
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-            
-            data = {}
-            for sensor in w.Sensor():
-                if sensor.SensorType == 'Power':
-                    data[sensor.Name] = float(sensor.Value)
-            return data
+            # Yalnızca güç sensörleri sorgulanır (WQL filtresi)
+            return {sensor.Name: float(sensor.Value)
+                    for sensor in self._connection().Sensor(SensorType='Power')}
         except:
             return {}
     
@@ -495,11 +642,8 @@ class LibreHardwareMonitorMeter:
     def get_temperature(self) -> float:
         """CPU sıcaklığını al"""
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-            
-            for sensor in w.Sensor():
-                if sensor.SensorType == 'Temperature' and 'Core' in sensor.Name:
+            for sensor in self._connection().Sensor(SensorType='Temperature'):
+                if 'Core' in sensor.Name:
                     return float(sensor.Value)
         except:
             pass
@@ -507,12 +651,14 @@ class LibreHardwareMonitorMeter:
     
     def measure(self, func: Callable, *args,
                 sampling_interval_ms: int = 50,
+                around=None,
                 **kwargs) -> 'RealEnergyResult':
         """
         Fonksiyonu çalıştırıp LibreHardwareMonitor ile GERÇEK enerji tüketimini ölç
         
         Not: WMI thread-safe olmadığı için, çalıştırma öncesi ve sonrası güç değerleri
-        alınarak ortalama hesaplanır.
+        alınarak ortalama hesaplanır. `around` yalnızca çağrıyı sarar; sensör
+        okumaları onun dışında kalır.
         """
         if not self.available:
             return self._create_error_result("LibreHardwareMonitor kullanılamıyor")
@@ -529,11 +675,12 @@ class LibreHardwareMonitorMeter:
             temp_samples.append(start_temp)
         
         # Fonksiyonu çalıştır
-        start_time = time.perf_counter()
-        try:
-            result = func(*args, **kwargs)
-        finally:
-            end_time = time.perf_counter()
+        with around or nullcontext():
+            start_time = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                end_time = time.perf_counter()
         
         # Bitiş ölçümü
         end_power, _ = self.get_current_power()
@@ -573,7 +720,7 @@ class LibreHardwareMonitorMeter:
             cpu_frequency_mhz=0,
             cpu_temperature_c=avg_temp,
             cpu_utilization=0,
-            measurement_source='libre_hardware_monitor',
+            measurement_source=self.SOURCE,
             is_real_measurement=True,
             sample_count=len(power_samples),
             sampling_interval_ms=sampling_interval_ms,
@@ -603,16 +750,364 @@ class LibreHardwareMonitorMeter:
         )
 
 
+class LibreHardwareMonitorHTTPMeter(LibreHardwareMonitorMeter):
+    """
+    LibreHardwareMonitor web sunucusu (/data.json) ile GERÇEK enerji ölçümü
+    
+    WMI her okumada bağlantı kurup sensörleri listelediği için okuma başına
+    onlarca milisaniye sürer. Bu sınıf LHM'nin dahili web sunucusuna
+    (Options → Remote Web Server → Run) tek bir kalıcı HTTP/1.1 bağlantısı
+    tutar. Sensör ağacındaki güç ve CPU sıcaklığı düğümlerinin yolları
+    (çocuk indeksleri) ilk okumada bir kez çözülür; sonraki okumalarda
+    ağaç aranmaz, yalnızca bu düğümlerin değerleri ayrıştırılır. Yoldaki
+    düğümün adı eşleşmezse (donanım eklendi/çıkarıldı) yollar yeniden çözülür.
+    """
+    
+    SOURCE = 'libre_hardware_monitor_http'
+    DEFAULT_URL = 'http://localhost:8085/data.json'
+    TIMEOUT_SEC = 0.5
+    
+    def __init__(self, url: Optional[str] = None):
+        parts = urlsplit(url or self.DEFAULT_URL)
+        self.url = url or self.DEFAULT_URL
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or 80
+        self.path = parts.path or '/data.json'
+        self._conn: Optional[http.client.HTTPConnection] = None
+        # Sensör adı -> ağaçtaki çocuk indeksleri yolu
+        self._power_paths: Dict[str, Tuple[int, ...]] = {}
+        self._temperature_path: Optional[Tuple[str, Tuple[int, ...]]] = None
+        super().__init__()
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self.host, self.port,
+                                                    timeout=self.TIMEOUT_SEC)
+        return self._conn
+    
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _fetch(self) -> Optional[Dict]:
+        """data.json'u kalıcı bağlantı üzerinden al (kopmuşsa bir kez yeniden bağlan)"""
+        for _ in range(2):
+            try:
+                conn = self._connection()
+                conn.request('GET', self.path)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                self.close()
+                continue
+            if response.will_close:
+                self.close()
+            if response.status != 200:
+                return None
+            try:
+                return json.loads(body)
+            except ValueError:
+                return None
+        return None
+    
+    @staticmethod
+    def _parse_value(text: str) -> Optional[float]:
+        """'25.3 W', '45,0 °C' -> sayı (ondalık virgül yerel ayara bağlı)"""
+        try:
+            return float(text.split()[0].replace(',', '.'))
+        except (AttributeError, IndexError, ValueError):
+            return None
+    
+    def _resolve(self, tree: Dict) -> bool:
+        """Güç ve CPU sıcaklığı sensörlerinin ağaç yollarını bul"""
+        power_paths = {}
+        temperatures = []
+        
+        def walk(node: Dict, path: Tuple[int, ...], group: str):
+            children = node.get('Children') or []
+            if not children:
+                # Yeni sürümler 'Type' alanı yazar; eskilerde grup düğümü adı
+                kind = node.get('Type') or group
+                name = node.get('Text', '')
+                if kind in ('Power', 'Powers'):
+                    power_paths.setdefault(name, path)
+                elif kind in ('Temperature', 'Temperatures'):
+                    temperatures.append((name, path))
+                return
+            for i, child in enumerate(children):
+                walk(child, path + (i,), node.get('Text', ''))
+        
+        walk(tree, (), '')
+        self._power_paths = power_paths
+        # Öncelik: CPU Package, sonra ilk 'Core' sensörü (WMI yoluyla aynı)
+        self._temperature_path = next(
+            (t for t in temperatures if t[0] == 'CPU Package'),
+            next((t for t in temperatures if 'Core' in t[0]), None))
+        return bool(power_paths)
+    
+    @staticmethod
+    def _node(tree: Dict, path: Tuple[int, ...], name: str) -> Optional[Dict]:
+        node = tree
+        try:
+            for i in path:
+                node = node['Children'][i]
+        except (KeyError, IndexError, TypeError):
+            return None
+        return node if node.get('Text') == name else None
+    
+    def _read_power(self, tree: Dict) -> Optional[Dict]:
+        data = {}
+        for name, path in self._power_paths.items():
+            node = self._node(tree, path, name)
+            if node is None:
+                return None
+            value = self._parse_value(node.get('Value'))
+            if value is not None:
+                data[name] = value
+        return data
+    
+    def _check_availability(self) -> bool:
+        tree = self._fetch()
+        return tree is not None and self._resolve(tree)
+    
+    def get_power_data(self) -> Dict:
+        """Çözülmüş güç sensörlerinin değerleri (W)"""
+        if not self.available:
+            return {}
+        tree = self._fetch()
+        if tree is None:
+            return {}
+        data = self._read_power(tree)
+        if data is None and self._resolve(tree):
+            data = self._read_power(tree)
+        return data or {}
+    
+    def get_temperature(self) -> float:
+        """CPU sıcaklığını al"""
+        if self._temperature_path is None:
+            return 0.0
+        tree = self._fetch()
+        if tree is None:
+            return 0.0
+        name, path = self._temperature_path
+        node = self._node(tree, path, name)
+        if node is None and self._resolve(tree) and self._temperature_path:
+            name, path = self._temperature_path
+            node = self._node(tree, path, name)
+        value = self._parse_value(node.get('Value')) if node else None
+        return value or 0.0
+
+
+class RAPLPowercapMeter:
+    """
+    Linux powercap (RAPL) sayaçlarıyla GERÇEK enerji ölçümü
+    
+    /sys/class/powercap/intel-rapl:* bölgelerinin (package, core, uncore,
+    dram) energy_uj sayaçları çağrıdan hemen önce ve hemen sonra okunur.
+    Dosyalar bir kez açılır ve os.pread ile okunur; ölçüm başına ek yük
+    birkaç sistem çağrısıdır (milisaniyenin çok altında), çözünürlük
+    mikrojouldür (donanım sayaçları ~1 ms'de bir güncellenir).
+    
+    Sayaç max_energy_range_uj değerinde başa sarar; tek sarma düzeltilir.
+    (Sarma süresi tipik olarak dakikalar mertebesindedir, tek bir ölçümde
+    iki kez sarması beklenmez.)
+    
+    sysfs_root, testlerde sahte bir dizin ağacı göstermek için
+    değiştirilebilir. energy_uj genellikle yalnızca root tarafından
+    okunabilir.
+    """
+    
+    DEFAULT_ROOT = '/sys/class/powercap'
+    ZONE_PREFIX = 'intel-rapl:'
+    
+    def __init__(self, sysfs_root: Optional[str] = None):
+        self.sysfs_root = Path(sysfs_root or self.DEFAULT_ROOT)
+        self.zones = self._discover_zones()
+        self._fds: Optional[List[int]] = None
+        self._error: Optional[str] = None if self.zones else "powercap RAPL bölgesi bulunamadı"
+        if self.zones:
+            try:
+                self._open()
+            except (OSError, ValueError) as e:
+                self._error = f"energy_uj okunamıyor: {e}"
+    
+    def _discover_zones(self) -> List[Dict]:
+        """Okunabilir enerji sayacı olan RAPL bölgelerini listele"""
+        zones = []
+        try:
+            entries = sorted(self.sysfs_root.glob(self.ZONE_PREFIX + '*'))
+        except OSError:
+            return zones
+        for zone_dir in entries:
+            energy_file = zone_dir / 'energy_uj'
+            if not energy_file.exists():
+                continue
+            zone_id = zone_dir.name[len(self.ZONE_PREFIX):]
+            try:
+                name = (zone_dir / 'name').read_text().strip()
+            except OSError:
+                name = zone_id
+            try:
+                max_range = int((zone_dir / 'max_energy_range_uj').read_text())
+            except (OSError, ValueError):
+                max_range = 0
+            # intel-rapl:0 -> paket, intel-rapl:0:1 -> paketin alt bölgesi
+            parent = zone_id.split(':')[0]
+            is_subzone = ':' in zone_id
+            label = f"package-{parent}/{name}" if is_subzone else name
+            zones.append({
+                'id': zone_id,
+                'name': name,
+                'label': label,
+                'path': str(energy_file),
+                'max_energy_range_uj': max_range,
+                # Toplam = paketler + dram (core/uncore paketin içindedir)
+                'in_total': (not is_subzone and name != 'psys') or name == 'dram'
+            })
+        return zones
+    
+    def _open(self):
+        fds = []
+        try:
+            for zone in self.zones:
+                fds.append(os.open(zone['path'], os.O_RDONLY))
+            # İzin hatası (root olmayan kullanıcı) ilk okumada ortaya çıkar
+            for fd in fds:
+                int(os.pread(fd, 32, 0))
+        except (OSError, ValueError):
+            for fd in fds:
+                os.close(fd)
+            raise
+        self._fds = fds
+    
+    def _read(self) -> List[int]:
+        return [int(os.pread(fd, 32, 0)) for fd in self._fds]
+    
+    def close(self):
+        if self._fds:
+            for fd in self._fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._fds = None
+    
+    def __del__(self):
+        self.close()
+    
+    def is_available(self) -> bool:
+        return self._fds is not None
+    
+    def get_info(self) -> Dict:
+        return {
+            'available': self.is_available(),
+            'sysfs_root': str(self.sysfs_root),
+            'zones': [z['label'] for z in self.zones],
+            'error': self._error
+        }
+    
+    def _delta_uj(self, before: int, after: int, max_range: int) -> int:
+        delta = after - before
+        if delta < 0 and max_range:
+            delta += max_range
+        return max(delta, 0)
+    
+    def measure(self, func: Callable, *args, around=None, **kwargs) -> RealEnergyResult:
+        """
+        Fonksiyonu çalıştırıp sayaç farklarından enerjiyi hesapla
+        
+        Sayaçlar çağrının hemen önünde ve arkasında okunur; `around`
+        (kaynak/bellek izleme) bu okumaların dışına sarılır.
+        """
+        if not self.is_available():
+            return self._create_error_result(self._error or "RAPL kullanılamıyor")
+        
+        read = self._read
+        with around or nullcontext():
+            before = read()
+            start_time = time.perf_counter()
+            func(*args, **kwargs)
+            end_time = time.perf_counter()
+            after = read()
+        
+        execution_time_ms = (end_time - start_time) * 1000
+        domains = {}
+        total_uj = 0
+        for zone, b, a in zip(self.zones, before, after):
+            delta = self._delta_uj(b, a, zone['max_energy_range_uj'])
+            domains[zone['label']] = delta / 1e6
+            if zone['in_total']:
+                total_uj += delta
+        
+        energy_joules = total_uj / 1e6
+        seconds = execution_time_ms / 1000
+        avg_power = energy_joules / seconds if seconds > 0 else 0
+        
+        return RealEnergyResult(
+            algorithm="measured_function",
+            data_size=0,
+            execution_time_ms=execution_time_ms,
+            energy_joules=energy_joules,
+            avg_power_watts=avg_power,
+            max_power_watts=avg_power,
+            min_power_watts=avg_power,
+            cpu_frequency_mhz=0,
+            cpu_temperature_c=0,
+            cpu_utilization=0,
+            measurement_source='rapl_powercap',
+            is_real_measurement=True,
+            sample_count=2,
+            sampling_interval_ms=execution_time_ms,
+            timestamp=datetime.now().isoformat(),
+            success=True,
+            energy_domains=domains
+        )
+    
+    def _create_error_result(self, error: str) -> RealEnergyResult:
+        return RealEnergyResult(
+            algorithm="error",
+            data_size=0,
+            execution_time_ms=0,
+            energy_joules=0,
+            avg_power_watts=0,
+            max_power_watts=0,
+            min_power_watts=0,
+            cpu_frequency_mhz=0,
+            cpu_temperature_c=0,
+            cpu_utilization=0,
+            measurement_source='error',
+            is_real_measurement=False,
+            sample_count=0,
+            sampling_interval_ms=0,
+            timestamp=datetime.now().isoformat(),
+            success=False,
+            error_message=error
+        )
+
+
 class RealEnergyMeter:
     """
     Ana enerji ölçüm sınıfı
     En iyi mevcut yöntemi otomatik seçer
     """
     
-    def __init__(self):
+    def __init__(self, powercap_root: Optional[str] = None, memory_method: str = 'none',
+                 lhm_url: Optional[str] = None):
+        """
+        Args:
+            powercap_root: RAPL powercap sysfs kökü (varsayılan /sys/class/powercap)
+            lhm_url: LibreHardwareMonitor web sunucusu data.json adresi
+                     (varsayılan http://localhost:8085/data.json)
+            memory_method: Bellek yöntemi (bkz. memory_probe.MEMORY_METHODS);
+                           'tracemalloc' ayrı geçiştir, çağıran measure_memory ile ekler
+        """
         self.intel_meter = IntelPowerGadgetMeter()
+        self.rapl_meter = RAPLPowercapMeter(powercap_root)
         self.wmi_meter = WMIPowerMeter()
+        self.libre_http_meter = LibreHardwareMonitorHTTPMeter(lhm_url)
         self.libre_meter = LibreHardwareMonitorMeter()
+        self.memory = MemoryProbe(memory_method)
         
         self._select_best_method()
     
@@ -621,6 +1116,12 @@ class RealEnergyMeter:
         if self.intel_meter.is_available():
             self.primary_meter = self.intel_meter
             self.method = 'intel_power_gadget'
+        elif self.rapl_meter.is_available():
+            self.primary_meter = self.rapl_meter
+            self.method = 'rapl_powercap'
+        elif self.libre_http_meter.is_available():
+            self.primary_meter = self.libre_http_meter
+            self.method = 'libre_hardware_monitor_http'
         elif self.libre_meter.is_available():
             self.primary_meter = self.libre_meter
             self.method = 'libre_hardware_monitor'
@@ -633,18 +1134,43 @@ class RealEnergyMeter:
     
     def is_available(self) -> bool:
         """Gerçek ölçüm kullanılabilir mi?"""
-        return self.method in ('intel_power_gadget', 'libre_hardware_monitor')
+        return self.method in ('intel_power_gadget', 'rapl_powercap',
+                               'libre_hardware_monitor_http', 'libre_hardware_monitor')
     
     def get_method(self) -> str:
         """Kullanılan ölçüm yöntemini döndür"""
         return self.method
     
+    @contextmanager
+    def session(self, resolution_ms: int = 50):
+        """
+        Kampanya boyunca tek PowerLog oturumu (Intel Power Gadget dışında etkisiz)
+        
+        Oturum açılamazsa ölçümler çağrı başına PowerLog moduna düşer.
+        """
+        started = (self.method == 'intel_power_gadget'
+                   and self.intel_meter.start_session(resolution_ms))
+        try:
+            yield self
+        finally:
+            if started:
+                self.intel_meter.stop_session()
+    
     def get_status(self) -> Dict:
         """Ölçüm durumu bilgisi"""
         return {
             'intel_power_gadget': {
                 'available': self.intel_meter.is_available(),
-                'info': self.intel_meter.get_info()
+                'info': self.intel_meter.get_info(),
+                'session': self.intel_meter.in_session
+            },
+            'rapl_powercap': {
+                'available': self.rapl_meter.is_available(),
+                'info': self.rapl_meter.get_info()
+            },
+            'libre_hardware_monitor_http': {
+                'available': self.libre_http_meter.is_available(),
+                'url': self.libre_http_meter.url
             },
             'libre_hardware_monitor': {
                 'available': self.libre_meter.is_available()
@@ -681,14 +1207,32 @@ class RealEnergyMeter:
                 sampling_interval_ms=0,
                 timestamp=datetime.now().isoformat(),
                 success=False,
-                error_message="Gerçek ölçüm için Intel Power Gadget veya LibreHardwareMonitor gerekli"
+                error_message="Gerçek ölçüm için Intel Power Gadget, Linux RAPL (powercap) "
+                              "veya LibreHardwareMonitor gerekli"
             )
         
+        measure_start = time.perf_counter()
+        
+        # Kaynak ve bellek penceresi ölçülen çağrıyı sarar, ancak yöntemlerin
+        # zamanlama ve sayaç okumalarının dışında kalır: anlık görüntüler ve
+        # clear_refs/VmHWM G/Ç'si algoritma enerjisine yazılmaz
+        tracker = ResourceTracker()
+        memory_window = self.memory.window()
+        
+        @contextmanager
+        def around():
+            with memory_window, tracker:
+                yield
+        
         # Kullanılabilir yönteme göre ölçüm yap
         if self.method == 'intel_power_gadget':
-            result = self.intel_meter.measure(func, *args, **kwargs)
+            result = self.intel_meter.measure(func, *args, around=around(), **kwargs)
+        elif self.method == 'rapl_powercap':
+            result = self.rapl_meter.measure(func, *args, around=around(), **kwargs)
+        elif self.method == 'libre_hardware_monitor_http':
+            result = self.libre_http_meter.measure(func, *args, around=around(), **kwargs)
         elif self.method == 'libre_hardware_monitor':
-            result = self.libre_meter.measure(func, *args, **kwargs)
+            result = self.libre_meter.measure(func, *args, around=around(), **kwargs)
         else:
             return RealEnergyResult(
                 algorithm=algorithm_name,
@@ -712,8 +1256,21 @@ class RealEnergyMeter:
         
         result.algorithm = algorithm_name
         result.data_size = data_size
+        usage = tracker.result
+        result.resource_usage = usage.to_dict()
+        result.memory_mb = memory_window.peak_mb or 0.0
+        result.memory_method = self.memory.method
+        if not result.cpu_utilization and usage.cpu_percent is not None:
+            # Yöntem kullanım bildirmiyorsa pencerenin CPU süresi farkından
+            result.cpu_utilization = usage.cpu_percent
+        window_ms = result.execution_time_ms
+        result.measurement_overhead_ms = (time.perf_counter() - measure_start) * 1000 - window_ms
         
         return result
+    
+    def measure_memory(self, func: Callable, *args) -> Optional[float]:
+        """Ayrı bellek geçişi (memory_method='tracemalloc'); diğerlerinde None"""
+        return self.memory.measure_pass(func, *args)
 
 
 def check_system_status():
@@ -738,6 +1295,19 @@ def check_system_status():
         print(f"  ❌ Intel Power Gadget: KURULU DEĞİL")
         print(f"     İndirme: https://www.intel.com/content/www/us/en/developer/articles/tool/power-gadget.html")
     
+    # Linux RAPL (powercap)
+    rapl = status['rapl_powercap']
+    if rapl['available']:
+        print(f"\n  ✅ Linux RAPL (powercap): MEVCUT")
+        print(f"     Bölgeler: {', '.join(rapl['info']['zones'])}")
+    else:
+        print(f"\n  ❌ Linux RAPL (powercap): {rapl['info']['error']}")
+    
+    # LibreHardwareMonitor web sunucusu
+    lhm_http = status['libre_hardware_monitor_http']
+    print(f"\n  {'✅' if lhm_http['available'] else '❌'} LibreHardwareMonitor HTTP: "
+          f"{lhm_http['url']}")
+    
     # LibreHardwareMonitor
     lhm = status['libre_hardware_monitor']
     print(f"\n  {'✅' if lhm['available'] else '❌'} LibreHardwareMonitor: {'KURULU' if lhm['available'] else 'KURULU DEĞİL'}")
@@ -755,6 +1325,8 @@ def check_system_status():
         print("\n⚠️  GERÇEK ÖLÇÜM İÇİN:")
         print("    Intel Power Gadget'ı indirin ve kurun:")
         print("    https://www.intel.com/content/www/us/en/developer/articles/tool/power-gadget.html")
+        print("    Linux'ta /sys/class/powercap/intel-rapl:*/energy_uj okunabilir olmalı")
+        print("    (ör. root olarak çalıştırın)")
         print()
     
     return status
@@ -9,6 +9,15 @@ GEREKSİNİMLER:
 2. Yönetici olarak çalıştırılmalı
 3. Python paketleri: pip install wmi pywin32
 
+ÖRNEKLEME:
+    Örnekleyici mutlak monoton son tarihlere (t0 + k·aralık) göre uyur;
+    okuma süresi aralığa eklenmediği için kayma birikmez. Örnekler
+    perf_counter_ns zaman damgalarıyla önceden ayrılmış bir array('d')
+    halka tamponuna yazılır. Enerji, örnekler arasında doğrusal güç
+    varsayımıyla trapez kuralıyla ve tam olarak çağrının [başlangıç, bitiş]
+    penceresine kırpılarak hesaplanır; pencere, çağrıdan hemen önce ve
+    hemen sonra alınan örneklerle çevrelenir.
+
 KULLANIM:
     from real_power_meter import RealPowerMeter, measure_energy
     
@@ -21,6 +30,7 @@ import sys
 import time
 import json
 import threading
+from array import array
 from datetime import datetime
 from typing import Callable, Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -66,27 +76,140 @@ class EnergyMeasurement:
     timestamp: str
     success: bool
     error_message: str = ""
+    dropped_samples: int = 0        # Halka taşınca üzerine yazılan örnekler
+    avg_frequency_mhz: float = 0.0  # Ortalama CPU frekansı (örnekleyici süreç)
     
     def to_dict(self) -> Dict:
         return asdict(self)
 
 
+# Halka tamponundaki örnek sütunları
+_T, _TOTAL, _PACKAGE, _CORES, _GPU = range(5)
+_COLUMNS = 5
+
+
+class SampleRing:
+    """
+    Güç örnekleri için önceden ayrılmış halka tampon
+    
+    Her örnek array('d') içinde 5 ardışık değerdir: zaman (ns, ölçüm
+    başlangıcına göre), toplam, paket, çekirdek ve GPU gücü (W). Örnek
+    başına nesne oluşturulmaz; kapasite aşılırsa en eski örneklerin
+    üzerine yazılır.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = array('d', bytes(8 * _COLUMNS * capacity))
+        self.count = 0  # Toplam yazılan örnek (üzerine yazılanlar dahil)
+    
+    def clear(self):
+        self.count = 0
+    
+    def append(self, t: float, total: float, package: float, cores: float, gpu: float):
+        i = (self.count % self.capacity) * _COLUMNS
+        data = self.data
+        data[i] = t
+        data[i + 1] = total
+        data[i + 2] = package
+        data[i + 3] = cores
+        data[i + 4] = gpu
+        self.count += 1
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    @property
+    def dropped(self) -> int:
+        return max(self.count - self.capacity, 0)
+    
+    def column(self, col: int) -> List[float]:
+        """Bir sütunu zaman sırasıyla döndür"""
+        n = len(self)
+        first = self.count - n
+        return [self.data[((first + k) % self.capacity) * _COLUMNS + col] for k in range(n)]
+
+
+def integrate_trapezoid(times: List[float], values: List[float],
+                        start: float, end: float) -> float:
+    """
+    Parçalı doğrusal sinyalin [start, end] aralığındaki integrali
+    
+    Aralık sınırları örnekler arasına düşerse değer doğrusal
+    enterpolasyonla bulunur; aralık ilk/son örneğin dışına taşarsa
+    uçtaki değer sabit kabul edilir.
+    """
+    n = len(times)
+    if n == 0 or end <= start:
+        return 0.0
+    if n == 1:
+        return values[0] * (end - start)
+    
+    def value_at(t: float, i: int) -> float:
+        # times[i] <= t <= times[i+1]
+        t0, t1 = times[i], times[i + 1]
+        if t1 == t0:
+            return values[i + 1]
+        return values[i] + (values[i + 1] - values[i]) * (t - t0) / (t1 - t0)
+    
+    total = 0.0
+    # Uçlardan taşan kısımlar (sabit güç)
+    if start < times[0]:
+        total += values[0] * (min(end, times[0]) - start)
+    if end > times[-1]:
+        total += values[-1] * (end - max(start, times[-1]))
+    
+    for i in range(n - 1):
+        t0, t1 = times[i], times[i + 1]
+        a, b = max(t0, start), min(t1, end)
+        if b <= a:
+            continue
+        total += (value_at(a, i) + value_at(b, i)) * (b - a) / 2
+    return total
+
+
 class RealPowerMeter:
     """
     LibreHardwareMonitor kullanarak GERÇEK güç ölçümü yapan sınıf
     """
     
-    def __init__(self, sampling_interval_ms: int = 100):
+    def __init__(self, sampling_interval_ms: int = 100, ring_capacity: int = 65536,
+                 shared_ring: Optional[str] = None):
         """
         Args:
             sampling_interval_ms: Örnekleme aralığı (milisaniye)
+            ring_capacity: Halka tampon kapasitesi (örnek)
+            shared_ring: Çalışan power_daemon halkasının adı; verilirse ölçüm
+                         süreç içi iş parçacığı yerine halkadan hesaplanır
         """
         self.sampling_interval_ms = sampling_interval_ms
+        self.ring = SampleRing(ring_capacity)
         self.wmi_connection = None
+        self.shared_ring = None
         self._available = False
         self._error_message = ""
         
-        self._connect()
+        if shared_ring:
+            self._attach(shared_ring)
+        else:
+            self._connect()
+    
+    def _attach(self, name: str):
+        """power_daemon halkasına bağlan"""
+        try:
+            from power_daemon import PowerRingReader
+            self.shared_ring = PowerRingReader(name)
+        except FileNotFoundError:
+            self._error_message = f"'{name}' halkası bulunamadı. power_daemon.py çalışıyor mu?"
+            return
+        except Exception as e:
+            self._error_message = f"Halka bağlantı hatası: {str(e)}"
+            return
+        if not self.shared_ring.is_alive():
+            self._error_message = "Güç örnekleyici yanıt vermiyor"
+            return
+        self.sampling_interval_ms = self.shared_ring.interval_ns / 1e6
+        self._available = True
     
     def _connect(self):
         """WMI bağlantısını kur"""
@@ -142,7 +265,12 @@ class RealPowerMeter:
                 cpu_package=0, cpu_cores=0, cpu_platform=0,
                 cpu_memory=0, gpu_power=0, total_power=0
             )
+        if self.shared_ring is not None:
+            return self.shared_ring.latest()
         
+        return self._read_sensors()
+    
+    def _read_sensors(self) -> PowerReading:
         sensors = self.wmi_connection.Sensor()
         
         reading = PowerReading(
@@ -192,76 +320,103 @@ class RealPowerMeter:
         """
         if not self._available:
             return self._create_error_result(algorithm_name, data_size, self._error_message)
+        if self.shared_ring is not None:
+            return self.shared_ring.measure_function(
+                func, *args, algorithm_name=algorithm_name, data_size=data_size, **kwargs)
         
-        # Örnekleme için değişkenler
-        power_samples: List[PowerReading] = []
-        sampling_active = True
+        ring = self.ring
+        ring.clear()
+        origin = time.perf_counter_ns()
+        interval_ns = int(self.sampling_interval_ms * 1e6)
+        stop = threading.Event()
+        first_sample = threading.Event()
+        errors: List[Exception] = []
+        
+        def record():
+            # Zaman damgası okumanın ortası (WMI sorgusu milisaniyeler sürebilir)
+            before = time.perf_counter_ns()
+            reading = self._read_sensors()
+            after = time.perf_counter_ns()
+            ring.append((before + after) / 2 - origin, reading.total_power,
+                        reading.cpu_package, reading.cpu_cores, reading.gpu_power)
         
         def sample_power():
-            """Arka planda güç örneklemesi yap"""
-            while sampling_active:
-                reading = self.read_power()
-                power_samples.append(reading)
-                time.sleep(self.sampling_interval_ms / 1000)
+            """Mutlak son tarihlere göre örnekleme (kayma birikmez)"""
+            try:
+                record()
+            except Exception as e:
+                errors.append(e)
+                return
+            finally:
+                # Sensör hatasında da ana thread beklemede kalmamalı
+                first_sample.set()
+            deadline = origin
+            while True:
+                deadline += interval_ns
+                now = time.perf_counter_ns()
+                if now > deadline:
+                    # Gecikmede kaçırılan son tarihler atlanır, art arda okunmaz
+                    deadline += (now - deadline) // interval_ns * interval_ns + interval_ns
+                if stop.wait((deadline - now) / 1e9):
+                    break
+                try:
+                    record()
+                except Exception as e:
+                    errors.append(e)
+                    break
         
-        # Örnekleme thread'ini başlat
+        # Örnekleme thread'ini başlat; pencere ilk örnekle çevrelenir
         sampler_thread = threading.Thread(target=sample_power, daemon=True)
         sampler_thread.start()
+        first_sample.wait()
+        if errors:
+            sampler_thread.join()
+            return self._create_error_result(algorithm_name, data_size,
+                                             f"Sensör okuma hatası: {errors[0]}")
         
         # ===== FONKSİYONU ÇALIŞTIR =====
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
         except Exception as e:
-            sampling_active = False
+            stop.set()
+            sampler_thread.join()
             return self._create_error_result(algorithm_name, data_size, f"Fonksiyon hatası: {e}")
         
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_ns = time.perf_counter_ns()
+        execution_time_ms = (end_ns - start_ns) / 1e6
         # ================================
         
-        # Örneklemeyi durdur
-        sampling_active = False
-        sampler_thread.join(timeout=0.5)
-        
-        # Örnekleri analiz et
-        if len(power_samples) == 0:
-            # Çok kısa çalışma - tek örnek al
-            power_samples.append(self.read_power())
-        
-        # Enerji hesapla (Power × Time)
-        execution_time_s = execution_time_ms / 1000
-        sample_interval_s = self.sampling_interval_ms / 1000
-        
-        # Her örnek için enerji (J = W × s)
-        total_energy = 0
-        cpu_package_energy = 0
-        cpu_cores_energy = 0
-        gpu_energy = 0
+        # Örneklemeyi durdur ve pencereyi son bir örnekle kapat
+        stop.set()
+        sampler_thread.join()
+        try:
+            record()
+        except Exception as e:
+            errors.append(e)
+        if errors:
+            return self._create_error_result(algorithm_name, data_size,
+                                             f"Sensör okuma hatası: {errors[0]}")
         
-        power_values = []
+        # Trapez integrali (W · ns -> J), tam olarak [start, end] penceresinde
+        times = ring.column(_T)
+        power_values = ring.column(_TOTAL)
+        window = (start_ns - origin, end_ns - origin)
         
-        for sample in power_samples:
-            # Her örneğin enerjisi
-            sample_energy = sample.total_power * sample_interval_s
-            total_energy += sample_energy
-            cpu_package_energy += sample.cpu_package * sample_interval_s
-            cpu_cores_energy += sample.cpu_cores * sample_interval_s
-            gpu_energy += sample.gpu_power * sample_interval_s
-            power_values.append(sample.total_power)
+        def energy(values: List[float]) -> float:
+            return integrate_trapezoid(times, values, *window) / 1e9
         
-        # Gerçek çalışma süresine göre normalize et
-        actual_sample_time = len(power_samples) * sample_interval_s
-        if actual_sample_time > 0:
-            scale_factor = execution_time_s / actual_sample_time
-            total_energy *= scale_factor
-            cpu_package_energy *= scale_factor
-            cpu_cores_energy *= scale_factor
-            gpu_energy *= scale_factor
+        total_energy = energy(power_values)
+        cpu_package_energy = energy(ring.column(_PACKAGE))
+        cpu_cores_energy = energy(ring.column(_CORES))
+        gpu_energy = energy(ring.column(_GPU))
         
-        # Güç istatistikleri
-        avg_power = sum(power_values) / len(power_values) if power_values else 0
+        # Güç istatistikleri: ortalama zaman ağırlıklı; en büyük/küçük
+        # pencereyi çevreleyen örnekler dahil tüm örneklerden
+        execution_time_s = execution_time_ms / 1000
+        avg_power = total_energy / execution_time_s if execution_time_s > 0 else (
+            power_values[-1] if power_values else 0)
         max_power = max(power_values) if power_values else 0
         min_power = min(power_values) if power_values else 0
         
@@ -269,7 +424,7 @@ class RealPowerMeter:
             algorithm=algorithm_name,
             data_size=data_size,
             execution_time_ms=execution_time_ms,
-            sample_count=len(power_samples),
+            sample_count=len(ring),
             sampling_interval_ms=self.sampling_interval_ms,
             energy_joules=total_energy,
             cpu_package_energy=cpu_package_energy,
@@ -281,7 +436,8 @@ class RealPowerMeter:
             measurement_source=f"{self._namespace}_WMI",
             is_real_measurement=True,
             timestamp=datetime.now().isoformat(),
-            success=True
+            success=True,
+            dropped_samples=ring.dropped
         )
     
     def _create_error_result(self, algorithm: str, data_size: int, error: str) -> EnergyMeasurement:
@@ -0,0 +1,273 @@
+"""
+Kaynak Kullanımı Muhasebesi
+===========================
+Her ölçümün çevresinde işletim sisteminin tuttuğu sayaçlardan fark alır:
+
+    user_time_ms / system_time_ms    kullanıcı ve çekirdek CPU süresi
+    voluntary_ctx_switches           gönüllü bağlam değişimi (G/Ç, kilit)
+    involuntary_ctx_switches         zorunlu bağlam değişimi (zamanlayıcı)
+    minor_faults / major_faults      küçük ve büyük (diskten) sayfa hataları
+    max_rss_mb                       sürecin tepe yerleşik belleği
+    rss_start_mb / rss_end_mb        pencere başı/sonu yerleşik bellek
+    process_cpu_percent              iş parçacığı CPU süresi / duvar süresi
+                                     (time.thread_time, ns çözünürlük)
+    system_cpu_percent               tüm çekirdeklerin meşgul oranı
+
+CPU kullanımı sabit bekleme (psutil.cpu_percent(interval=...)) olmadan,
+yalnızca ölçülen pencerenin başı ve sonundaki kümülatif CPU süresi
+farklarından hesaplanır. Sistem geneli süreler Linux'ta /proc/stat,
+Windows'ta GetSystemTimes, diğerlerinde psutil.cpu_times ile okunur.
+/proc/stat çözünürlüğü 10 ms olduğundan çok kısa pencerelerde sistem
+oranı None olabilir; `cpu_percent` bu durumda süreç oranına düşer.
+
+Linux'ta `resource.getrusage(RUSAGE_THREAD)` (yoksa RUSAGE_SELF) ve
+`/proc/self/stat` kullanılır; `resource` modülü olmayan Windows'ta psutil
+varsa süreç düzeyindeki değerlerden alınır.
+
+Zamanlayıcı tarafından kesilen (involuntary > 0) veya diskten sayfa
+okuyan (major > 0) çalıştırmalar `disturbed` olarak işaretlenir; bu
+ölçümler gürültülüdür ve ortalamalardan çıkarılabilir.
+
+Kullanım:
+    from resource_usage import ResourceTracker
+
+    tracker = ResourceTracker()
+    with tracker:
+        func(data)
+    print(tracker.result.involuntary_ctx_switches, tracker.result.disturbed)
+"""
+
+import ctypes
+import os
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+    HAS_RESOURCE = True
+    _RUSAGE_WHO = getattr(resource, 'RUSAGE_THREAD', resource.RUSAGE_SELF)
+except ImportError:
+    HAS_RESOURCE = False
+    _RUSAGE_WHO = None
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+_PROC_STAT = '/proc/self/stat'
+HAS_PROC_STAT = os.path.exists(_PROC_STAT)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+CPU_COUNT = os.cpu_count() or 1
+
+# ru_maxrss birimi: Linux'ta KB, macOS'ta bayt
+_MAXRSS_TO_MB = 1 / (1024 * 1024) if sys.platform == 'darwin' else 1 / 1024
+
+if HAS_RESOURCE:
+    SOURCE = 'RUSAGE_THREAD' if _RUSAGE_WHO != resource.RUSAGE_SELF else 'RUSAGE_SELF'
+elif HAS_PSUTIL:
+    SOURCE = 'psutil'
+else:
+    SOURCE = 'unavailable'
+
+
+@dataclass
+class ResourceUsage:
+    """Bir ölçüm penceresindeki kaynak kullanımı farkları"""
+    user_time_ms: Optional[float] = None
+    system_time_ms: Optional[float] = None
+    voluntary_ctx_switches: Optional[int] = None
+    involuntary_ctx_switches: Optional[int] = None
+    minor_faults: Optional[int] = None
+    major_faults: Optional[int] = None
+    max_rss_mb: Optional[float] = None
+    rss_start_mb: Optional[float] = None
+    rss_end_mb: Optional[float] = None
+    wall_time_ms: Optional[float] = None
+    process_cpu_percent: Optional[float] = None
+    system_cpu_percent: Optional[float] = None
+    source: str = SOURCE
+
+    @property
+    def disturbed(self) -> bool:
+        """Çalıştırma zamanlayıcıca kesildi veya diskten sayfa okudu mu"""
+        return bool(self.involuntary_ctx_switches) or bool(self.major_faults)
+
+    @property
+    def cpu_percent(self) -> Optional[float]:
+        """Sistem geneli kullanım; pencere çok kısaysa süreç payı / çekirdek sayısı"""
+        if self.system_cpu_percent is not None:
+            return self.system_cpu_percent
+        if self.process_cpu_percent is not None:
+            return self.process_cpu_percent / CPU_COUNT
+        return None
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), 'disturbed': self.disturbed, 'cpu_percent': self.cpu_percent}
+
+
+# ========================================
+# ANLIK GÖRÜNTÜ
+# ========================================
+
+# (user_s, system_s, nvcsw, nivcsw, minflt, majflt, maxrss_mb, rss_mb,
+#  wall_s, system_busy_s, system_total_s, thread_cpu_s)
+Snapshot = Tuple[Optional[float], ...]
+_EMPTY_SNAPSHOT: Snapshot = (None,) * 12
+
+
+class _FileTime(ctypes.Structure):
+    _fields_ = [('low', ctypes.c_uint32), ('high', ctypes.c_uint32)]
+
+    @property
+    def seconds(self) -> float:
+        # 100 ns birimi
+        return ((self.high << 32) | self.low) / 1e7
+
+
+def _system_cpu_times() -> Tuple[Optional[float], Optional[float]]:
+    """Tüm çekirdeklerin kümülatif (meşgul, toplam) CPU süresi, bekleme yok"""
+    if HAS_PROC_STAT:
+        try:
+            with open('/proc/stat', 'rb') as f:
+                values = [int(v) for v in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None, None
+        # user nice system idle iowait irq softirq steal (guest* user'a dahil)
+        values = values[:8]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        total = sum(values)
+        return (total - idle) / _CLOCK_TICKS, total / _CLOCK_TICKS
+    if sys.platform == 'win32':
+        idle, kernel, user = _FileTime(), _FileTime(), _FileTime()
+        if ctypes.windll.kernel32.GetSystemTimes(
+                ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+            # Çekirdek süresi boşta süreyi de içerir
+            total = kernel.seconds + user.seconds
+            return total - idle.seconds, total
+    if HAS_PSUTIL:
+        times = psutil.cpu_times()
+        idle = times.idle + getattr(times, 'iowait', 0.0)
+        total = sum(times)
+        return total - idle, total
+    return None, None
+
+
+def _proc_rss_mb() -> Optional[float]:
+    """/proc/self/stat alan 24: yerleşik sayfa sayısı"""
+    try:
+        with open(_PROC_STAT, 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # comm alanı boşluk/parantez içerebilir; son ')' sonrasından say
+    fields = stat[stat.rindex(b')') + 2:].split()
+    return int(fields[21]) * _PAGE_SIZE / (1024 * 1024)
+
+
+def _process_snapshot() -> Snapshot:
+    if HAS_RESOURCE:
+        ru = resource.getrusage(_RUSAGE_WHO)
+        rss = _proc_rss_mb() if HAS_PROC_STAT else None
+        return (ru.ru_utime, ru.ru_stime, ru.ru_nvcsw, ru.ru_nivcsw,
+                ru.ru_minflt, ru.ru_majflt, ru.ru_maxrss * _MAXRSS_TO_MB, rss)
+    if HAS_PSUTIL:
+        process = psutil.Process()
+        times = process.cpu_times()
+        switches = process.num_ctx_switches()
+        memory = process.memory_info()
+        # Windows: tüm sayfa hataları tek sayaçta; tepe çalışma kümesi peak_wset
+        faults = getattr(memory, 'num_page_faults', None)
+        peak = getattr(memory, 'peak_wset', None)
+        return (times.user, times.system, switches.voluntary, switches.involuntary,
+                faults, None, peak / (1024 * 1024) if peak else None,
+                memory.rss / (1024 * 1024))
+    return (None,) * 8
+
+
+def take_snapshot() -> Snapshot:
+    """Mevcut kümülatif sayaçları oku (duvar saati pencereye en yakın alınır)"""
+    busy, total = _system_cpu_times()
+    process = _process_snapshot()
+    return process + (time.perf_counter(), busy, total, time.thread_time())
+
+
+def take_end_snapshot() -> Snapshot:
+    """Pencere sonu: take_snapshot ile ters sırada okur (duvar saati önce)"""
+    thread_cpu = time.thread_time()
+    wall = time.perf_counter()
+    process = _process_snapshot()
+    busy, total = _system_cpu_times()
+    return process + (wall, busy, total, thread_cpu)
+
+
+def _diff(after, before):
+    if after is None or before is None:
+        return None
+    return after - before
+
+
+def usage_between(start: Snapshot, end: Snapshot) -> ResourceUsage:
+    """İki anlık görüntü arasındaki farkları hesapla"""
+    user = _diff(end[0], start[0])
+    system = _diff(end[1], start[1])
+    wall = _diff(end[8], start[8])
+    busy = _diff(end[9], start[9])
+    total = _diff(end[10], start[10])
+    thread_cpu = _diff(end[11], start[11])
+    # getrusage süreleri tik örneklemeli olabilir; oran için thread_time kullanılır
+    process_cpu = min(thread_cpu / wall * 100, 100.0) if wall else None
+    return ResourceUsage(
+        user_time_ms=user * 1000 if user is not None else None,
+        system_time_ms=system * 1000 if system is not None else None,
+        voluntary_ctx_switches=_diff(end[2], start[2]),
+        involuntary_ctx_switches=_diff(end[3], start[3]),
+        minor_faults=_diff(end[4], start[4]),
+        major_faults=_diff(end[5], start[5]),
+        max_rss_mb=end[6],
+        rss_start_mb=start[7],
+        rss_end_mb=end[7],
+        wall_time_ms=wall * 1000 if wall is not None else None,
+        process_cpu_percent=process_cpu,
+        system_cpu_percent=busy / total * 100 if total else None
+    )
+
+
+class ResourceTracker:
+    """Bağlam yöneticisi: pencere boyunca kaynak kullanımı farkı"""
+
+    def __init__(self):
+        self.result = ResourceUsage()
+        self._start: Snapshot = _EMPTY_SNAPSHOT
+
+    def __enter__(self) -> 'ResourceTracker':
+        self._start = take_snapshot()
+        return self
+
+    def __exit__(self, *exc):
+        self.result = usage_between(self._start, take_end_snapshot())
+
+
+def select_runs(run_results: List[Dict],
+                discard_disturbed: bool = False) -> Tuple[List[Dict], List[int]]:
+    """
+    Ortalamaya girecek çalıştırmaları seç
+
+    Args:
+        run_results: Runner sonuç listesi ({'run': n, 'energy': {...}})
+        discard_disturbed: Kesintiye uğrayan çalıştırmaları çıkar (hepsi
+                           kesintiliyse hiçbiri çıkarılmaz)
+
+    Returns:
+        (seçilen sonuçlar, kesintiye uğrayan çalıştırma numaraları)
+    """
+    disturbed = [r['run'] for r in run_results
+                 if (r['energy'].get('resource_usage') or {}).get('disturbed')]
+    if discard_disturbed and len(disturbed) < len(run_results):
+        return [r for r in run_results if r['run'] not in disturbed], disturbed
+    return list(run_results), disturbed
@@ -9,53 +9,101 @@ Kullanım:
     python run_benchmark.py --sizes 100,500,1000
     python run_benchmark.py --algorithms bubble_sort,merge_sort
     python run_benchmark.py --runs 5
+    python run_benchmark.py --distributions all --sizes 1000
+    python run_benchmark.py --corpus data/ --corpus-format int32 --sizes 0
+    python run_benchmark.py --graph gnp --sizes 100,200 --density 0.05
+    python run_benchmark.py --perf-counters --algorithms merge_sort,quick_sort
+    python run_benchmark.py --memory rss --algorithms merge_sort,strassen
 """
 
 import sys
 import os
 import json
-import random
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Sequence
 
 # Modül yolunu ekle
 sys.path.insert(0, str(Path(__file__).parent))
 
 from energy_meter import EnergyMeter, get_system_info, EnergyResult
-from algorithms import ALGORITHMS, AlgorithmMetrics
+from algorithms import graph_algorithms, split_algorithm
+from benchmark_runner import BenchmarkRunner, DEFAULT_EXACT_METRICS_LIMIT, describe_algorithm
+from corpus import VIEW_FORMATS, iter_corpus, corpus_prefix_sizes
+from data_generator import (TestDataGenerator, DEFAULT_SEED, DISTRIBUTIONS,
+                            parse_distributions, build_case_matrix)
+from graph_workloads import GRAPH_FAMILIES, get_graph
+from metrics_cache import get_metrics_cache
+from op_counter import count_operations, BACKEND as OP_COUNTER_BACKEND
+from validation import OutputValidator, VALIDATION_MODES, output_digest
+from resource_usage import select_runs
+from memory_probe import MEMORY_METHODS, DEFAULT_MEMORY_METHOD
+from baselines import attach_baseline_ratios, format_baseline_ratio
 
+# Çalıştırmalar üzerinden ortalaması alınan perf sayaçları
+COUNTER_FIELDS = ('cycles', 'instructions', 'cache_misses', 'branch_misses',
+                  'page_faults', 'context_switches', 'task_clock_ms')
 
-class EnergyBenchmark:
+
+def average_counters(runs: List[Dict]) -> Dict:
+    """Çalıştırmaların perf sayaçlarını ortala (desteklenmeyenler None kalır)"""
+    counters = [r['energy'].get('hardware_counters') or {} for r in runs]
+    averages = {}
+    for name in COUNTER_FIELDS:
+        values = [c[name] for c in counters if c.get(name) is not None]
+        averages[name] = sum(values) / len(values) if values else None
+    cycles, instructions = averages['cycles'], averages['instructions']
+    averages['ipc'] = instructions / cycles if cycles and instructions is not None else None
+    averages['mode'] = counters[0].get('mode') if counters else None
+    return averages
+
+
+class EnergyBenchmark(BenchmarkRunner):
     """Enerji benchmark yöneticisi"""
     
-    def __init__(self, output_dir: str = None):
-        self.meter = EnergyMeter()
+    def __init__(self, output_dir: str = None, seed: int = DEFAULT_SEED,
+                 use_metrics_cache: bool = True, count_ops: bool = False,
+                 metrics_sample: float = None, exact_metrics_limit: int = DEFAULT_EXACT_METRICS_LIMIT,
+                 validation: str = 'inline', include_baselines: bool = True,
+                 discard_disturbed: bool = False,
+                 perf_counters: bool = False, memory_method: str = DEFAULT_MEMORY_METHOD):
+        self.meter = EnergyMeter(hardware_counters=perf_counters, memory_method=memory_method)
         self.output_dir = Path(output_dir) if output_dir else Path(__file__).parent / 'results'
         self.output_dir.mkdir(exist_ok=True)
+        self.seed = seed
+        self.data_generator = TestDataGenerator()
+        self.metrics_cache = get_metrics_cache() if use_metrics_cache else None
+        self.count_ops = count_ops
+        self.metrics_sample = metrics_sample
+        self.exact_metrics_limit = exact_metrics_limit
+        self.validator = OutputValidator(validation)
+        self.include_baselines = include_baselines
+        self.discard_disturbed = discard_disturbed
         
         self.results = {
             'meta': {
                 'timestamp': datetime.now().isoformat(),
                 'system_info': get_system_info(),
-                'measurement_method': self.meter.get_best_method()
+                'measurement_method': self.meter.get_best_method(),
+                'seed': seed,
+                'metrics_cache': use_metrics_cache,
+                'op_counter': OP_COUNTER_BACKEND if count_ops else None,
+                'metrics_sample': metrics_sample,
+                'validation': validation,
+                'baselines': include_baselines,
+                'discard_disturbed': discard_disturbed,
+                'memory_method': memory_method,
+                'hardware_counters': self.meter.perf.get_info() if perf_counters else None
             },
             'benchmarks': []
         }
     
-    def generate_test_data(self, size: int) -> List[int]:
-        """Test verisi oluştur"""
+    def generate_test_data(self, size: int, distribution: str = 'random') -> Sequence[int]:
+        """Test verisi oluştur (tohumlu, önbellekten kopyasız görünüm)"""
         # Çoğu algoritma için rastgele tam sayılar yeterli
-        return [random.randint(1, size * 10) for _ in range(size)]
+        return self.data_generator.get(size, distribution, self.seed)
     
-    def find_algorithm(self, name: str) -> Dict:
-        """İsme göre algoritma bilgisini bul"""
-        for cat, algos in ALGORITHMS.items():
-            if name in algos:
-                return algos[name]
-        return None
-
     def run_algorithm_benchmark(self, algorithm_name: str, data: List[int], 
                                runs: int = 3) -> Dict:
         """Genel algoritma benchmark'ı çalıştır"""
@@ -64,69 +112,118 @@ class EnergyBenchmark:
             return {'error': f'Algoritma bulunamadı: {algorithm_name}'}
         
         all_results = []
+        prepare, run_func = split_algorithm(algo_info)
+        
+        # Metrik bilgilerini al (süreye dahil değil)
+        # Not: measure fonksiyonu metrikleri döndürmüyor; sayımlar deterministik
+        # olduğundan bir kez (önbellekten veya örneklemeyle) alınır
+        metrics, sampling = self.collect_metrics(algorithm_name, prepare, run_func, data)
+        
+        # Doğrulama için ölçülen çalıştırmaların çıktısı yakalanır
+        validate = self.validator.supports(algorithm_name)
+        outputs, digests = [], []
+        
+        def capture(func):
+            def captured(*args):
+                result = func(*args)
+                outputs.append(result)
+                return result
+            return captured
         
         for run in range(runs):
-            # Veri kopyası üzerinde çalış
-            data_copy = data.copy()
-            
-            # Algoritmayı wrapper fonksiyon ile çağır
-            def run_algorithm(arr):
-                return algo_info['func'](arr)
+            # Girdinin tek kopyası (gerekiyorsa) ölçüm dışında alınır;
+            # yerinde çalışan algoritmalar bu typed-array kopyasını sıralar.
+            # Değiştirmeyenler mmap/korpus görünümünü doğrudan alır.
+            prepared = prepare(data)
             
             # Enerji ölçümü
             energy_result = self.meter.measure(
                 algorithm_name=algorithm_name,
-                func=run_algorithm,
-                data=data_copy
+                func=capture(run_func) if validate else run_func,
+                data=prepared
             )
             
-            # Metrik bilgilerini al (son çalıştırmadan)
-            # Not: measure fonksiyonu zaten çalıştırdı ama metrikleri döndürmüyor olabilir
-            # Bu yüzden tekrar çalıştırıp metrikleri alıyoruz (süreye dahil değil)
-            _, metrics = algo_info['func'](data.copy())
+            if validate:
+                # Çıktı özeti ölçüm penceresi kapandıktan sonra alınır
+                output = outputs.pop()[0] if outputs else None
+                digests.append(output_digest(algorithm_name, output, data))
+                del output
+            del prepared
             
             result = {
                 'run': run + 1,
                 'energy': energy_result.to_dict(),
-                'metrics': {
-                    'comparisons': metrics.comparisons,
-                    'swaps': metrics.swaps,
-                    'iterations': metrics.iterations,
-                    'memory_accesses': metrics.memory_accesses,
-                    'recursive_calls': metrics.recursive_calls,
-                    'operations': metrics.operations
-                },
-                'algorithm_info': {
-                    'name': algo_info['name'],
-                    'complexity_time': algo_info['complexity_time'],
-                    'complexity_space': algo_info['complexity_space'],
-                    'category': algo_info['category']
-                }
+                'metrics': metrics,
+                'algorithm_info': describe_algorithm(algo_info)
             }
             
             all_results.append(result)
         
-        # Ortalamaları hesapla
-        avg_energy = sum(r['energy']['energy_joules'] for r in all_results) / runs
-        avg_time = sum(r['energy']['execution_time_ms'] for r in all_results) / runs
-        avg_power = sum(r['energy']['power_watts'] for r in all_results) / runs
+        if self.meter.memory.separate:
+            # Bellek ayrı, izlenen bir çalıştırmadan (ölçülen çalıştırmalar izlemesiz)
+            memory_mb = self.meter.measure_memory(run_func, prepare(data))
+            for r in all_results:
+                r['energy']['memory_mb'] = memory_mb
         
-        return {
+        # Ortalamaları hesapla (istenirse kesintiye uğrayan çalıştırmalar hariç)
+        kept, disturbed = select_runs(all_results, self.discard_disturbed)
+        avg_energy = sum(r['energy']['energy_joules'] for r in kept) / len(kept)
+        avg_time = sum(r['energy']['execution_time_ms'] for r in kept) / len(kept)
+        avg_power = sum(r['energy']['power_watts'] for r in kept) / len(kept)
+        avg_memory = sum(r['energy']['memory_mb'] for r in kept) / len(kept)
+        
+        summary = {
             'algorithm': algorithm_name,
             'data_size': len(data),
             'runs': runs,
             'results': all_results,
+            'disturbed_runs': disturbed,
+            'runs_averaged': len(kept),
             'averages': {
                 'energy_joules': avg_energy,
                 'execution_time_ms': avg_time,
-                'power_watts': avg_power
+                'power_watts': avg_power,
+                'memory_mb': avg_memory,
+                'measurement_overhead_ms': sum(
+                    r['energy']['measurement_overhead_ms'] for r in kept) / len(kept)
             }
         }
+        
+        if self.meter.perf is not None and all_results[0]['energy']['hardware_counters']:
+            counters = average_counters(all_results)
+            # Sayım metrikleriyle birleşik oranlar (ör. karşılaştırma başına komut)
+            for name in ('comparisons', 'operations'):
+                if metrics.get(name) and counters['instructions'] is not None:
+                    counters[f'instructions_per_{name[:-1]}'] = counters['instructions'] / metrics[name]
+            summary['hardware_counters'] = counters
+        
+        if sampling is not None:
+            summary['metrics_sampling'] = sampling
+        
+        if validate:
+            summary['output_digests'] = digests
+        
+        if self.count_ops:
+            # Bayt kodu düzeyinde otomatik sayım (ölçüm dışında, ayrı çalıştırma)
+            _, counts = count_operations(run_func, prepare(data))
+            summary['op_counts'] = counts.to_dict()
+        
+        return summary
+    
+    def format_averages(self, result: Dict) -> str:
+        avg = result['averages']
+        return (f"✓ {avg['execution_time_ms']:.2f}ms | "
+                f"{avg['energy_joules']:.6f}J | "
+                f"{avg['power_watts']:.2f}W")
     
     def run_full_benchmark(self, sizes: List[int] = None, 
                            algorithms: List[str] = None,
-                           runs: int = 3) -> Dict:
-        """Tam benchmark çalıştır"""
+                           runs: int = 3,
+                           distributions: List[str] = None) -> Dict:
+        """Tam benchmark çalıştır (boyut x dağılım)"""
+        if distributions is None:
+            distributions = ['random']
+        self.results['meta']['distributions'] = distributions
         if sizes is None:
             sizes = [100, 500, 1000]
         
@@ -136,61 +233,130 @@ class EnergyBenchmark:
         print(f"\n📊 Ölçüm Yöntemi: {self.meter.get_best_method()}")
         print(f"📏 Veri Boyutları: {sizes}")
         print(f"🔄 Çalıştırma Sayısı: {runs}")
+        print(f"🎲 Dağılımlar: {', '.join(distributions)}")
         print()
         
-        # Çalıştırılacak algoritmaları belirle
-        target_algos = []
-        if algorithms:
-            target_algos = algorithms
-        else:
-            # Hepsi
-            for cat in ALGORITHMS.values():
-                target_algos.extend(cat.keys())
+        target_algos = self._target_algorithms(algorithms)
         
         for size in sizes:
-            print(f"\n{'─'*70}")
-            print(f" 📦 Veri Boyutu: {size}")
-            print(f"{'─'*70}")
-            
-            # Test verisi oluştur
-            test_data = self.generate_test_data(size)
-            
-            for algo_name in target_algos:
-                algo_info = self.find_algorithm(algo_name)
-                if not algo_info:
-                    print(f"⚠️ Algoritma bulunamadı: {algo_name}")
-                    continue
-                    
-                print(f"    ⏳ {algo_info['name']}...", end=" ", flush=True)
+            for distribution in distributions:
+                print(f"\n{'─'*70}")
+                print(f" 📦 Veri Boyutu: {size} | Dağılım: {DISTRIBUTIONS[distribution]['name']}")
+                print(f"{'─'*70}")
                 
-                try:
-                    result = self.run_algorithm_benchmark(algo_name, test_data, runs)
+                # Test verisi oluştur
+                test_data = self.generate_test_data(size, distribution)
+                self._benchmark_targets(target_algos, test_data, size, runs,
+                                        extra={'distribution': distribution})
+        
+        if len(distributions) > 1:
+            # Dağılım başına en iyi / ortalama / en kötü durum enerji matrisi
+            self.results['case_matrix'] = build_case_matrix(
+                self.results['benchmarks'] + self.results.get('failures', []),
+                distributions=distributions)
+        
+        return self.results
+    
+    def run_corpus_benchmark(self, corpus_path: str, sizes: List[int] = None,
+                             algorithms: List[str] = None, runs: int = 3,
+                             view_format: str = 'bytes') -> Dict:
+        """
+        Korpus dosyaları üzerinde benchmark çalıştır
+        
+        Her dosya mmap ile açılır ve algoritmalara kopyasız görünüm verilir.
+        Boyutlar dosya başından alınan önek uzunluklarıdır (0 = tüm dosya).
+        """
+        if sizes is None:
+            sizes = [0]
+        
+        self.results['meta']['corpus'] = {
+            'path': str(corpus_path),
+            'view_format': view_format
+        }
+        
+        print("\n" + "="*70)
+        print(" 🔋 ENERJİ BENCHMARK (KORPUS) - BAŞLIYOR")
+        print("="*70)
+        print(f"\n📊 Ölçüm Yöntemi: {self.meter.get_best_method()}")
+        print(f"📂 Korpus: {corpus_path} ({view_format})")
+        print(f"🔄 Çalıştırma Sayısı: {runs}")
+        print()
+        
+        target_algos = self._target_algorithms(algorithms)
+        
+        for corpus_file in iter_corpus(corpus_path):
+            with corpus_file:
+                for size in corpus_prefix_sizes(corpus_file, sizes, view_format):
+                    print(f"\n{'─'*70}")
+                    print(f" 📄 {corpus_file.path.name} | Eleman: {size}")
+                    print(f"{'─'*70}")
                     
-                    if 'error' in result:
-                        print(f"❌ Hata: {result['error']}")
-                        continue
-                        
-                    self.results['benchmarks'].append({
-                        'type': algo_info['category'],
-                        'size': size,
-                        **result
+                    view = corpus_file.view(view_format, limit=size)
+                    self._benchmark_targets(target_algos, view, size, runs, extra={
+                        'corpus_file': str(corpus_file.path),
+                        'corpus_format': view_format
                     })
-                    
-                    avg = result['averages']
-                    print(f"✓ {avg['execution_time_ms']:.2f}ms | "
-                          f"{avg['energy_joules']:.6f}J | "
-                          f"{avg['power_watts']:.2f}W")
-                          
-                except Exception as e:
-                    print(f"❌ Hata: {str(e)}")
+                    view.release()
+        
+        return self.results
+    
+    def run_graph_benchmark(self, family: str, sizes: List[int] = None,
+                            density: float = None, edges: int = None, degree: int = None,
+                            algorithms: List[str] = None, runs: int = 3,
+                            densities: List[float] = None) -> Dict:
+        """
+        Üretilmiş graflar üzerinde graf algoritmalarını çalıştır
+        
+        Boyutlar düğüm sayısıdır (V); kenar sayısı density veya edges ile
+        belirlenir. Graflar CSR olarak önbelleğe yazılır ve mmap ile açılır.
+        """
+        if sizes is None:
+            sizes = [100, 200, 400]
+        
+        self.results['meta']['graph'] = {
+            'family': family,
+            'density': density,
+            'densities': densities,
+            'edges': edges,
+            'degree': degree
+        }
+        
+        print("\n" + "="*70)
+        print(" 🔋 ENERJİ BENCHMARK (GRAF) - BAŞLIYOR")
+        print("="*70)
+        print(f"\n📊 Ölçüm Yöntemi: {self.meter.get_best_method()}")
+        print(f"🕸️ Graf Ailesi: {GRAPH_FAMILIES[family]['name']}")
+        print(f"📏 Düğüm Sayıları: {sizes}")
+        print(f"🔄 Çalıştırma Sayısı: {runs}")
+        print()
+        
+        target_algos = algorithms or graph_algorithms()
+        
+        # Yoğunluk taraması: tüm-çiftler kesişimi (Floyd-Warshall / Johnson)
+        for density_value in densities or [density]:
+            for size in sizes:
+                graph = get_graph(family, size, density=density_value, edges=edges,
+                                  degree=degree, seed=self.seed)
+                print(f"\n{'─'*70}")
+                print(f" 🕸️ V={graph.num_vertices} | E={graph.num_edges} | "
+                      f"Yoğunluk: {graph.density:.4f}")
+                print(f"{'─'*70}")
+                
+                self._benchmark_targets(target_algos, graph, size, runs,
+                                        extra={'graph': graph.describe()})
         
         return self.results
     
     def save_results(self, filename: str = None) -> str:
         """Sonuçları JSON dosyasına kaydet"""
+        self.finish_validation()
+        attach_baseline_ratios(self.results['benchmarks'])
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"energy_benchmark_{timestamp}.json"
+            filename = f"energy_benchmark_{timestamp}{self._distribution_tag()}.json"
+            if 'graph' in self.results['meta']:
+                filename = f"energy_benchmark_{timestamp}_graph_{self.results['meta']['graph']['family']}.json"
         
         filepath = self.output_dir / filename
         
@@ -218,16 +384,74 @@ class EnergyBenchmark:
             f.write(" ALGORİTMA KARŞILAŞTIRMASI (Ortalama Değerler)\n")
             f.write("-"*70 + "\n\n")
             
-            f.write(f"{'Algoritma':<20} {'Boyut':<10} {'Süre(ms)':<15} "
-                    f"{'Enerji(J)':<15} {'Güç(W)':<10}\n")
-            f.write("-"*70 + "\n")
+            f.write(f"{'Algoritma':<20} {'Boyut':<10} {'Dağılım':<15} {'Süre(ms)':<15} "
+                    f"{'Enerji(J)':<15} {'Güç(W)':<10} {'Yerel Oran':<10}\n")
+            f.write("-"*95 + "\n")
             
             for benchmark in self.results['benchmarks']:
                 avg = benchmark['averages']
                 f.write(f"{benchmark['algorithm']:<20} {benchmark['size']:<10} "
+                        f"{benchmark.get('distribution', '-'):<15} "
                         f"{avg['execution_time_ms']:<15.4f} "
                         f"{avg['energy_joules']:<15.9f} "
-                        f"{avg['power_watts']:<10.2f}\n")
+                        f"{avg['power_watts']:<10.2f} "
+                        f"{format_baseline_ratio(benchmark):<10}\n")
+            
+            # En iyi / ortalama / en kötü durum matrisi
+            if self.results.get('case_matrix'):
+                f.write("\n" + "-"*70 + "\n")
+                f.write(" EN İYİ / ORTALAMA / EN KÖTÜ DURUM (Enerji, J)\n")
+                f.write("-"*70 + "\n\n")
+                f.write(f"{'Algoritma':<20} {'Boyut':<10} {'En İyi':<28} "
+                        f"{'Ortalama':<15} {'En Kötü':<28}\n")
+                for algo, sizes in self.results['case_matrix'].items():
+                    for size, cell in sizes.items():
+                        failed = f"  ❌ başarısız: {', '.join(cell['failed'])}" if cell['failed'] else ''
+                        if cell['best'] is None:
+                            f.write(f"{algo:<20} {size:<10} {'-':<28} {'-':<15} {'-':<28}{failed}\n")
+                            continue
+                        best = f"{cell['best']['energy_joules']:.6f} ({cell['best']['distribution']})"
+                        worst = f"{cell['worst']['energy_joules']:.6f} ({cell['worst']['distribution']})"
+                        f.write(f"{algo:<20} {size:<10} {best:<28} "
+                                f"{cell['average']['energy_joules']:<15.6f} {worst:<28}{failed}\n")
+            
+            # Dizgi DP: aynı problemin farklı bellek düzenleri
+            string_rows = [b for b in self.results['benchmarks'] if b.get('type') == 'string']
+            if string_rows:
+                f.write("\n" + "-"*70 + "\n")
+                f.write(" BELLEK / ENERJİ ÖDÜNLEŞİMİ (Dizgi DP, tepe bellek)\n")
+                f.write("-"*70 + "\n\n")
+                f.write(f"{'Algoritma':<22} {'Boyut':<10} {'Alan':<14} {'Bellek(MB)':<14} "
+                        f"{'Enerji(J)':<15} {'Süre(ms)':<12}\n")
+                for benchmark in sorted(string_rows, key=lambda b: (b['size'], b['algorithm'])):
+                    avg = benchmark['averages']
+                    space = benchmark['results'][0]['algorithm_info']['complexity_space']
+                    f.write(f"{benchmark['algorithm']:<22} {benchmark['size']:<10} {space:<14} "
+                            f"{avg['memory_mb']:<14.4f} {avg['energy_joules']:<15.9f} "
+                            f"{avg['execution_time_ms']:<12.4f}\n")
+            
+            # perf sayaçları: sürenin ve enerjinin nedeni
+            counter_rows = [b for b in self.results['benchmarks'] if b.get('hardware_counters')]
+            if counter_rows:
+                mode = counter_rows[0]['hardware_counters']['mode']
+                f.write("\n" + "-"*70 + "\n")
+                f.write(f" DONANIM SAYAÇLARI (perf_event, {mode})\n")
+                f.write("-"*70 + "\n\n")
+                f.write(f"{'Algoritma':<20} {'Boyut':<10} {'Çevrim':<14} {'Komut':<14} "
+                        f"{'IPC':<6} {'LLC Iska':<10} {'Dal Iska':<10} {'Syf Hata':<9} "
+                        f"{'CPU(ms)':<10} {'Komut/Karş.':<12}\n")
+                
+                def cell(value, fmt):
+                    return '-' if value is None else format(value, fmt)
+                
+                for benchmark in counter_rows:
+                    c = benchmark['hardware_counters']
+                    f.write(f"{benchmark['algorithm']:<20} {benchmark['size']:<10} "
+                            f"{cell(c['cycles'], '.0f'):<14} {cell(c['instructions'], '.0f'):<14} "
+                            f"{cell(c['ipc'], '.2f'):<6} {cell(c['cache_misses'], '.0f'):<10} "
+                            f"{cell(c['branch_misses'], '.0f'):<10} {cell(c['page_faults'], '.0f'):<9} "
+                            f"{cell(c['task_clock_ms'], '.3f'):<10} "
+                            f"{cell(c.get('instructions_per_comparison'), '.1f'):<12}\n")
         
         print(f"✅ Özet rapor kaydedildi: {filepath}")
         return str(filepath)
@@ -244,16 +468,78 @@ def main():
                         help='Her test için çalıştırma sayısı')
     parser.add_argument('--output', type=str, default=None,
                         help='Çıktı dizini')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help='Test verisi üretim tohumu')
+    parser.add_argument('--distributions', type=str, default='random',
+                        help=f"Girdi dağılımları (virgülle ayrılmış veya 'all'): "
+                             f"{', '.join(DISTRIBUTIONS)}")
+    parser.add_argument('--corpus', type=str, default=None,
+                        help='Rastgele veri yerine kullanılacak dosya veya dizin (mmap)')
+    parser.add_argument('--corpus-format', type=str, default='bytes',
+                        choices=list(VIEW_FORMATS.keys()),
+                        help='Korpus dosyalarının görünüm formatı')
+    parser.add_argument('--graph', type=str, default=None,
+                        choices=list(GRAPH_FAMILIES.keys()),
+                        help='Graf iş yükü ailesi (boyutlar düğüm sayısı olur)')
+    parser.add_argument('--density', type=str, default=None,
+                        help='gnp için kenar olasılığı p (varsayılan 0.1); virgülle '
+                             'ayrılmış liste verilirse her yoğunluk için ayrı tarama')
+    parser.add_argument('--edges', type=int, default=None,
+                        help='gnp için kesin kenar sayısı (density yerine)')
+    parser.add_argument('--degree', type=int, default=None,
+                        help='scale_free için yeni düğüm başına kenar (m)')
+    parser.add_argument('--no-metrics-cache', action='store_true',
+                        help='Metrik sayımlarını önbellek kullanmadan yeniden hesapla')
+    parser.add_argument('--count-ops', action='store_true',
+                        help='Bayt kodu düzeyinde otomatik işlem sayımı ekle (yavaş)')
+    parser.add_argument('--sample-metrics', type=float, default=None, metavar='ORAN',
+                        help='Metrikleri dış döngü birimlerinin bu oranında say ve genişlet')
+    parser.add_argument('--exact-metrics-limit', type=int, default=DEFAULT_EXACT_METRICS_LIMIT,
+                        help='Örneklemede bu boyuta kadar tam sayım da yapılır (karşılaştırma için)')
+    parser.add_argument('--validate', type=str, default='inline', choices=VALIDATION_MODES,
+                        help='Çıktı doğrulaması: ölçümden sonra aynı süreçte, arka plan '
+                             'sürecinde veya kapalı')
+    parser.add_argument('--perf-counters', action='store_true',
+                        help='Linux perf_event sayaçlarını (cycles, instructions, LLC miss...) '
+                             'ölçülen çağrı çevresinde oku')
+    parser.add_argument('--discard-disturbed', action='store_true',
+                        help='Zorunlu bağlam değişimi veya büyük sayfa hatası görülen '
+                             'çalıştırmaları ortalamalardan çıkar')
+    parser.add_argument('--memory', type=str, default=DEFAULT_MEMORY_METHOD,
+                        choices=list(MEMORY_METHODS.keys()),
+                        help='Bellek ölçümü: ayrı izlenen çalıştırma (tracemalloc), VmHWM '
+                             '(Linux), RSS örnekleme, ölçülen çalıştırma içinde veya kapalı')
+    parser.add_argument('--no-baselines', action='store_true',
+                        help='Yerel referansları (builtin_sorted, numpy_matmul) otomatik ekleme')
     
     args = parser.parse_args()
     
     # Parametreleri parse et
     sizes = [int(s.strip()) for s in args.sizes.split(',')]
     algorithms = [a.strip() for a in args.algorithms.split(',')] if args.algorithms else None
+    densities = [float(d) for d in args.density.split(',')] if args.density else None
     
     # Benchmark'ı çalıştır
-    benchmark = EnergyBenchmark(output_dir=args.output)
-    benchmark.run_full_benchmark(sizes=sizes, algorithms=algorithms, runs=args.runs)
+    benchmark = EnergyBenchmark(output_dir=args.output, seed=args.seed,
+                               use_metrics_cache=not args.no_metrics_cache,
+                               count_ops=args.count_ops,
+                               metrics_sample=args.sample_metrics,
+                               exact_metrics_limit=args.exact_metrics_limit,
+                               validation=args.validate,
+                               include_baselines=not args.no_baselines,
+                               discard_disturbed=args.discard_disturbed,
+                               perf_counters=args.perf_counters,
+                               memory_method=args.memory)
+    if args.graph:
+        benchmark.run_graph_benchmark(args.graph, sizes=sizes, densities=densities,
+                                      edges=args.edges, degree=args.degree,
+                                      algorithms=algorithms, runs=args.runs)
+    elif args.corpus:
+        benchmark.run_corpus_benchmark(args.corpus, sizes=sizes, algorithms=algorithms,
+                                       runs=args.runs, view_format=args.corpus_format)
+    else:
+        benchmark.run_full_benchmark(sizes=sizes, algorithms=algorithms, runs=args.runs,
+                                     distributions=parse_distributions(args.distributions))
     
     # Sonuçları kaydet
     benchmark.save_results()
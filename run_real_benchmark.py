@@ -1,74 +1,123 @@
 """
 GERÇEK ENERJİ BENCHMARK
 =======================
-Intel Power Gadget kullanarak GERÇEK enerji ölçümü yapan benchmark scripti.
+Intel Power Gadget (Windows) veya RAPL powercap (Linux) kullanarak GERÇEK
+enerji ölçümü yapan benchmark scripti.
 
 KULLANIM:
     python run_real_benchmark.py
     python run_real_benchmark.py --sizes 100,500,1000
-    python run_real_benchmark.py --algorithms bubble_sort,quick_sort
+    python run_real_benchmark.py --algorithms merge_sort,quick_sort
+    python run_real_benchmark.py --distributions sorted,random,reversed
+    python run_real_benchmark.py --corpus data/ --corpus-format bytes
+    python run_real_benchmark.py --graph scale_free --sizes 200,400 --degree 3
 """
 
 import sys
 import os
 import json
-import random
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Sequence
 
 # Modül yolunu ekle
 sys.path.insert(0, str(Path(__file__).parent))
 
 from real_energy_meter import RealEnergyMeter, RealEnergyResult, check_system_status
-from algorithms import ALGORITHMS, AlgorithmMetrics
+from algorithms import graph_algorithms, split_algorithm
+from benchmark_runner import BenchmarkRunner, DEFAULT_EXACT_METRICS_LIMIT, describe_algorithm
+from corpus import VIEW_FORMATS, iter_corpus, corpus_prefix_sizes
+from data_generator import (TestDataGenerator, DEFAULT_SEED, DISTRIBUTIONS,
+                            parse_distributions, build_case_matrix)
+from graph_workloads import GRAPH_FAMILIES, get_graph
+from metrics_cache import get_metrics_cache
+from op_counter import count_operations, BACKEND as OP_COUNTER_BACKEND
+from validation import OutputValidator, VALIDATION_MODES, output_digest
+from resource_usage import select_runs
+from memory_probe import MEMORY_METHODS, DEFAULT_MEMORY_METHOD
+from baselines import attach_baseline_ratios, format_baseline_ratio
 
 
-class RealEnergyBenchmark:
+class RealEnergyBenchmark(BenchmarkRunner):
     """Gerçek enerji benchmark yöneticisi"""
     
-    def __init__(self, output_dir: str = None):
-        self.meter = RealEnergyMeter()
+    def __init__(self, output_dir: str = None, seed: int = DEFAULT_SEED,
+                 use_metrics_cache: bool = True, count_ops: bool = False,
+                 metrics_sample: float = None, exact_metrics_limit: int = DEFAULT_EXACT_METRICS_LIMIT,
+                 validation: str = 'inline', include_baselines: bool = True,
+                 discard_disturbed: bool = False,
+                 powercap_root: str = None, memory_method: str = DEFAULT_MEMORY_METHOD,
+                 lhm_url: str = None):
+        self.meter = RealEnergyMeter(powercap_root=powercap_root, memory_method=memory_method,
+                                     lhm_url=lhm_url)
         self.output_dir = Path(output_dir) if output_dir else Path(__file__).parent / 'results'
         self.output_dir.mkdir(exist_ok=True)
+        self.seed = seed
+        self.data_generator = TestDataGenerator()
+        self.metrics_cache = get_metrics_cache() if use_metrics_cache else None
+        self.count_ops = count_ops
+        self.metrics_sample = metrics_sample
+        self.exact_metrics_limit = exact_metrics_limit
+        self.validator = OutputValidator(validation)
+        self.include_baselines = include_baselines
+        self.discard_disturbed = discard_disturbed
         
         self.results = {
             'meta': {
                 'timestamp': datetime.now().isoformat(),
                 'measurement_status': self.meter.get_status(),
                 'is_real_measurement': self.meter.is_available(),
-                'measurement_method': self.meter.get_method()
+                'measurement_method': self.meter.get_method(),
+                'seed': seed,
+                'metrics_cache': use_metrics_cache,
+                'op_counter': OP_COUNTER_BACKEND if count_ops else None,
+                'metrics_sample': metrics_sample,
+                'validation': validation,
+                'baselines': include_baselines,
+                'discard_disturbed': discard_disturbed,
+                'memory_method': memory_method
             },
             'benchmarks': []
         }
     
-    def generate_test_data(self, size: int, data_type: str = 'random') -> List[int]:
-        """Test verisi oluştur"""
-        if data_type == 'random':
-            return [random.randint(1, size * 10) for _ in range(size)]
-        elif data_type == 'sorted':
-            return list(range(size))
-        elif data_type == 'reverse':
-            return list(range(size, 0, -1))
-        else:
-            return [random.randint(1, size * 10) for _ in range(size)]
+    def generate_test_data(self, size: int, data_type: str = 'random') -> Sequence[int]:
+        """Test verisi oluştur (tohumlu, önbellekten kopyasız görünüm)"""
+        return self.data_generator.get(size, data_type, self.seed)
     
-    def run_sorting_benchmark(self, algorithm_name: str, data: List[int], 
-                              runs: int = 3) -> Dict:
-        """Sıralama algoritması benchmark'ı"""
-        algo_info = ALGORITHMS['sorting'].get(algorithm_name)
+    def run_algorithm_benchmark(self, algorithm_name: str, data: Sequence[int], 
+                                runs: int = 3) -> Dict:
+        """Genel algoritma benchmark'ı"""
+        algo_info = self.find_algorithm(algorithm_name)
         if not algo_info:
             return {'error': f'Algoritma bulunamadı: {algorithm_name}'}
         
         all_results = []
+        prepare, run_func = split_algorithm(algo_info)
+        
+        # Metrikleri al (önbellekten, tek ek çalıştırmayla veya örneklemeyle)
+        metrics, sampling = self.collect_metrics(algorithm_name, prepare, run_func, data)
+        
+        # Doğrulama için ölçülen çalıştırmaların çıktısı yakalanır
+        validate = self.validator.supports(algorithm_name)
+        outputs, digests = [], []
+        
+        def capture(func):
+            def captured(*args):
+                result = func(*args)
+                outputs.append(result)
+                return result
+            return captured
         
         for run in range(runs):
-            # Algoritmayı wrapper ile çağır
-            data_copy = data.copy()
+            # Girdi kopyası (yerinde algoritmalar için) ölçüm dışında hazırlanır
+            prepared = prepare(data)
             
             def run_algorithm():
-                return algo_info['func'](data_copy)
+                return run_func(prepared)
+            if validate:
+                run_algorithm = capture(run_algorithm)
             
             # GERÇEK enerji ölçümü
             energy_result = self.meter.measure(
@@ -77,112 +126,91 @@ class RealEnergyBenchmark:
                 data_size=len(data)
             )
             
-            # Metrikleri al
-            _, metrics = algo_info['func'](data.copy())
+            if validate:
+                # Çıktı özeti ölçüm penceresi kapandıktan sonra alınır
+                output = outputs.pop()[0] if outputs else None
+                digests.append(output_digest(algorithm_name, output, data))
+                del output
+            del prepared
             
             result = {
                 'run': run + 1,
                 'energy': energy_result.to_dict(),
-                'metrics': {
-                    'comparisons': metrics.comparisons,
-                    'swaps': metrics.swaps,
-                    'iterations': metrics.iterations,
-                    'memory_accesses': metrics.memory_accesses,
-                    'recursive_calls': metrics.recursive_calls
-                },
-                'algorithm_info': {
-                    'name': algo_info['name'],
-                    'complexity_time': algo_info['complexity_time'],
-                    'complexity_space': algo_info['complexity_space'],
-                    'category': algo_info['category']
-                }
+                'metrics': metrics,
+                'algorithm_info': describe_algorithm(algo_info)
             }
             
             all_results.append(result)
         
-        # Ortalamaları hesapla
-        avg_energy = sum(r['energy']['energy_joules'] for r in all_results) / runs
-        avg_time = sum(r['energy']['execution_time_ms'] for r in all_results) / runs
-        avg_power = sum(r['energy']['avg_power_watts'] for r in all_results) / runs
-        avg_max_power = sum(r['energy']['max_power_watts'] for r in all_results) / runs
+        if self.meter.memory.separate:
+            # Bellek ayrı, izlenen bir çalıştırmadan (ölçülen çalıştırmalar izlemesiz)
+            memory_mb = self.meter.measure_memory(run_func, prepare(data))
+            for r in all_results:
+                r['energy']['memory_mb'] = memory_mb
+        
+        # Ortalamaları hesapla (istenirse kesintiye uğrayan çalıştırmalar hariç)
+        kept, disturbed = select_runs(all_results, self.discard_disturbed)
+        avg_energy = sum(r['energy']['energy_joules'] for r in kept) / len(kept)
+        avg_time = sum(r['energy']['execution_time_ms'] for r in kept) / len(kept)
+        avg_power = sum(r['energy']['avg_power_watts'] for r in kept) / len(kept)
+        avg_max_power = sum(r['energy']['max_power_watts'] for r in kept) / len(kept)
         
-        return {
+        summary = {
             'algorithm': algorithm_name,
             'data_size': len(data),
             'runs': runs,
             'is_real_measurement': all_results[0]['energy']['is_real_measurement'],
             'results': all_results,
+            'disturbed_runs': disturbed,
+            'runs_averaged': len(kept),
             'averages': {
                 'energy_joules': avg_energy,
                 'execution_time_ms': avg_time,
                 'avg_power_watts': avg_power,
-                'max_power_watts': avg_max_power
+                'max_power_watts': avg_max_power,
+                'memory_mb': sum(r['energy']['memory_mb'] for r in kept) / len(kept),
+                'measurement_overhead_ms': sum(
+                    r['energy']['measurement_overhead_ms'] for r in kept) / len(kept)
             }
         }
-    
-    def run_search_benchmark(self, algorithm_name: str, data: List[int],
-                             runs: int = 3) -> Dict:
-        """Arama algoritması benchmark'ı"""
-        algo_info = ALGORITHMS['searching'].get(algorithm_name)
-        if not algo_info:
-            return {'error': f'Algoritma bulunamadı: {algorithm_name}'}
         
-        sorted_data = sorted(data)
-        target = sorted_data[len(sorted_data) // 2]
+        if sampling is not None:
+            summary['metrics_sampling'] = sampling
         
-        all_results = []
-        
-        for run in range(runs):
-            def run_algorithm():
-                return algo_info['func'](sorted_data, target)
-            
-            # GERÇEK enerji ölçümü
-            energy_result = self.meter.measure(
-                run_algorithm,
-                algorithm_name=algorithm_name,
-                data_size=len(data)
-            )
-            
-            _, metrics = algo_info['func'](sorted_data, target)
-            
-            result = {
-                'run': run + 1,
-                'energy': energy_result.to_dict(),
-                'metrics': {
-                    'comparisons': metrics.comparisons,
-                    'iterations': metrics.iterations,
-                    'memory_accesses': metrics.memory_accesses
-                },
-                'algorithm_info': {
-                    'name': algo_info['name'],
-                    'complexity_time': algo_info['complexity_time'],
-                    'complexity_space': algo_info['complexity_space']
-                }
-            }
-            
-            all_results.append(result)
+        if validate:
+            summary['output_digests'] = digests
         
-        avg_energy = sum(r['energy']['energy_joules'] for r in all_results) / runs
-        avg_time = sum(r['energy']['execution_time_ms'] for r in all_results) / runs
-        avg_power = sum(r['energy']['avg_power_watts'] for r in all_results) / runs
+        if self.count_ops:
+            # Otomatik işlem sayımı (ölçüm dışında)
+            _, counts = count_operations(run_func, prepare(data))
+            summary['op_counts'] = counts.to_dict()
         
-        return {
-            'algorithm': algorithm_name,
-            'data_size': len(data),
-            'runs': runs,
-            'is_real_measurement': all_results[0]['energy']['is_real_measurement'],
-            'results': all_results,
-            'averages': {
-                'energy_joules': avg_energy,
-                'execution_time_ms': avg_time,
-                'avg_power_watts': avg_power
-            }
-        }
+        return summary
+    
+    def _print_unavailable_warning(self):
+        print("\n" + "!"*70)
+        print(" ⚠️  UYARI: Intel Power Gadget / RAPL powercap bulunamadı!")
+        print(" ⚠️  Gerçek enerji ölçümü yapılamayacak.")
+        print(" ⚠️  Lütfen Intel Power Gadget'ı kurun:")
+        print("     https://www.intel.com/content/www/us/en/developer/articles/tool/power-gadget.html")
+        print(" ⚠️  Linux'ta energy_uj sayaçlarını okuyabilmek için root olarak çalıştırın.")
+        print("!"*70)
+    
+    def format_averages(self, result: Dict) -> str:
+        avg = result['averages']
+        real = "✅" if result.get('is_real_measurement') else "❌"
+        return (f"{real} {avg['execution_time_ms']:.2f}ms | "
+                f"{avg['energy_joules']:.6f}J | "
+                f"{avg['avg_power_watts']:.2f}W")
     
     def run_full_benchmark(self, sizes: List[int] = None, 
                            algorithms: List[str] = None,
-                           runs: int = 3) -> Dict:
-        """Tam benchmark çalıştır"""
+                           runs: int = 3,
+                           distributions: List[str] = None) -> Dict:
+        """Tam benchmark çalıştır (boyut x dağılım)"""
+        if distributions is None:
+            distributions = ['random']
+        self.results['meta']['distributions'] = distributions
         if sizes is None:
             sizes = [100, 500, 1000, 2000, 5000]
         
@@ -192,80 +220,134 @@ class RealEnergyBenchmark:
         
         # Sistem durumunu kontrol et
         if not self.meter.is_available():
-            print("\n" + "!"*70)
-            print(" ⚠️  UYARI: Intel Power Gadget bulunamadı!")
-            print(" ⚠️  Gerçek enerji ölçümü yapılamayacak.")
-            print(" ⚠️  Lütfen Intel Power Gadget'ı kurun:")
-            print("     https://www.intel.com/content/www/us/en/developer/articles/tool/power-gadget.html")
-            print("!"*70)
+            self._print_unavailable_warning()
             return self.results
         
         print(f"\n✅ Ölçüm Yöntemi: {self.meter.get_method()}")
         print(f"✅ Gerçek Ölçüm: EVET")
         print(f"📏 Veri Boyutları: {sizes}")
         print(f"🔄 Çalıştırma Sayısı: {runs}")
+        print(f"🎲 Dağılımlar: {', '.join(distributions)}")
         print()
         
-        sorting_algos = algorithms or list(ALGORITHMS['sorting'].keys())
-        search_algos = algorithms or list(ALGORITHMS['searching'].keys())
-        
-        if algorithms:
-            sorting_algos = [a for a in algorithms if a in ALGORITHMS['sorting']]
-            search_algos = [a for a in algorithms if a in ALGORITHMS['searching']]
+        target_algos = self._target_algorithms(algorithms)
         
         for size in sizes:
-            print(f"\n{'─'*70}")
-            print(f" 📦 Veri Boyutu: {size}")
-            print(f"{'─'*70}")
-            
-            test_data = self.generate_test_data(size)
-            
-            # Sıralama algoritmaları
-            if sorting_algos:
-                print("\n  🔢 Sıralama Algoritmaları:")
-                for algo_name in sorting_algos:
-                    print(f"    ⏳ {algo_name}...", end=" ", flush=True)
-                    
-                    result = self.run_sorting_benchmark(algo_name, test_data, runs)
-                    self.results['benchmarks'].append({
-                        'type': 'sorting',
-                        'size': size,
-                        **result
-                    })
-                    
-                    avg = result['averages']
-                    real = "✅" if result.get('is_real_measurement') else "❌"
-                    print(f"{real} {avg['execution_time_ms']:.2f}ms | "
-                          f"{avg['energy_joules']:.6f}J | "
-                          f"{avg['avg_power_watts']:.2f}W")
-            
-            # Arama algoritmaları
-            if search_algos:
-                print("\n  🔍 Arama Algoritmaları:")
-                for algo_name in search_algos:
-                    print(f"    ⏳ {algo_name}...", end=" ", flush=True)
+            for distribution in distributions:
+                print(f"\n{'─'*70}")
+                print(f" 📦 Veri Boyutu: {size} | Dağılım: {DISTRIBUTIONS[distribution]['name']}")
+                print(f"{'─'*70}")
+                
+                test_data = self.generate_test_data(size, distribution)
+                self._benchmark_targets(target_algos, test_data, size, runs,
+                                        extra={'distribution': distribution})
+        
+        if len(distributions) > 1:
+            self.results['case_matrix'] = build_case_matrix(
+                self.results['benchmarks'] + self.results.get('failures', []),
+                distributions=distributions)
+        
+        return self.results
+    
+    def run_corpus_benchmark(self, corpus_path: str, sizes: List[int] = None,
+                             algorithms: List[str] = None, runs: int = 3,
+                             view_format: str = 'bytes') -> Dict:
+        """Korpus dosyaları üzerinde benchmark (dosya başına sonuç)"""
+        if sizes is None:
+            sizes = [0]
+        
+        print("\n" + "="*70)
+        print(" 🔋 GERÇEK ENERJİ BENCHMARK (KORPUS) - BAŞLIYOR")
+        print("="*70)
+        
+        if not self.meter.is_available():
+            self._print_unavailable_warning()
+            return self.results
+        
+        self.results['meta']['corpus'] = {
+            'path': str(corpus_path),
+            'view_format': view_format
+        }
+        
+        print(f"\n✅ Ölçüm Yöntemi: {self.meter.get_method()}")
+        print(f"📂 Korpus: {corpus_path} ({view_format})")
+        print(f"🔄 Çalıştırma Sayısı: {runs}")
+        
+        target_algos = self._target_algorithms(algorithms)
+        
+        for corpus_file in iter_corpus(corpus_path):
+            with corpus_file:
+                for size in corpus_prefix_sizes(corpus_file, sizes, view_format):
+                    print(f"\n{'─'*70}")
+                    print(f" 📄 {corpus_file.path.name} | Eleman: {size}")
+                    print(f"{'─'*70}")
                     
-                    result = self.run_search_benchmark(algo_name, test_data, runs)
-                    self.results['benchmarks'].append({
-                        'type': 'searching',
-                        'size': size,
-                        **result
+                    view = corpus_file.view(view_format, limit=size)
+                    self._benchmark_targets(target_algos, view, size, runs, extra={
+                        'corpus_file': str(corpus_file.path),
+                        'corpus_format': view_format
                     })
-                    
-                    avg = result['averages']
-                    real = "✅" if result.get('is_real_measurement') else "❌"
-                    print(f"{real} {avg['execution_time_ms']:.4f}ms | "
-                          f"{avg['energy_joules']:.9f}J | "
-                          f"{avg['avg_power_watts']:.2f}W")
+                    view.release()
+        
+        return self.results
+    
+    def run_graph_benchmark(self, family: str, sizes: List[int] = None,
+                            density: float = None, edges: int = None, degree: int = None,
+                            algorithms: List[str] = None, runs: int = 3,
+                            densities: List[float] = None) -> Dict:
+        """Üretilmiş graflar üzerinde benchmark (boyut = düğüm sayısı)"""
+        if sizes is None:
+            sizes = [100, 200, 400]
+        
+        print("\n" + "="*70)
+        print(" 🔋 GERÇEK ENERJİ BENCHMARK (GRAF) - BAŞLIYOR")
+        print("="*70)
+        
+        if not self.meter.is_available():
+            self._print_unavailable_warning()
+            return self.results
+        
+        self.results['meta']['graph'] = {
+            'family': family,
+            'density': density,
+            'densities': densities,
+            'edges': edges,
+            'degree': degree
+        }
+        
+        print(f"\n✅ Ölçüm Yöntemi: {self.meter.get_method()}")
+        print(f"🕸️ Graf Ailesi: {GRAPH_FAMILIES[family]['name']}")
+        print(f"📏 Düğüm Sayıları: {sizes}")
+        print(f"🔄 Çalıştırma Sayısı: {runs}")
+        
+        target_algos = algorithms or graph_algorithms()
+        
+        # Yoğunluk taraması: tüm-çiftler kesişimi (Floyd-Warshall / Johnson)
+        for density_value in densities or [density]:
+            for size in sizes:
+                graph = get_graph(family, size, density=density_value, edges=edges,
+                                  degree=degree, seed=self.seed)
+                print(f"\n{'─'*70}")
+                print(f" 🕸️ V={graph.num_vertices} | E={graph.num_edges} | "
+                      f"Yoğunluk: {graph.density:.4f}")
+                print(f"{'─'*70}")
+                
+                self._benchmark_targets(target_algos, graph, size, runs,
+                                        extra={'graph': graph.describe()})
         
         return self.results
     
     def save_results(self, filename: str = None) -> str:
         """Sonuçları kaydet"""
+        self.finish_validation()
+        attach_baseline_ratios(self.results['benchmarks'])
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             real_tag = "_REAL" if self.results['meta']['is_real_measurement'] else "_EST"
-            filename = f"energy_benchmark{real_tag}_{timestamp}.json"
+            filename = f"energy_benchmark{real_tag}_{timestamp}{self._distribution_tag()}.json"
+            if 'graph' in self.results['meta']:
+                filename = f"energy_benchmark{real_tag}_{timestamp}_graph_{self.results['meta']['graph']['family']}.json"
         
         filepath = self.output_dir / filename
         
@@ -285,16 +367,18 @@ class RealEnergyBenchmark:
         print(f"\n{'⚡ GERÇEK ÖLÇÜM' if is_real else '📐 TAHMİN'}")
         print()
         
-        print(f"{'Algoritma':<20} {'Boyut':<8} {'Süre(ms)':<12} "
-              f"{'Enerji(J)':<15} {'Güç(W)':<10}")
-        print("-"*70)
+        print(f"{'Algoritma':<20} {'Boyut':<8} {'Dağılım':<15} {'Süre(ms)':<12} "
+              f"{'Enerji(J)':<15} {'Güç(W)':<10} {'Yerel Oran':<10}")
+        print("-"*95)
         
         for benchmark in self.results['benchmarks']:
             avg = benchmark['averages']
             print(f"{benchmark['algorithm']:<20} {benchmark['size']:<8} "
+                  f"{benchmark.get('distribution', '-'):<15} "
                   f"{avg['execution_time_ms']:<12.4f} "
                   f"{avg['energy_joules']:<15.9f} "
-                  f"{avg['avg_power_watts']:<10.2f}")
+                  f"{avg['avg_power_watts']:<10.2f} "
+                  f"{format_baseline_ratio(benchmark):<10}")
 
 
 def main():
@@ -308,6 +392,54 @@ def main():
                         help='Çalıştırma sayısı')
     parser.add_argument('--check', action='store_true',
                         help='Sadece sistem kontrolü yap')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help='Test verisi üretim tohumu')
+    parser.add_argument('--distributions', type=str, default='random',
+                        help=f"Girdi dağılımları (virgülle ayrılmış veya 'all'): "
+                             f"{', '.join(DISTRIBUTIONS)}")
+    parser.add_argument('--corpus', type=str, default=None,
+                        help='Rastgele veri yerine kullanılacak dosya veya dizin (mmap)')
+    parser.add_argument('--corpus-format', type=str, default='bytes',
+                        choices=list(VIEW_FORMATS.keys()),
+                        help='Korpus dosyalarının görünüm formatı')
+    parser.add_argument('--graph', type=str, default=None,
+                        choices=list(GRAPH_FAMILIES.keys()),
+                        help='Graf iş yükü ailesi (boyutlar düğüm sayısı olur)')
+    parser.add_argument('--density', type=str, default=None,
+                        help='gnp için kenar olasılığı p (varsayılan 0.1); virgülle '
+                             'ayrılmış liste verilirse her yoğunluk için ayrı tarama')
+    parser.add_argument('--edges', type=int, default=None,
+                        help='gnp için kesin kenar sayısı (density yerine)')
+    parser.add_argument('--degree', type=int, default=None,
+                        help='scale_free için yeni düğüm başına kenar (m)')
+    parser.add_argument('--no-metrics-cache', action='store_true',
+                        help='Metrik sayımlarını önbellek kullanmadan yeniden hesapla')
+    parser.add_argument('--count-ops', action='store_true',
+                        help='Bayt kodu düzeyinde otomatik işlem sayımı ekle (yavaş)')
+    parser.add_argument('--sample-metrics', type=float, default=None, metavar='ORAN',
+                        help='Metrikleri dış döngü birimlerinin bu oranında say ve genişlet')
+    parser.add_argument('--exact-metrics-limit', type=int, default=DEFAULT_EXACT_METRICS_LIMIT,
+                        help='Örneklemede bu boyuta kadar tam sayım da yapılır (karşılaştırma için)')
+    parser.add_argument('--validate', type=str, default='inline', choices=VALIDATION_MODES,
+                        help='Çıktı doğrulaması: ölçümden sonra aynı süreçte, arka plan '
+                             'sürecinde veya kapalı')
+    parser.add_argument('--powercap-root', type=str, default=None,
+                        help='RAPL powercap sysfs kökü (varsayılan /sys/class/powercap)')
+    parser.add_argument('--lhm-url', type=str, default=None,
+                        help='LibreHardwareMonitor web sunucusu adresi '
+                             '(varsayılan http://localhost:8085/data.json)')
+    parser.add_argument('--memory', type=str, default=DEFAULT_MEMORY_METHOD,
+                        choices=list(MEMORY_METHODS.keys()),
+                        help='Bellek ölçümü: ayrı izlenen çalıştırma (tracemalloc), VmHWM '
+                             '(Linux), RSS örnekleme, ölçülen çalıştırma içinde veya kapalı')
+    parser.add_argument('--discard-disturbed', action='store_true',
+                        help='Zorunlu bağlam değişimi veya büyük sayfa hatası görülen '
+                             'çalıştırmaları ortalamalardan çıkar')
+    parser.add_argument('--no-baselines', action='store_true',
+                        help='Yerel referansları (builtin_sorted, numpy_matmul) otomatik ekleme')
+    parser.add_argument('--no-powerlog-session', action='store_true',
+                        help='Intel Power Gadget: tek oturum yerine her ölçümde ayrı '
+                             'PowerLog süreci başlat')
     
     args = parser.parse_args()
     
@@ -319,11 +451,23 @@ def main():
     # Benchmark çalıştır
     sizes = [int(s.strip()) for s in args.sizes.split(',')]
     algorithms = [a.strip() for a in args.algorithms.split(',')] if args.algorithms else None
+    densities = [float(d) for d in args.density.split(',')] if args.density else None
     
-    benchmark = RealEnergyBenchmark()
+    benchmark = RealEnergyBenchmark(seed=args.seed,
+                                    use_metrics_cache=not args.no_metrics_cache,
+                                    count_ops=args.count_ops,
+                                    metrics_sample=args.sample_metrics,
+                                    exact_metrics_limit=args.exact_metrics_limit,
+                                    validation=args.validate,
+                                    include_baselines=not args.no_baselines,
+                                    discard_disturbed=args.discard_disturbed,
+                                    powercap_root=args.powercap_root,
+                                    memory_method=args.memory,
+                                    lhm_url=args.lhm_url)
     
     if not benchmark.meter.is_available():
-        print("\n❌ HATA: Gerçek enerji ölçümü için Intel Power Gadget gerekli!")
+        print("\n❌ HATA: Gerçek enerji ölçümü için Intel Power Gadget (Windows) veya")
+        print("   okunabilir RAPL powercap sayaçları (Linux, genellikle root) gerekli!")
         print("\n📥 İndirme Linki:")
         print("   https://www.intel.com/content/www/us/en/developer/articles/tool/power-gadget.html")
         print("\n📋 Kurulum Adımları:")
@@ -333,7 +477,19 @@ def main():
         print("   4. Bu scripti tekrar çalıştırın")
         return
     
-    benchmark.run_full_benchmark(sizes=sizes, algorithms=algorithms, runs=args.runs)
+    # Intel Power Gadget: tüm kampanya boyunca tek PowerLog oturumu
+    session = nullcontext() if args.no_powerlog_session else benchmark.meter.session()
+    with session:
+        if args.graph:
+            benchmark.run_graph_benchmark(args.graph, sizes=sizes, densities=densities,
+                                          edges=args.edges, degree=args.degree,
+                                          algorithms=algorithms, runs=args.runs)
+        elif args.corpus:
+            benchmark.run_corpus_benchmark(args.corpus, sizes=sizes, algorithms=algorithms,
+                                           runs=args.runs, view_format=args.corpus_format)
+        else:
+            benchmark.run_full_benchmark(sizes=sizes, algorithms=algorithms, runs=args.runs,
+                                         distributions=parse_distributions(args.distributions))
     benchmark.save_results()
     benchmark.print_summary()
     
@@ -0,0 +1,9 @@
+"""Testler proje kökündeki düz modülleri (real_energy_meter vb.) içe aktarır."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+FIXTURES = ROOT / 'fixtures'
@@ -0,0 +1,98 @@
+"""LibreHardwareMonitorHTTPMeter: yerel data.json taklidine karşı istemci"""
+
+import json
+import socketserver
+import threading
+import time
+
+import pytest
+
+from real_energy_meter import LibreHardwareMonitorHTTPMeter
+
+
+def _sensor(text, value, kind):
+    return {'Text': text, 'Value': value, 'Type': kind, 'Children': []}
+
+
+# LHM sensör ağacı (ondalık virgüllü yerel ayar)
+TREE = {'Text': 'Sensor', 'Children': [{'Text': 'STUB-PC', 'Children': [
+    {'Text': 'Intel Core i7-8700', 'Children': [
+        {'Text': 'Temperatures', 'Children': [
+            _sensor('CPU Core #1', '52,0 °C', 'Temperature'),
+            _sensor('CPU Package', '55,0 °C', 'Temperature')]},
+        {'Text': 'Powers', 'Children': [
+            _sensor('CPU Package', '25,3 W', 'Power'),
+            _sensor('CPU Cores', '18,1 W', 'Power')]}]}]}]}
+
+
+class _LHMStubHandler(socketserver.BaseRequestHandler):
+    """
+    LHM web sunucusu taklidi: HTTP/1.1 keep-alive, yanıt tek yazmada
+
+    Bağlantı ve istek sayılarını, birden fazla recv'e bölünen istekleri
+    (istemci başlıkları tek yazmada göndermediğinde) sunucuya yazar.
+    """
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        buffer, reads = b'', 0
+        while True:
+            chunk = self.request.recv(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            reads += 1
+            while b'\r\n\r\n' in buffer:
+                _, buffer = buffer.split(b'\r\n\r\n', 1)
+                server.requests += 1
+                server.split_requests += reads > 1
+                reads = 0
+                body = json.dumps(TREE).encode()
+                self.request.sendall(
+                    b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                    b'Content-Length: %d\r\n\r\n' % len(body) + body)
+
+
+@pytest.fixture
+def stub_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _LHMStubHandler)
+    server.daemon_threads = True
+    server.connections = server.requests = server.split_requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def meter(stub_server):
+    meter = LibreHardwareMonitorHTTPMeter(
+        f'http://127.0.0.1:{stub_server.server_address[1]}/data.json')
+    yield meter
+    meter.close()
+
+
+def test_reads_power_and_temperature(meter):
+    total, details = meter.get_current_power()
+    assert meter.is_available()
+    assert total == 25.3
+    assert details == {'CPU Package': 25.3, 'CPU Cores': 18.1}
+    assert meter.get_temperature() == 55.0
+
+
+def test_polling_is_single_write_keep_alive_and_fast(meter, stub_server):
+    reads = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 0.5:
+        meter.get_power_data()
+        reads += 1
+    rate_hz = reads / (time.perf_counter() - start)
+
+    # Her istek tek yazmada gelir (Nagle + gecikmeli ACK beklemesi yok)
+    assert stub_server.split_requests == 0
+    # Tüm okumalar tek kalıcı bağlantıdan yapılır
+    assert stub_server.connections == 1
+    assert stub_server.requests >= reads
+    assert rate_hz > 100
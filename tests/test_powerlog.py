@@ -0,0 +1,66 @@
+"""PowerLogStream: kaydedilmiş Intel Power Gadget PowerLog çıktısı"""
+
+import csv
+
+import pytest
+
+from conftest import FIXTURES
+from real_energy_meter import PowerLogStream, parse_power_log
+
+POWER_LOG = FIXTURES / 'powerlog_sample.csv'
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """Akış ayrıştırıcısından bağımsız okunan örnekler ve özet toplamı"""
+    lines = POWER_LOG.read_text().splitlines()
+    rows = list(csv.reader(line for line in lines if line and '=' not in line))
+    header = [h.strip() for h in rows[0]]
+    t_col = header.index('Elapsed Time (sec)')
+    p_col = header.index('Processor Power_0(Watt)')
+    samples = [(float(r[t_col]), float(r[p_col])) for r in rows[1:]]
+    total = next(float(line.split('=')[1]) for line in lines
+                 if line.startswith('Cumulative Processor Energy_0 (Joules)'))
+    return samples, total
+
+
+@pytest.fixture(scope='module')
+def stream():
+    return parse_power_log(str(POWER_LOG))
+
+
+def test_chunked_feed_matches_whole_file(stream):
+    # Yarım satırlar (CRLF dahil) parça sınırlarında doğru birleşmeli
+    data = POWER_LOG.read_bytes()
+    chunked = PowerLogStream()
+    for i in range(0, len(data), 7):
+        chunked.feed(data[i:i + 7])
+    chunked.finish()
+
+    assert chunked.elapsed == stream.elapsed
+    assert chunked.power == stream.power
+    assert chunked.energy == stream.energy
+
+
+def test_summary_footer_is_not_a_sample(stream, reference):
+    samples, _ = reference
+    assert len(stream.elapsed) == len(samples)
+    assert stream.elapsed == [t for t, _ in samples]
+
+
+def test_full_record_energy_matches_footer(stream, reference):
+    samples, total = reference
+    window = stream.window(samples[0][0], samples[-1][0])
+    assert window['energy_joules'] == pytest.approx(total, abs=1e-4)
+
+
+def test_window_energy_is_power_times_time(stream, reference):
+    # Her satırın gücü önceki satırdan bu yana geçen aralığa aittir
+    samples, _ = reference
+    start, end = 0.2, 0.6
+    expected = sum(p * (min(t, end) - max(t0, start))
+                   for (t0, _), (t, p) in zip(samples, samples[1:])
+                   if min(t, end) > max(t0, start))
+    window = stream.window(start, end)
+    assert window['energy_joules'] == pytest.approx(expected, abs=1e-4)
+    assert window['avg_power'] == pytest.approx(expected / (end - start), abs=1e-3)
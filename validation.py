@@ -0,0 +1,559 @@
+"""
+Doğruluk Kâhini (Oracle)
+========================
+Ölçülen algoritma çıktılarını, ölçüm penceresi kapandıktan sonra bağımsız
+bir referans uygulamayla karşılaştırır:
+
+    merge_sort, quick_sort   sorted() (yerel referanslar dahil)
+    dijkstra                 bağımsız heap Dijkstra
+    bellman_ford             kuyruk tabanlı Bellman-Ford (SPFA)
+    floyd_warshall, johnson* her kaynaktan Dijkstra
+    prim                     Kruskal (birleşim-bul), 0 düğümünün bileşeni
+    knapsack                 iki dizili tablo DP
+    strassen, numpy_matmul   klasik O(n³) çarpım
+    huffman                  optimal kod uzunluğu toplamı
+    lcs_*                    bit-paralel LCS uzunluğu (Allison-Dix); dizgi
+                             çıktılarında ayrıca ortak alt dizi kontrolü
+    edit_distance*           tam sayı satırlı Levenshtein (büyük girdide atlanır)
+    bigint_*                 basamaklardan kurulan Python int çarpımı
+    convolution_*            Kronecker yerleştirmesiyle tam sayı çarpımı
+    lis_*                    ikili aramalı LIS uzunluğu; çıktının girdinin kesin
+                             artan alt dizisi olduğu da kontrol edilir
+
+Çıktılar kanonik biçime çevrilip BLAKE2b özetiyle karşılaştırılır; büyük
+sonuçlar süreçler arasında taşınmaz. Referans hesabı ya ölçümden hemen
+sonra aynı süreçte ('inline') ya da ayrı bir süreçte ('background')
+yapılır. Her iki durumda da ölçülen süreye bir şey eklenmez.
+
+Kullanım:
+    validator = OutputValidator(mode='inline')
+    validator.submit(entry, 'merge_sort', data, [output_digest('merge_sort', out, data)])
+    validator.finish()     # entry['valid'] = True / False / None
+"""
+
+import hashlib
+import heapq
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from graph_workloads import CSRGraph
+
+
+VALIDATION_MODES = ('off', 'inline', 'background')
+
+INF_MATRIX = 999999  # floyd_warshall'ın "yol yok" değeri
+STRING_ALPHABET = b'ACGT'  # algorithms.prepare_strings ile aynı
+EDIT_REFERENCE_CELL_LIMIT = 25_000_000  # O(n*m) referansın üst sınırı
+
+
+# ========================================
+# GİRDİ YORUMLAMA
+# ========================================
+# Düz listeden graf/matris kurulumu algoritmanın sözleşmesinin parçasıdır;
+# referanslar aynı yorumu kullanır, hesaplamayı ise bağımsız yapar.
+
+def _csr_edges(graph: CSRGraph) -> Tuple[int, List[Tuple[int, int, int]]]:
+    return graph.num_vertices, list(graph.iter_edges())
+
+
+def _dijkstra_edges(data) -> Tuple[int, List[Tuple[int, int, int]]]:
+    if isinstance(data, CSRGraph):
+        return _csr_edges(data)
+    V = max(2, int((len(data) / 2) ** 0.5))
+    edges = []
+    for i in range(0, len(data) - 2, 3):
+        u, v, w = abs(data[i]) % V, abs(data[i + 1]) % V, abs(data[i + 2]) % 100 + 1
+        edges.append((u, v, w))
+        edges.append((v, u, w))
+    return V, edges
+
+
+def _bellman_edges(data) -> Tuple[int, List[Tuple[int, int, int]]]:
+    if isinstance(data, CSRGraph):
+        return _csr_edges(data)
+    V = max(2, int((len(data) / 2) ** 0.5))
+    edges = [(abs(data[i]) % V, abs(data[i + 1]) % V, data[i + 2] % 100)
+             for i in range(0, len(data) - 2, 3)]
+    if not edges:
+        edges = [(i, (i + 1) % V, 1) for i in range(V)]
+    return V, edges
+
+
+def _floyd_edges(data) -> Tuple[int, List[Tuple[int, int, int]]]:
+    if isinstance(data, CSRGraph):
+        return _csr_edges(data)
+    V = max(2, int(len(data) ** 0.5))
+    edges = []
+    idx = 0
+    for i in range(V):
+        for j in range(V):
+            if i != j and idx < len(data):
+                edges.append((i, j, abs(data[idx]) % 100 + 1))
+                idx += 1
+    return V, edges
+
+
+def _prim_edges(data) -> Tuple[int, List[Tuple[int, int, int]]]:
+    if isinstance(data, CSRGraph):
+        return _csr_edges(data)
+    V = max(2, int((len(data) / 2) ** 0.5))
+    edges = []
+    idx = 0
+    for i in range(V):
+        for j in range(i + 1, V):
+            if idx < len(data):
+                edges.append((i, j, abs(data[idx]) % 100 + 1))
+                idx += 1
+    return V, edges
+
+
+def _string_pair(data) -> Tuple[bytes, bytes]:
+    k = len(STRING_ALPHABET)
+    half = len(data) // 2
+    a = bytes(STRING_ALPHABET[abs(x) % k] for x in data[:half])
+    b = bytes(STRING_ALPHABET[abs(x) % k] for x in data[half:])
+    return a, b
+
+
+def _adjacency(V: int, edges) -> List[List[Tuple[int, int]]]:
+    adj = [[] for _ in range(V)]
+    for u, v, w in edges:
+        adj[u].append((v, w))
+    return adj
+
+
+def _heap_dijkstra(adj, source: int) -> List[float]:
+    dist = [float('inf')] * len(adj)
+    dist[source] = 0
+    done = [False] * len(adj)
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        for v, w in adj[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+
+# ========================================
+# REFERANSLAR
+# ========================================
+
+def _ref_sorted(data):
+    return sorted(data)
+
+
+def _ref_dijkstra(data):
+    V, edges = _dijkstra_edges(data)
+    return _heap_dijkstra(_adjacency(V, edges), 0)
+
+
+def _ref_bellman_ford(data):
+    V, edges = _bellman_edges(data)
+    adj = _adjacency(V, edges)
+    dist = [float('inf')] * V
+    dist[0] = 0
+    queue, in_queue, relax_count = deque([0]), [False] * V, [0] * V
+    in_queue[0] = True
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        for v, w in adj[u]:
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                relax_count[v] += 1
+                if relax_count[v] >= V:
+                    # Negatif döngü: V-1 turluk sonuç tanımsız, doğrulama yapılmaz
+                    return None
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
+    return dist
+
+
+def _ref_floyd_warshall(data):
+    V, edges = _floyd_edges(data)
+    adj = _adjacency(V, edges)
+    matrix = []
+    for source in range(V):
+        dist = _heap_dijkstra(adj, source)
+        matrix.append([INF_MATRIX if d == float('inf') else d for d in dist])
+    return matrix
+
+
+def _ref_prim(data):
+    V, edges = _prim_edges(data)
+    parent = list(range(V))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    forest = []
+    for u, v, w in sorted(edges, key=lambda e: e[2]):
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            parent[ru] = rv
+            forest.append((u, w))
+    root = find(0)
+    return sum(w for u, w in forest if find(u) == root)
+
+
+def _ref_knapsack(data):
+    n = len(data) // 2
+    if n == 0:
+        return 0
+    values, weights = list(data[:n]), list(data[n:2 * n])
+    if any(w < 0 for w in weights):
+        # Negatif ağırlıkta algoritmanın davranışı tanımsız
+        return None
+    capacity = 1000
+    K = [0] * (capacity + 1)
+    for value, weight in zip(values, weights):
+        K = [max(K[w], K[w - weight] + value) if w >= weight else K[w]
+             for w in range(capacity + 1)]
+    return K[capacity]
+
+
+def _ref_strassen(data):
+    n = len(data)
+    size = max(2, int((n // 2) ** 0.5))
+    rows_a = [list(data[i * size:(i + 1) * size]) for i in range(size)]
+    rows_b = [list(data[n // 2 + i * size:n // 2 + (i + 1) * size]) for i in range(size)]
+    new_size = 1 if size == 0 else 2 ** (size - 1).bit_length()
+
+    def pad(M):
+        padded = [[0] * new_size for _ in range(new_size)]
+        for i in range(len(M)):
+            for j in range(len(M[0])):
+                padded[i][j] = M[i][j]
+        return padded
+
+    A, B = pad(rows_a), pad(rows_b)
+    columns = list(zip(*B))
+    return [[sum(a * b for a, b in zip(row, col)) for col in columns] for row in A]
+
+
+def _ref_matmul(data):
+    # numpy_matmul: strassen ile aynı matrisler, dolgusuz
+    n = len(data)
+    size = max(2, int((n // 2) ** 0.5))
+    flat_a = list(data[:size * size])
+    flat_b = list(data[n // 2:n // 2 + size * size])
+    flat_a += [0] * (size * size - len(flat_a))
+    flat_b += [0] * (size * size - len(flat_b))
+    A = [flat_a[i * size:(i + 1) * size] for i in range(size)]
+    columns = [flat_b[j::size] for j in range(size)]
+    return [[sum(a * b for a, b in zip(row, col)) for col in columns] for row in A]
+
+
+def _ref_lcs_length(data):
+    # Allison-Dix bit-paralel LCS: V'deki 0 bitleri eşleşen konumlar
+    a, b = _string_pair(data)
+    mask = (1 << len(a)) - 1
+    match = {}
+    for i, c in enumerate(a):
+        match[c] = match.get(c, 0) | (1 << i)
+    V = mask
+    for c in b:
+        U = V & match.get(c, 0)
+        V = ((V + U) | (V - U)) & mask
+    return len(a) - bin(V).count('1')
+
+
+def _ref_edit_distance(data):
+    a, b = _string_pair(data)
+    if len(a) * len(b) > EDIT_REFERENCE_CELL_LIMIT:
+        return None
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        diagonal, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            diagonal, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1,
+                                           diagonal + (ca != cb))
+    return row[-1]
+
+
+def _ref_lis_length(data):
+    tails = []
+    for x in data:
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(x)
+        else:
+            tails[lo] = x
+    return len(tails)
+
+
+def _digits_value(digits) -> int:
+    # Küçükten büyüğe ondalık basamaklar; str() dönüşüm sınırına takılmamak
+    # için böl ve yönet
+    if len(digits) <= 256:
+        value = 0
+        for d in reversed(digits):
+            value = value * 10 + d
+        return value
+    mid = len(digits) // 2
+    return _digits_value(digits[:mid]) + _digits_value(digits[mid:]) * 10 ** mid
+
+
+def _ref_bigint(data):
+    half = len(data) // 2
+    a = _digits_value([abs(x) % 10 for x in data[:half]])
+    b = _digits_value([abs(x) % 10 for x in data[half:]])
+    return a * b
+
+
+def _ref_convolution(data):
+    # Sinyaller tek bir büyük tam sayıya sabit genişlikli yuvalarla
+    # yerleştirilir; çarpımın yuvaları konvolüsyon katsayılarıdır.
+    half = len(data) // 2
+    a = [abs(x) % 100 for x in data[:half]]
+    b = [abs(x) % 100 for x in data[half:]]
+    if not a or not b:
+        return []
+    width = (99 * 99 * min(len(a), len(b))).bit_length() // 4 + 1  # onaltılık hane
+
+    def pack(values):
+        return int(''.join(format(v, f'0{width}x') for v in reversed(values)), 16)
+
+    length = len(a) + len(b) - 1
+    product = format(pack(a) * pack(b), 'x').zfill(length * width)
+    # En düşük yuva dizginin sonundadır
+    return [int(product[i - width:i], 16) for i in range(length * width, 0, -width)]
+
+
+def _huffman_freq(data) -> Dict[str, int]:
+    freq = {}
+    for num in data:
+        char = str(num % 26)
+        freq[char] = freq.get(char, 0) + 1
+    return freq
+
+
+def _ref_huffman(data):
+    # Optimal toplam kod uzunluğu = birleştirme ağırlıklarının toplamı
+    heap = list(_huffman_freq(data).values())
+    heapq.heapify(heap)
+    cost = 0
+    while len(heap) > 1:
+        merged = heapq.heappop(heap) + heapq.heappop(heap)
+        cost += merged
+        heapq.heappush(heap, merged)
+    return cost
+
+
+# ========================================
+# KANONİK BİÇİM
+# ========================================
+
+def _norm_sequence(output, data) -> bytes:
+    try:
+        view = memoryview(output)
+    except TypeError:
+        return array('q', output).tobytes()
+    if view.itemsize == 8 and view.format.lstrip('@=') in ('q', 'l'):
+        # array('q') ve int64 NumPy dizileri kopyasız
+        return view.cast('B').tobytes() if view.c_contiguous else view.tobytes()
+    return array('q', view.tolist()).tobytes()
+
+
+def _norm_repr(output, data) -> bytes:
+    return repr(output).encode()
+
+
+def _norm_distances(output, data) -> bytes:
+    return repr([d if d != float('inf') else 'inf' for d in output]).encode()
+
+
+def _norm_matrix(output, data) -> bytes:
+    return repr([[int(x) for x in row] for row in output]).encode()
+
+
+def _norm_huffman(output, data) -> bytes:
+    if not isinstance(output, list) or not output:
+        return repr(0).encode()
+    freq = _huffman_freq(data)
+    return repr(sum(freq[sym] * len(code) for sym, code in output[1:])).encode()
+
+
+def _norm_lcs(output, data) -> bytes:
+    # Ortak alt dizi değilse uzunluk -1 yazılır (referansla eşleşmez)
+    a, b = _string_pair(data)
+    output = bytes(output)
+
+    def is_subsequence(text):
+        it = iter(text)
+        return all(c in it for c in output)
+
+    return repr(len(output) if is_subsequence(a) and is_subsequence(b) else -1).encode()
+
+
+def _norm_lis(output, data) -> bytes:
+    # Kesin artan ve girdinin alt dizisi değilse uzunluk -1 yazılır
+    output = [int(x) for x in output]
+    it = iter(data)
+    valid = (all(a < b for a, b in zip(output, output[1:]))
+             and all(x in it for x in output))
+    return repr(len(output) if valid else -1).encode()
+
+
+def _norm_bigint(output, data) -> bytes:
+    # Limb dizisi (10⁴ tabanı, küçükten büyüğe) veya doğrudan int
+    if not isinstance(output, int):
+        output = _digits_value([(limb // 10 ** k) % 10 for limb in output for k in range(4)])
+    return output.to_bytes((output.bit_length() + 7) // 8 or 1, 'little')
+
+
+# algoritma -> (referans, çıktı kanonikleştirici, referans kanonikleştirici)
+ORACLES: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    'merge_sort': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'quick_sort': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'dijkstra': (_ref_dijkstra, _norm_distances, _norm_distances),
+    'bellman_ford': (_ref_bellman_ford, _norm_distances, _norm_distances),
+    'floyd_warshall': (_ref_floyd_warshall, _norm_matrix, _norm_matrix),
+    'johnson': (_ref_floyd_warshall, _norm_matrix, _norm_matrix),
+    'johnson_parallel': (_ref_floyd_warshall, _norm_matrix, _norm_matrix),
+    'prim': (_ref_prim, _norm_repr, _norm_repr),
+    'knapsack': (_ref_knapsack, _norm_repr, _norm_repr),
+    'strassen': (_ref_strassen, _norm_matrix, _norm_matrix),
+    'huffman': (_ref_huffman, _norm_huffman, _norm_repr),
+    'builtin_sorted': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'numpy_sort_quick': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'numpy_sort_merge': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'numpy_sort_stable': (_ref_sorted, _norm_sequence, _norm_sequence),
+    'numpy_matmul': (_ref_matmul, _norm_matrix, _norm_matrix),
+    'lcs_full': (_ref_lcs_length, _norm_lcs, _norm_repr),
+    'lcs_rolling': (_ref_lcs_length, _norm_repr, _norm_repr),
+    'lcs_hirschberg': (_ref_lcs_length, _norm_lcs, _norm_repr),
+    'edit_distance': (_ref_edit_distance, _norm_repr, _norm_repr),
+    'edit_distance_myers': (_ref_edit_distance, _norm_repr, _norm_repr),
+    'bigint_schoolbook': (_ref_bigint, _norm_bigint, _norm_bigint),
+    'bigint_karatsuba': (_ref_bigint, _norm_bigint, _norm_bigint),
+    'bigint_toom3': (_ref_bigint, _norm_bigint, _norm_bigint),
+    'bigint_native': (_ref_bigint, _norm_bigint, _norm_bigint),
+    'convolution_naive': (_ref_convolution, _norm_sequence, _norm_sequence),
+    'convolution_fft': (_ref_convolution, _norm_sequence, _norm_sequence),
+    'convolution_numpy': (_ref_convolution, _norm_sequence, _norm_sequence),
+    'lis_quadratic': (_ref_lis_length, _norm_lis, _norm_repr),
+    'lis_patience': (_ref_lis_length, _norm_lis, _norm_repr),
+    'lis_quadratic_numpy': (_ref_lis_length, _norm_lis, _norm_repr),
+}
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def output_digest(algorithm: str, output: Any, data: Any) -> Optional[str]:
+    """Algoritma çıktısının kanonik özeti (kâhini olmayan algoritma: None)"""
+    if algorithm not in ORACLES:
+        return None
+    return _digest(ORACLES[algorithm][1](output, data))
+
+
+def reference_digest(algorithm: str, data: Any) -> Optional[str]:
+    """Referans çıktının özeti (referans tanımsızsa None)"""
+    reference, _, normalize = ORACLES[algorithm]
+    expected = reference(data)
+    if expected is None:
+        return None
+    return _digest(normalize(expected, data))
+
+
+def _portable(data: Any) -> Any:
+    """Başka sürece gönderilebilir kopya (memoryview/mmap serileştirilemez)"""
+    if isinstance(data, CSRGraph):
+        return CSRGraph(data.num_vertices, _portable(data.indptr), _portable(data.indices),
+                        _portable(data.weights), family=data.family, params=dict(data.params))
+    if isinstance(data, memoryview):
+        code = data.format.lstrip('@=')
+        code = 'q' if code == 'l' and data.itemsize == 8 else code
+        return array(code, data.tobytes())
+    return data
+
+
+# ========================================
+# DOĞRULAYICI
+# ========================================
+
+class OutputValidator:
+    """Ölçüm sonrası çıktı doğrulaması ve sonuçlara 'valid' bayrağı yazımı"""
+
+    def __init__(self, mode: str = 'inline'):
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Bilinmeyen doğrulama modu: {mode}")
+        self.mode = mode
+        self._executor = None
+        self._pending: List[Tuple[Dict, List[Optional[str]], Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    def supports(self, algorithm: str) -> bool:
+        return self.enabled and algorithm in ORACLES
+
+    def submit(self, entry: Dict, algorithm: str, data: Any, digests: Sequence[Optional[str]]):
+        """
+        Bir benchmark kaydını doğrulamaya gönder
+
+        Args:
+            entry: Sonuç kaydı ('valid' ve 'validation' alanları buraya yazılır)
+            algorithm: Algoritma anahtarı
+            data: Algoritmaya verilen (değiştirilmemiş) girdi
+            digests: Ölçülen her çalıştırmanın çıktı özeti
+        """
+        if not self.supports(algorithm):
+            return
+        if self.mode == 'background':
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=1)
+            expected = self._executor.submit(reference_digest, algorithm, _portable(data))
+        else:
+            expected = Future()
+            try:
+                expected.set_result(reference_digest(algorithm, data))
+            except Exception as e:
+                expected.set_exception(e)
+        self._pending.append((entry, list(digests), expected))
+
+    def finish(self, timeout: Optional[float] = None):
+        """Bekleyen doğrulamaları tamamla ve kayıtlara yaz"""
+        for entry, digests, expected in self._pending:
+            try:
+                reference = expected.result(timeout=timeout)
+            except Exception as e:
+                entry['valid'] = None
+                entry['validation'] = {'error': str(e)}
+                continue
+            if reference is None:
+                entry['valid'] = None
+                entry['validation'] = {'skipped': 'referans tanımsız'}
+                continue
+            mismatched = [i + 1 for i, d in enumerate(digests) if d != reference]
+            entry['valid'] = not mismatched
+            entry['validation'] = {
+                'reference_digest': reference,
+                'checked_runs': len(digests),
+                'mismatched_runs': mismatched
+            }
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None